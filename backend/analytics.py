@@ -14,27 +14,47 @@ from backend.scoring import (
     aggregate_stats_from_events,
     compute_fantasy_score,
 )
+from backend.simulation.persistence import events_from_blob
 
 
-def _event_server(e: Any) -> str:
-    return e.get("server_id", "") if hasattr(e, "get") and callable(getattr(e, "get", None)) else getattr(e, "server_id", "")
-
-
-def _event_winner(e: Any) -> str:
-    o = e.get("outcome", {}) if hasattr(e, "get") and callable(getattr(e, "get", None)) else getattr(e, "outcome", None)
-    if hasattr(o, "winner_id"):
-        return o.winner_id
-    return (o or {}).get("winner_id", "")
+def _event_columns(events: list[Any]) -> tuple[list[str], list[str], list[int]]:
+    """
+    Split events into parallel (server_ids, winner_ids, rally_lengths) columns in one pass.
+    Events are either all dicts (persisted JSON) or all PointEvent objects, so the shape
+    is checked once rather than per field.
+    """
+    if not events:
+        return [], [], []
+    if isinstance(events[0], dict):
+        servers = [e.get("server_id", "") for e in events]
+        winners = [(e.get("outcome") or {}).get("winner_id", "") for e in events]
+        rallies = [e.get("rally_length", 0) for e in events]
+    else:
+        servers = [getattr(e, "server_id", "") for e in events]
+        winners = [e.outcome.winner_id for e in events]
+        rallies = [getattr(e, "rally_length", 0) for e in events]
+    return servers, winners, rallies
 
 
-def _event_rally_length(e: Any) -> int:
-    if hasattr(e, "get") and callable(getattr(e, "get", None)):
-        return e.get("rally_length", 0)
-    return getattr(e, "rally_length", 0)
+def load_match_events(match: Match) -> list[Any]:
+    """
+    Events for analytics/scoring: unpacked from events_blob when present (only the
+    needed columns), else parsed from events_json for matches stored before the blob.
+    """
+    if match.events_blob:
+        return events_from_blob(
+            match.events_blob, match.player_a_id, match.player_b_id, (match.sets_a, match.sets_b)
+        )
+    if match.events_json:
+        return json.loads(match.events_json)
+    return []
 
 
 def _compute_rally_and_serve_stats(
-    events: list[Any], player_a_id: str, player_b_id: str
+    events: list[Any],
+    player_a_id: str,
+    player_b_id: str,
+    columns: tuple[list[str], list[str], list[int]] | None = None,
 ) -> dict[str, Any]:
     """Derive rally and serve stats from events. No I/O."""
     total_points = len(events)
@@ -46,15 +66,13 @@ def _compute_rally_and_serve_stats(
             "serve_win_pct_b": None,
             "estimated_duration_seconds": 0,
         }
-    rally_lengths = [_event_rally_length(e) for e in events]
+    servers, winners, rally_lengths = columns if columns is not None else _event_columns(events)
     longest_rally = max(rally_lengths)
     avg_rally_length = round(sum(rally_lengths) / total_points, 1)
     # Serve: points won when serving
     serve_points_a = serve_won_a = 0
     serve_points_b = serve_won_b = 0
-    for e in events:
-        server = _event_server(e)
-        winner = _event_winner(e)
+    for server, winner in zip(servers, winners):
         if server == player_a_id:
             serve_points_a += 1
             if winner == player_a_id:
@@ -96,13 +114,6 @@ def _stats_to_dict(stats: Any) -> dict[str, Any]:
     }
 
 
-def _event_shot_type(e: Any) -> str:
-    o = e.get("outcome", {}) if hasattr(e, "get") and callable(getattr(e, "get", None)) else getattr(e, "outcome", None)
-    if hasattr(o, "shot_type"):
-        return (o.shot_type or "").lower()
-    return ((o or {}).get("shot_type") or "").lower()
-
-
 def compute_slot_tt_momentum_and_stats(
     events: list[Any], player_a_id: str, player_b_id: str, winner_id: str
 ) -> dict[str, Any]:
@@ -113,8 +124,8 @@ def compute_slot_tt_momentum_and_stats(
     momentum_series: list[dict[str, Any]] = []
     cumul_a, cumul_b = 0, 0
     SECONDS_PER_POINT = 25
-    for i, ev in enumerate(events):
-        w = _event_winner(ev)
+    columns = _event_columns(events)
+    for i, w in enumerate(columns[1]):
         if w == player_a_id:
             cumul_a += 1
         elif w == player_b_id:
@@ -126,7 +137,7 @@ def compute_slot_tt_momentum_and_stats(
             "cumul_tt_a": cumul_a,
             "cumul_tt_b": cumul_b,
         })
-    rally_serve = _compute_rally_and_serve_stats(events, player_a_id, player_b_id)
+    rally_serve = _compute_rally_and_serve_stats(events, player_a_id, player_b_id, columns)
     stats_a, stats_b = aggregate_stats_from_events(
         events, winner_id=winner_id,
         player_a_id=player_a_id, player_b_id=player_b_id,
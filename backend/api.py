@@ -6,19 +6,20 @@ from __future__ import annotations
 
 import asyncio
 import json
+import logging
+import logging.handlers
+import queue
+import sqlite3
 from contextlib import asynccontextmanager, contextmanager
 from pathlib import Path
 from typing import Any, AsyncGenerator, Generator
 
 from fastapi import Depends, FastAPI, HTTPException, Query, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, Response
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from pydantic import BaseModel, Field
 
-# Ensure project root on path
-import sys
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-
 from backend.auth import create_access_token, decode_token, hash_password, verify_password
 
 _MAX_PASSWORD_BYTES = 72
@@ -32,8 +33,11 @@ def _truncate_password(s: str) -> str:
     return b[:_MAX_PASSWORD_BYTES].decode("utf-8", errors="replace")
 from backend.rankings_db import list_players_by_gender, get_player
 from backend.persistence import (
-    get_connection,
+    close_shared,
+    get_ro_connection,
+    get_shared_connection,
     init_db,
+    write_transaction,
     UserRepository,
     TeamRepository,
     MatchRepository,
@@ -44,12 +48,12 @@ from backend.persistence import (
     WeekRepository,
     LeagueMatchRepository,
 )
-from backend.persistence.repositories import _has_col
 from backend.services.league_service import LeagueService, LeagueTransitionError
 from backend.analytics import (
     compute_match_analytics as compute_match_analytics_fn,
     compute_league_match_slot_data,
     compute_total_match_momentum,
+    load_match_events,
 )
 from backend.explanation import ExplainResponse, explain_match
 from backend.role_advisor import RoleAdvisorResponse, advise_roles
@@ -57,26 +61,41 @@ from backend.persistence.db import get_db_path
 from backend.scoring import aggregate_stats_from_events, compute_fantasy_score
 from backend.roles import Role, parse_role, list_all_roles
 from backend.services.simulation_service import run_team_match_simulation
-from backend.simulation.persistence import event_to_dict
+from backend.simulation.persistence import event_to_dict, events_to_blob
 from backend.simulation.schemas import MatchConfig
 from backend.simulation.orchestrator import MatchOrchestrator, sets_to_win_match
-from backend.rankings_db import build_profile_store_for_match
+from backend.rankings_db import PlayerRow, build_profile_store_from_rows, get_players_by_ids
 from backend.live_match_engine import run_live_league_match_with_delays
 
 
-# ---------- Project root for data paths ----------
-def _project_root() -> Path:
-    return Path(__file__).resolve().parent.parent
-
+logger = logging.getLogger(__name__)
 
-def _rankings_path() -> Path:
-    return _project_root() / "data" / "rankings.json"
+# ---------- Project root for data paths (resolved once at import) ----------
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+_RANKINGS_PATH = _PROJECT_ROOT / "data" / "rankings.json"
 
 
 @contextmanager
 def db_conn() -> Generator:
-    """Yield a DB connection, ensure close on exit."""
-    conn = get_connection()
+    """
+    Yield this worker thread's shared DB connection. The request is the unit of work:
+    repositories don't commit, so writes commit here on normal exit and roll back if the
+    handler raises (including HTTPException).
+    """
+    conn = get_shared_connection()
+    try:
+        yield conn
+        if conn.in_transaction:
+            conn.commit()
+    finally:
+        if conn.in_transaction:
+            conn.rollback()
+
+
+@contextmanager
+def ro_db_conn() -> Generator:
+    """Yield a read-only DB connection (explain/advisor paths), ensure close on exit."""
+    conn = get_ro_connection()
     try:
         yield conn
     finally:
@@ -85,14 +104,45 @@ def db_conn() -> Generator:
 
 # ---------- Startup: ensure DB and rankings ----------
 def _ensure_db() -> None:
-    init_db(db_path=get_db_path(), rankings_path=_rankings_path())
+    init_db(db_path=get_db_path(), rankings_path=_RANKINGS_PATH)
+
+
+# ---------- Logging ----------
+@contextmanager
+def _queued_backend_logging() -> Generator:
+    """
+    Route backend.* log records through a queue so request handlers never block on stderr;
+    a listener thread does the actual writes. On exit the handler is detached and propagate
+    restored, so records logged after shutdown reach the root handlers instead of a dead queue.
+    """
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    stream = logging.StreamHandler()
+    stream.setFormatter(logging.Formatter("%(levelname)s:     %(name)s: %(message)s"))
+    backend_logger = logging.getLogger("backend")
+    handler = logging.handlers.QueueHandler(log_queue)
+    previous_propagate = backend_logger.propagate
+    backend_logger.addHandler(handler)
+    backend_logger.propagate = False
+    listener = logging.handlers.QueueListener(log_queue, stream, respect_handler_level=True)
+    listener.start()
+    try:
+        yield
+    finally:
+        backend_logger.removeHandler(handler)
+        backend_logger.propagate = previous_propagate
+        # Drains records already queued before the thread exits
+        listener.stop()
 
 
 # ---------- Lifespan ----------
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
-    _ensure_db()
-    yield
+    with _queued_backend_logging():
+        _ensure_db()
+        try:
+            yield
+        finally:
+            close_shared()
 
 
 # ---------- FastAPI app ----------
@@ -165,6 +215,10 @@ class SimulateMatchRequest(BaseModel):
     best_of: int = Field(default=5, ge=3, le=5)
 
 
+class SimulateMatchesRequest(BaseModel):
+    pairs: list[SimulateMatchRequest] = Field(..., min_length=1, max_length=50)
+
+
 class ExplainMatchRequest(BaseModel):
     match_id: str = Field(..., description="Match ID to explain")
     user_query: str | None = Field(default=None, description="Optional question, e.g. 'Why did Team A lose?'")
@@ -208,9 +262,10 @@ def signup(req: SignupRequest) -> dict[str, Any]:
         user_repo = UserRepository()
         if user_repo.get_by_username(conn, req.username):
             raise HTTPException(status_code=400, detail="Username already taken")
-        user = user_repo.create_with_password(
-            conn, req.username, hash_password(_truncate_password(req.password)), name=req.username
-        )
+        with write_transaction(conn):
+            user = user_repo.create_with_password(
+                conn, req.username, hash_password(_truncate_password(req.password)), name=req.username
+            )
         token = create_access_token(user.id)
         return {"user_id": user.id, "username": user.username, "token": token}
 
@@ -348,7 +403,8 @@ def create_team(
                 p = parse_role(slot_role) if slot_role else None
                 return p.value if p else None
             roster_tuples = [(r.player_id, r.slot, r.is_captain, _role_value(r.role)) for r in req.roster]
-            team = team_repo.create_phase2(conn, uid, req.name, req.gender, req.budget, roster_tuples)
+            with write_transaction(conn):
+                team = team_repo.create_phase2(conn, uid, req.name, req.gender, req.budget, roster_tuples)
             with_slots = team_repo.get_players_with_slots(conn, team.id)
             return {
                 "id": team.id,
@@ -379,10 +435,11 @@ def create_team(
         uid = req.user_id or user_id_from_token
         if not uid:
             raise HTTPException(status_code=400, detail="user_id required when not using auth")
-        user = user_repo.get(conn, uid)
-        if user is None:
-            user = user_repo.create(conn, name=f"User {uid[:8]}", id=uid)
-        team = team_repo.create(conn, uid, req.name, req.gender, player_ids)
+        # Implicit user and the team commit together
+        with write_transaction(conn):
+            if user_repo.get(conn, uid) is None:
+                user_repo.create(conn, name=f"User {uid[:8]}", id=uid)
+            team = team_repo.create(conn, uid, req.name, req.gender, player_ids)
         player_ids_out = team_repo.get_players(conn, team.id)
         return {
             "id": team.id,
@@ -428,9 +485,11 @@ def _last_match_points_for_player(
 ) -> float | None:
     """Return fantasy points from this player's most recent match, or None if none/no events."""
     match = match_repo.get_most_recent_for_player(conn, player_id)
-    if match is None or not match.events_json:
+    if match is None:
+        return None
+    events = load_match_events(match)
+    if not events:
         return None
-    events = json.loads(match.events_json)
     stats_a, stats_b = aggregate_stats_from_events(
         events,
         winner_id=match.winner_id,
@@ -449,10 +508,10 @@ def get_team(team_id: str) -> dict[str, Any]:
     with db_conn() as conn:
         team_repo = TeamRepository()
         match_repo = MatchRepository()
-        team = team_repo.get(conn, team_id)
-        if team is None:
+        found = team_repo.get_with_players(conn, team_id)
+        if found is None:
             raise HTTPException(status_code=404, detail="Team not found")
-        player_ids = team_repo.get_players(conn, team_id)
+        team, player_ids = found
         # Enrich with player names
         players = []
         for pid in player_ids:
@@ -506,20 +565,18 @@ def simulate_team_match(req: SimulateTeamMatchRequest) -> dict[str, Any]:
                 status_code=400,
                 detail="Teams must be the same gender (men vs men or women vs women).",
             )
-        active_a = team_repo.get_active_player_ids(conn, req.team_a_id)
-        active_b = team_repo.get_active_player_ids(conn, req.team_b_id)
-        if len(active_a) != TEAM_ACTIVE:
+        roster_a, captain_a = team_repo.get_active_roster_and_captain(conn, req.team_a_id)
+        roster_b, captain_b = team_repo.get_active_roster_and_captain(conn, req.team_b_id)
+        if len(roster_a) != TEAM_ACTIVE:
             raise HTTPException(
                 status_code=400,
                 detail=f"Team A must have exactly {TEAM_ACTIVE} active players (slots 1-7)",
             )
-        if len(active_b) != TEAM_ACTIVE:
+        if len(roster_b) != TEAM_ACTIVE:
             raise HTTPException(
                 status_code=400,
                 detail=f"Team B must have exactly {TEAM_ACTIVE} active players (slots 1-7)",
             )
-        captain_a = team_repo.get_captain_id(conn, req.team_a_id)
-        captain_b = team_repo.get_captain_id(conn, req.team_b_id)
 
         result = run_team_match_simulation(
             conn, req.team_a_id, req.team_b_id, seed=seed_base, best_of=req.best_of
@@ -529,21 +586,25 @@ def simulate_team_match(req: SimulateTeamMatchRequest) -> dict[str, Any]:
         slot_details = result["slot_details"]
         highlights_raw = result["highlights"]
 
-        for slot in slot_details:
-            match_repo.create(
-                conn,
-                req.team_a_id,
-                req.team_b_id,
-                slot["player_a_id"],
-                slot["player_b_id"],
-                slot["winner_id"],
-                slot["sets_a"],
-                slot["sets_b"],
-                req.best_of,
-                slot["seed"],
-                events_json=slot["events_json"],
-                id=slot["match_id"],
-            )
+        # One executemany and one commit for all slot matches
+        with write_transaction(conn):
+            match_repo.bulk_create(conn, (
+                {
+                    "team_a_id": req.team_a_id,
+                    "team_b_id": req.team_b_id,
+                    "player_a_id": slot["player_a_id"],
+                    "player_b_id": slot["player_b_id"],
+                    "winner_id": slot["winner_id"],
+                    "sets_a": slot["sets_a"],
+                    "sets_b": slot["sets_b"],
+                    "best_of": req.best_of,
+                    "seed": slot["seed"],
+                    "events_json": slot["events_json"],
+                    "id": slot["match_id"],
+                    "events_blob": slot["events_blob"],
+                }
+                for slot in slot_details
+            ))
 
         tm_id = f"tm-{req.team_a_id[:8]}-{req.team_b_id[:8]}-{seed_base}"
         tm = team_match_repo.create(
@@ -582,73 +643,94 @@ def simulate_team_match(req: SimulateTeamMatchRequest) -> dict[str, Any]:
         }
 
 
-@app.post("/simulate/match")
-def simulate_match(req: SimulateMatchRequest) -> dict[str, Any]:
-    """
-    Simulate a single match between two teams (first player from each team), persist and return.
-    Phase 2: supports manual trigger for Explain flow.
-    """
+def _first_players_for_match(conn, team_repo: TeamRepository, team_a_id: str, team_b_id: str) -> tuple[str, str]:
+    """Validate both teams and return the first player id of each (used by /simulate/match)."""
+    found_a = team_repo.get_with_players(conn, team_a_id)
+    found_b = team_repo.get_with_players(conn, team_b_id)
+    if found_a is None:
+        raise HTTPException(status_code=404, detail=f"Team not found: {team_a_id}")
+    if found_b is None:
+        raise HTTPException(status_code=404, detail=f"Team not found: {team_b_id}")
+    player_ids_a = found_a[1]
+    player_ids_b = found_b[1]
+    if not player_ids_a:
+        raise HTTPException(status_code=400, detail=f"Team {team_a_id} has no players")
+    if not player_ids_b:
+        raise HTTPException(status_code=400, detail=f"Team {team_b_id} has no players")
+    return player_ids_a[0], player_ids_b[0]
+
+
+def _simulated_match_config(req: SimulateMatchRequest, player_a_id: str, player_b_id: str) -> MatchConfig:
     import random
     seed = req.seed if req.seed is not None else random.randint(1, 2**31 - 1)
-    with db_conn() as conn:
-        team_repo = TeamRepository()
-        match_repo = MatchRepository()
-        team_a = team_repo.get(conn, req.team_a_id)
-        team_b = team_repo.get(conn, req.team_b_id)
-        if team_a is None:
-            raise HTTPException(status_code=404, detail=f"Team not found: {req.team_a_id}")
-        if team_b is None:
-            raise HTTPException(status_code=404, detail=f"Team not found: {req.team_b_id}")
-        player_ids_a = team_repo.get_players(conn, req.team_a_id)
-        player_ids_b = team_repo.get_players(conn, req.team_b_id)
-        if not player_ids_a:
-            raise HTTPException(status_code=400, detail=f"Team {req.team_a_id} has no players")
-        if not player_ids_b:
-            raise HTTPException(status_code=400, detail=f"Team {req.team_b_id} has no players")
-        player_a_id = player_ids_a[0]
-        player_b_id = player_ids_b[0]
-
-        store = build_profile_store_for_match(conn, player_a_id, player_b_id)
-        match_id = f"sim-{req.team_a_id[:8]}-{req.team_b_id[:8]}-{seed}"
-        config = MatchConfig(
-            match_id=match_id,
-            player_a_id=player_a_id,
-            player_b_id=player_b_id,
-            seed=seed,
-            best_of=req.best_of,
-        )
-        orch = MatchOrchestrator(config, store)
-        events = list(orch.run())
-        if not events:
-            raise HTTPException(status_code=500, detail="Simulation produced no events")
-        sets_needed = sets_to_win_match(req.best_of)
-        last = events[-1]
-        sets_a, sets_b = last.set_scores_after[0], last.set_scores_after[1]
-        winner_id = player_a_id if sets_a >= sets_needed else player_b_id
-        events_json = json.dumps([event_to_dict(e) for e in events])
-
-        match = match_repo.create(
-            conn,
-            team_a_id=req.team_a_id,
-            team_b_id=req.team_b_id,
-            player_a_id=player_a_id,
-            player_b_id=player_b_id,
-            winner_id=winner_id,
-            sets_a=sets_a,
-            sets_b=sets_b,
-            best_of=req.best_of,
-            seed=seed,
-            events_json=events_json,
-            id=match_id,
-        )
-        stats_a, stats_b = aggregate_stats_from_events(
-            events, winner_id=winner_id,
-            player_a_id=player_a_id, player_b_id=player_b_id,
-            best_of=req.best_of,
-        )
-        fantasy_a = compute_fantasy_score(stats_a)
-        fantasy_b = compute_fantasy_score(stats_b)
-        return {
+    return MatchConfig(
+        match_id=f"sim-{req.team_a_id[:8]}-{req.team_b_id[:8]}-{seed}",
+        player_a_id=player_a_id,
+        player_b_id=player_b_id,
+        seed=seed,
+        best_of=req.best_of,
+    )
+
+
+def _simulated_match_item(req: SimulateMatchRequest, config: MatchConfig, events: list) -> dict[str, Any]:
+    """MatchRepository.bulk_create item for a simulated match."""
+    if not events:
+        raise HTTPException(status_code=500, detail="Simulation produced no events")
+    player_a_id = config.player_a_id
+    player_b_id = config.player_b_id
+    sets_needed = sets_to_win_match(req.best_of)
+    last = events[-1]
+    sets_a, sets_b = last.set_scores_after[0], last.set_scores_after[1]
+    return {
+        "team_a_id": req.team_a_id,
+        "team_b_id": req.team_b_id,
+        "player_a_id": player_a_id,
+        "player_b_id": player_b_id,
+        "winner_id": player_a_id if sets_a >= sets_needed else player_b_id,
+        "sets_a": sets_a,
+        "sets_b": sets_b,
+        "best_of": req.best_of,
+        "seed": config.seed,
+        "events_json": json.dumps([event_to_dict(e) for e in events]),
+        "id": config.match_id,
+        "events_blob": events_to_blob(events, player_a_id),
+    }
+
+
+def _persist_simulated_matches(
+    conn,
+    match_repo: MatchRepository,
+    reqs: list[SimulateMatchRequest],
+    configs: list[MatchConfig],
+    all_events: list[list],
+    players: dict[str, PlayerRow],
+) -> list[dict[str, Any]]:
+    """
+    Store simulated matches and their analytics in one transaction and return their /simulate/match
+    response bodies. players holds the rows already loaded for the simulation (names for analytics).
+    """
+    items = [
+        _simulated_match_item(req, config, events)
+        for req, config, events in zip(reqs, configs, all_events)
+    ]
+    try:
+        with write_transaction(conn):
+            matches = match_repo.bulk_create(conn, items)
+            # Matches are immutable: compute analytics once here so /analysis/match is a plain row fetch
+            all_analytics = []
+            for match, events in zip(matches, all_events):
+                analytics = compute_match_analytics_fn(match, events)
+                p_a = players.get(match.player_a_id)
+                p_b = players.get(match.player_b_id)
+                analytics["player_a_name"] = p_a.name if p_a else match.player_a_id
+                analytics["player_b_name"] = p_b.name if p_b else match.player_b_id
+                match_repo.update_analytics(conn, match.id, json.dumps(analytics))
+                all_analytics.append(analytics)
+    except sqlite3.IntegrityError:
+        # Match ids are derived from (teams, seed): the same seed was simulated before
+        raise HTTPException(status_code=409, detail="A match with this seed has already been simulated")
+    return [
+        {
             "id": match.id,
             "team_a_id": match.team_a_id,
             "team_b_id": match.team_b_id,
@@ -660,15 +742,61 @@ def simulate_match(req: SimulateMatchRequest) -> dict[str, Any]:
             "best_of": match.best_of,
             "seed": match.seed,
             "created_at": match.created_at.isoformat(),
-            "fantasy_scores": {
-                player_a_id: round(fantasy_a, 1),
-                player_b_id: round(fantasy_b, 1),
-            },
+            "fantasy_scores": analytics["fantasy_scores"],
         }
+        for match, analytics in zip(matches, all_analytics)
+    ]
+
+
+@app.post("/simulate/match")
+def simulate_match(req: SimulateMatchRequest) -> dict[str, Any]:
+    """
+    Simulate a single match between two teams (first player from each team), persist and return.
+    Phase 2: supports manual trigger for Explain flow.
+    """
+    with db_conn() as conn:
+        team_repo = TeamRepository()
+        match_repo = MatchRepository()
+        player_a_id, player_b_id = _first_players_for_match(conn, team_repo, req.team_a_id, req.team_b_id)
+        rows = get_players_by_ids(conn, [player_a_id, player_b_id])
+        store = build_profile_store_from_rows(rows.get(player_a_id), rows.get(player_b_id))
+        config = _simulated_match_config(req, player_a_id, player_b_id)
+        orch = MatchOrchestrator(config, store)
+        events = list(orch.run())
+        return _persist_simulated_matches(conn, match_repo, [req], [config], [events], rows)[0]
+
+
+@app.post("/simulate/matches")
+def simulate_matches(req: SimulateMatchesRequest) -> dict[str, Any]:
+    """
+    Bulk /simulate/match: simulate and persist several independent matches in one request.
+    Player profiles for all pairs are loaded with a single query; all matches commit together.
+    """
+    with db_conn() as conn:
+        team_repo = TeamRepository()
+        match_repo = MatchRepository()
+        player_pairs = [
+            _first_players_for_match(conn, team_repo, pair.team_a_id, pair.team_b_id)
+            for pair in req.pairs
+        ]
+        configs = [
+            _simulated_match_config(pair, player_a_id, player_b_id)
+            for pair, (player_a_id, player_b_id) in zip(req.pairs, player_pairs)
+        ]
+        match_ids = [config.match_id for config in configs]
+        if len(set(match_ids)) != len(match_ids):
+            raise HTTPException(status_code=400, detail="Duplicate team pair and seed in pairs")
+        rows = get_players_by_ids(conn, [pid for pair in player_pairs for pid in pair])
+        jobs = [
+            (config, build_profile_store_from_rows(rows.get(config.player_a_id), rows.get(config.player_b_id)))
+            for config in configs
+        ]
+        all_events = MatchOrchestrator.run_batch(jobs)
+        return {"matches": _persist_simulated_matches(conn, match_repo, req.pairs, configs, all_events, rows)}
 
 
 @app.get("/matches/{match_id}")
-def get_match(match_id: str) -> dict[str, Any]:
+def get_match(match_id: str) -> Response:
     """Get a match by ID (with events and player names when available)."""
     with db_conn() as conn:
         match_repo = MatchRepository()
@@ -692,31 +820,35 @@ def get_match(match_id: str) -> dict[str, Any]:
             "seed": match.seed,
             "created_at": match.created_at.isoformat(),
         }
+        body = json.dumps(out)
         if match.events_json:
-            out["events"] = json.loads(match.events_json)
-        return out
+            # The stored events are already JSON: splice them in rather than parsing and
+            # re-encoding a few thousand point events per request.
+            body = f'{body[:-1]}, "events": {match.events_json}}}'
+        return Response(content=body, media_type="application/json")
 
 
 @app.get("/analysis/match/{match_id}")
-def get_analysis_match(match_id: str) -> dict[str, Any]:
+def get_analysis_match(match_id: str) -> Response:
     """
     Return deterministic, structured analytics for a match.
     No language generation — stats and outcome only. Includes rally/serve stats and player names.
+    Served from analytics stored at simulation time; older matches are computed from events_json.
     """
     with db_conn() as conn:
         match_repo = MatchRepository()
+        analytics_json = match_repo.get_analytics_json(conn, match_id)
+        if analytics_json is not None:
+            return Response(content=analytics_json, media_type="application/json")
         match = match_repo.get(conn, match_id)
         if match is None:
             raise HTTPException(status_code=404, detail="Match not found")
-        events = []
-        if match.events_json:
-            events = json.loads(match.events_json)
-        out = compute_match_analytics_fn(match, events)
+        out = compute_match_analytics_fn(match, load_match_events(match))
         p_a = get_player(conn, match.player_a_id)
         p_b = get_player(conn, match.player_b_id)
         out["player_a_name"] = p_a.name if p_a else match.player_a_id
         out["player_b_name"] = p_b.name if p_b else match.player_b_id
-        return out
+        return JSONResponse(out)
 
 
 # ---------- Leagues (Step 3) ----------
@@ -725,35 +857,32 @@ def get_analysis_match(match_id: str) -> dict[str, Any]:
 def _compute_league_standings(conn, league_id: str) -> list[dict[str, Any]]:
     """Compute standings from completed league_matches. Returns list of {team_id, wins, losses, draws, points_for, points_against, differential}."""
     season_repo = SeasonRepository()
-    week_repo = WeekRepository()
     league_match_repo = LeagueMatchRepository()
     season = season_repo.get_current_for_league(conn, league_id)
     if season is None:
         return []
-    weeks = week_repo.list_by_season(conn, season.id)
     by_team: dict[str, dict[str, Any]] = {}
-    for w in weeks:
-        for m in league_match_repo.list_by_week(conn, w.id):
-            if m.status != "completed":
-                continue
-            home_id = m.home_team_id
-            away_id = m.away_team_id
-            pairs = [(home_id, m.home_score, m.away_score)]
-            if away_id:
-                pairs.append((away_id, m.away_score, m.home_score))
-            for tid, pts_for, pts_against in pairs:
-                if tid not in by_team:
-                    by_team[tid] = {"team_id": tid, "wins": 0, "losses": 0, "draws": 0, "points_for": 0.0, "points_against": 0.0}
-                by_team[tid]["points_for"] += pts_for
-                by_team[tid]["points_against"] += pts_against
-                if away_id is None:
-                    continue  # bye: no W/L/D
-                if pts_for > pts_against:
-                    by_team[tid]["wins"] += 1
-                elif pts_for < pts_against:
-                    by_team[tid]["losses"] += 1
-                else:
-                    by_team[tid]["draws"] += 1
+    for m in league_match_repo.iter_by_season(conn, season.id):
+        if m.status != "completed":
+            continue
+        home_id = m.home_team_id
+        away_id = m.away_team_id
+        pairs = [(home_id, m.home_score, m.away_score)]
+        if away_id:
+            pairs.append((away_id, m.away_score, m.home_score))
+        for tid, pts_for, pts_against in pairs:
+            if tid not in by_team:
+                by_team[tid] = {"team_id": tid, "wins": 0, "losses": 0, "draws": 0, "points_for": 0.0, "points_against": 0.0}
+            by_team[tid]["points_for"] += pts_for
+            by_team[tid]["points_against"] += pts_against
+            if away_id is None:
+                continue  # bye: no W/L/D
+            if pts_for > pts_against:
+                by_team[tid]["wins"] += 1
+            elif pts_for < pts_against:
+                by_team[tid]["losses"] += 1
+            else:
+                by_team[tid]["draws"] += 1
     for t in by_team.values():
         t["differential"] = round(t["points_for"] - t["points_against"], 1)
     return sorted(by_team.values(), key=lambda x: (-x["wins"], -x["differential"], -x["points_for"]))
@@ -858,13 +987,14 @@ def get_league(league_id: str) -> dict[str, Any]:
                 ]
             # Full schedule: all weeks and matches (deterministic, persisted)
             weeks = week_repo.list_by_season(conn, season.id)
+            matches_by_week = league_match_repo.list_by_week_ids(conn, [w.id for w in weeks])
             out["schedule"] = [
                 {
                     "week_number": w.week_number,
                     "week_id": w.id,
                     "matches": [
                         {"id": m.id, "home_team_id": m.home_team_id, "away_team_id": m.away_team_id, "status": m.status, "home_score": m.home_score, "away_score": m.away_score}
-                        for m in league_match_repo.list_by_week(conn, w.id)
+                        for m in matches_by_week[w.id]
                     ],
                 }
                 for w in weeks
@@ -908,7 +1038,6 @@ def join_league(
         member_repo.create(conn, league_id, uid, req.team_id)
         # Optionally set team.league_id for consistency
         conn.execute("UPDATE teams SET league_id = ? WHERE id = ?", (league_id, req.team_id))
-        conn.commit()
         return {"league_id": league_id, "user_id": uid, "team_id": req.team_id, "joined": True}
 
 
@@ -1081,10 +1210,10 @@ def get_league_match(match_id: str) -> dict[str, Any]:
                     "done": live.get("done", False),
                     "games": live.get("games", []),
                 }
-        if m.status == "completed" and _has_col(conn, "league_matches", "slot_data"):
-            row = conn.execute("SELECT slot_data FROM league_matches WHERE id = ?", (match_id,)).fetchone()
-            if row and row[0]:
-                slot_data = json.loads(row[0])
+        if m.status == "completed":
+            slot_data_json = league_match_repo.get_slot_data_json(conn, match_id)
+            if slot_data_json:
+                slot_data = json.loads(slot_data_json)
                 out["slot_data"] = slot_data
                 out["total_momentum"] = compute_total_match_momentum(slot_data)
         return out
@@ -1130,8 +1259,10 @@ async def start_live_league_match(
 
 async def _run_live_task(match_id: str, seed: int | None) -> None:
     """Background task: run live simulation, push to WebSocket, persist when done. Bootstrap already set by start_live; initial tick sent immediately so late join gets state."""
+    # Both run on long-lived worker threads, so each reuses its thread's shared connection
+    # (warm page cache and statements) instead of opening, and leaking or closing, its own.
     def get_conn():
-        return get_connection()
+        return get_shared_connection()
 
     async def on_tick(elapsed: float, home: float, away: float, hl: list, done: bool):
         current = _live_match_state.get(match_id, {})
@@ -1170,20 +1301,15 @@ async def _run_live_task(match_id: str, seed: int | None) -> None:
         slot_data = compute_league_match_slot_data(result["slot_details"])
         home = result["home_score"]
         away = result["away_score"]
-        import concurrent.futures
-        loop = asyncio.get_event_loop()
         def persist():
-            c = get_connection()
-            try:
+            c = get_shared_connection()
+            with write_transaction(c):
                 LeagueMatchRepository().update_result(
                     c, match_id, home, away,
                     simulation_log="Live completed",
                     slot_data_json=json.dumps(slot_data),
                 )
-            finally:
-                c.close()
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as ex:
-            await loop.run_in_executor(ex, persist)
+        await asyncio.to_thread(persist)
 
 
 @app.post("/league-matches/{match_id}/fast-forward")
@@ -1232,19 +1358,17 @@ def get_league_match_game(match_id: str, slot: int) -> dict[str, Any]:
     """
     if slot < 1 or slot > 7:
         raise HTTPException(status_code=400, detail="Slot must be 1–7")
-    with db_conn() as conn:
+    with ro_db_conn() as conn:
         league_match_repo = LeagueMatchRepository()
         m = league_match_repo.get(conn, match_id)
         if m is None:
             raise HTTPException(status_code=404, detail="League match not found")
         if m.status != "completed":
             raise HTTPException(status_code=400, detail="Match not completed; slot data available after completion")
-        if not _has_col(conn, "league_matches", "slot_data"):
+        slot_data_json = league_match_repo.get_slot_data_json(conn, match_id)
+        if not slot_data_json:
             raise HTTPException(status_code=404, detail="Slot data not available for this match")
-        row = conn.execute("SELECT slot_data FROM league_matches WHERE id = ?", (match_id,)).fetchone()
-        if not row or not row[0]:
-            raise HTTPException(status_code=404, detail="Slot data not available for this match")
-        slot_data = json.loads(row[0])
+        slot_data = json.loads(slot_data_json)
         if slot > len(slot_data):
             raise HTTPException(status_code=404, detail="Game not found")
         s = slot_data[slot - 1]
@@ -1289,17 +1413,15 @@ def explain_league_match_game_endpoint(req: ExplainLeagueMatchGameRequest) -> Ex
     """
     if req.slot < 1 or req.slot > 7:
         raise HTTPException(status_code=400, detail="Slot must be 1–7")
-    with db_conn() as conn:
+    with ro_db_conn() as conn:
         league_match_repo = LeagueMatchRepository()
         m = league_match_repo.get(conn, req.league_match_id)
         if m is None:
             raise HTTPException(status_code=404, detail="League match not found")
-        if not _has_col(conn, "league_matches", "slot_data"):
-            raise HTTPException(status_code=404, detail="Slot data not available")
-        row = conn.execute("SELECT slot_data FROM league_matches WHERE id = ?", (req.league_match_id,)).fetchone()
-        if not row or not row[0]:
+        slot_data_json = league_match_repo.get_slot_data_json(conn, req.league_match_id)
+        if not slot_data_json:
             raise HTTPException(status_code=404, detail="Slot data not available")
-        slot_data = json.loads(row[0])
+        slot_data = json.loads(slot_data_json)
         if req.slot > len(slot_data):
             raise HTTPException(status_code=404, detail="Game not found")
         s = slot_data[req.slot - 1]
@@ -1388,15 +1510,14 @@ def explain_match_endpoint(req: ExplainMatchRequest) -> ExplainResponse:
     Uses RAG pipeline: analytics + match summary + player context + rules → prompt → LLM.
     If OPENAI_API_KEY is not set, returns a stub response (no 503). Never influences simulation or persistence.
     """
-    with db_conn() as conn:
+    with ro_db_conn() as conn:
         match_repo = MatchRepository()
         if match_repo.get(conn, req.match_id) is None:
             raise HTTPException(status_code=404, detail="Match not found")
         try:
             return explain_match(conn, req.match_id, req.user_query)
         except Exception as e:
-            import traceback
-            traceback.print_exc()
+            logger.exception("Explanation failed for %s", req.match_id)
             raise HTTPException(
                 status_code=500,
                 detail=f"Explanation failed: {e!s}. Use GET /analysis/match/{req.match_id} for analytics.",
@@ -1416,7 +1537,7 @@ def advise_roles_endpoint(req: RoleAdvisorRequest) -> dict[str, Any]:
     AI role advisor: recommends which players suit which roles. Read-only; does not assign roles.
     Provide team_id (for roster) or gender (for pool). If OPENAI_API_KEY is not set, returns stub.
     """
-    with db_conn() as conn:
+    with ro_db_conn() as conn:
         if req.team_id:
             team_repo = TeamRepository()
             if team_repo.get(conn, req.team_id) is None:
@@ -1425,8 +1546,7 @@ def advise_roles_endpoint(req: RoleAdvisorRequest) -> dict[str, Any]:
             response = advise_roles(conn, req.query, team_id=req.team_id, gender=req.gender)
             return response.to_dict()
         except Exception as e:
-            import traceback
-            traceback.print_exc()
+            logger.exception("Role advisor failed for query %r", req.query)
             raise HTTPException(
                 status_code=500,
                 detail=f"Role advisor failed: {e!s}. Choose roles manually using the role descriptions.",
@@ -12,6 +12,7 @@ from __future__ import annotations
 
 import json
 import os
+from functools import lru_cache
 from typing import Any
 
 try:
@@ -34,6 +35,37 @@ STUB_EXPLANATION = (
 STUB_FACTS = ["Stub: OPENAI_API_KEY not set or openai package not installed."]
 
 
+# Structured-output schema; built once and passed as-is on every call.
+_RESPONSE_FORMAT: dict[str, Any] = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "explanation_response",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "explanation_text": {
+                    "type": "string",
+                    "description": "Short, grounded explanation based only on the provided data.",
+                },
+                "supporting_facts": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "List of specific facts or stats cited from the context.",
+                },
+            },
+            "required": ["explanation_text", "supporting_facts"],
+            "additionalProperties": False,
+        },
+    },
+}
+
+
+def llm_is_stub() -> bool:
+    """True when call_llm would return the stub (no openai package or no OPENAI_API_KEY)."""
+    return not HAS_OPENAI or not os.environ.get("OPENAI_API_KEY", "").strip()
+
+
 def _get_client() -> Any | None:
     """
     Return OpenAI client if API key is set and openai is installed.
@@ -44,6 +76,12 @@ def _get_client() -> Any | None:
     api_key = os.environ.get("OPENAI_API_KEY", "").strip()
     if not api_key:
         return None
+    return _client_for_key(api_key)
+
+
+@lru_cache(maxsize=4)
+def _client_for_key(api_key: str) -> Any:
+    """One OpenAI client (and its HTTP connection pool) per API key, reused across calls."""
     return OpenAI(api_key=api_key)
 
 
@@ -65,29 +103,7 @@ def call_llm(messages: list[dict[str, str]]) -> tuple[str, list[str]]:
             model="gpt-4o-mini",
             messages=messages,
             temperature=0,
-            response_format={
-                "type": "json_schema",
-                "json_schema": {
-                    "name": "explanation_response",
-                    "strict": True,
-                    "schema": {
-                        "type": "object",
-                        "properties": {
-                            "explanation_text": {
-                                "type": "string",
-                                "description": "Short, grounded explanation based only on the provided data.",
-                            },
-                            "supporting_facts": {
-                                "type": "array",
-                                "items": {"type": "string"},
-                                "description": "List of specific facts or stats cited from the context.",
-                            },
-                        },
-                        "required": ["explanation_text", "supporting_facts"],
-                        "additionalProperties": False,
-                    },
-                },
-            },
+            response_format=_RESPONSE_FORMAT,
             max_tokens=1024,
         )
     except Exception as e:
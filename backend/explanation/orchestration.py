@@ -14,33 +14,29 @@ from __future__ import annotations
 
 from typing import Any
 
-from backend.explanation.llm import call_llm
+from backend.explanation.llm import STUB_EXPLANATION, STUB_FACTS, call_llm, llm_is_stub
 from backend.explanation.prompt import build_prompt
 from backend.explanation.retrieval import (
-    get_match_analytics,
-    get_match_summary,
+    build_match_summary,
     get_player_context,
     get_rules_context,
+    load_match,
+    load_match_analytics,
 )
 from backend.explanation.schemas import ContextBundle, ExplainResponse
-from backend.persistence.repositories import MatchRepository
 
 
-def decide_retrievals(user_query: str | None) -> list[str]:
+# Every explanation is grounded in all four sources; the query does not change the set.
+# If query-specific retrieval is added, map an intent class to a precomputed tuple here.
+_DEFAULT_SOURCES: tuple[str, ...] = ("match_summary", "match_analytics", "player_context", "rules_context")
+
+
+def decide_retrievals(user_query: str | None) -> tuple[str, ...]:
     """
     Decide which context sources to retrieve based on the user query.
-    Returns a list of source names; used for traceability and assembly.
+    Returns a tuple of source names; used for traceability and assembly.
     """
-    q = (user_query or "").strip().lower()
-    # Always include match outcome and analytics for "why" explanations
-    sources = ["match_summary", "match_analytics"]
-    # Player context helps for "why did X lose" or "who is"
-    if any(kw in q for kw in ("why", "who", "player", "team", "lose", "win", "beat")):
-        sources.append("player_context")
-    else:
-        sources.append("player_context")  # include by default for grounding
-    sources.append("rules_context")
-    return sources
+    return _DEFAULT_SOURCES
 
 
 def gather_context(conn: Any, match_id: str, user_query: str | None) -> ContextBundle:
@@ -49,31 +45,29 @@ def gather_context(conn: Any, match_id: str, user_query: str | None) -> ContextB
     Sources used are recorded in bundle.sources_used.
     """
     sources = decide_retrievals(user_query)
-    bundle = ContextBundle(sources_used=list(sources))
 
-    match_repo = MatchRepository()
-    match = match_repo.get(conn, match_id)
+    # Single read of the match row; every retrieval below works from this object
+    match = load_match(conn, match_id)
     if match is None:
-        return bundle
-
-    if "match_summary" in sources:
-        bundle.match_summary = get_match_summary(conn, match_id)
-    if "match_analytics" in sources:
-        bundle.match_analytics = get_match_analytics(conn, match_id)
-    if "player_context" in sources:
-        bundle.player_context = get_player_context(
-            conn, [match.player_a_id, match.player_b_id]
-        )
-    if "rules_context" in sources:
-        bundle.rules_context = get_rules_context()
+        return ContextBundle(sources_used=sources)
 
-    return bundle
+    return ContextBundle(
+        match_summary=build_match_summary(match) if "match_summary" in sources else None,
+        match_analytics=load_match_analytics(conn, match) if "match_analytics" in sources else None,
+        player_context=(
+            tuple(get_player_context(conn, [match.player_a_id, match.player_b_id]))
+            if "player_context" in sources
+            else ()
+        ),
+        rules_context=get_rules_context() if "rules_context" in sources else None,
+        sources_used=sources,
+    )
 
 
 def explain_match(conn: Any, match_id: str, user_query: str | None = None) -> ExplainResponse:
     """
     Full explanation flow: gather context, build prompt, call LLM (or stub), return response.
-    If OPENAI_API_KEY is not set, call_llm returns a stub so the endpoint still returns 200.
+    If OPENAI_API_KEY is not set, the stub response is returned without building a prompt.
     """
     bundle = gather_context(conn, match_id, user_query)
     # If no match or no useful context, return a grounded fallback without calling LLM
@@ -87,6 +81,12 @@ def explain_match(conn: Any, match_id: str, user_query: str | None = None) -> Ex
             explanation_text="Match was found but no analytics or player context could be loaded. Cannot generate a grounded explanation.",
             supporting_facts=["match_summary only"],
         )
+    # The stub ignores the prompt, so skip serializing the context into one.
+    if llm_is_stub():
+        return ExplainResponse(
+            explanation_text=STUB_EXPLANATION,
+            supporting_facts=list(STUB_FACTS),
+        )
     messages = build_prompt(bundle, user_query)
     explanation_text, supporting_facts = call_llm(messages)
     return ExplainResponse(
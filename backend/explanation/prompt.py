@@ -11,6 +11,7 @@ from __future__ import annotations
 import json
 from typing import Any
 
+from backend.explanation.retrieval import get_rules_context
 from backend.explanation.schemas import ContextBundle
 
 
@@ -24,25 +25,68 @@ Rules:
 - Do not speculate about simulation internals, seeds, or randomness.
 - Output must be advisory and explanatory, not authoritative."""
 
+# Static prompt pieces, built once at import. Messages are only read by the client, so sharing is safe.
+_SYSTEM_MSG: dict[str, str] = {"role": "system", "content": SYSTEM_INSTRUCTION}
+_RULES_HEADER = "## Domain rules (table tennis)\n"
+_RULES_TEXT = get_rules_context()
+_RULES_BLOCK = _RULES_HEADER + _RULES_TEXT
+
+# Context budget for the user message. gpt-4o-mini accepts far more, but anything past this
+# is cost without grounding value; match_analytics is the first block trimmed to fit.
+_MAX_CONTEXT_TOKENS = 6000
+_ANALYTICS_HEADER = "## Match analytics (deterministic stats)\n"
+_ANALYTICS_TRIMMED_HEADER = "## Match analytics (trimmed to fit context budget)\n"
+
+
+def _compact_json(data: Any) -> str:
+    """Minified JSON: indentation only adds prompt tokens, the model reads either form."""
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+
+
+def _approx_tokens(text: str) -> int:
+    """Rough token count (~4 characters per token); good enough for a budget check."""
+    return len(text) // 4
+
+
+def _analytics_digest(analytics: dict[str, Any]) -> str:
+    """One-paragraph stand-in for match_analytics: winner, final set score, fantasy scores."""
+    outcome = analytics.get("outcome") or {}
+    scores = ", ".join(f"{pid}: {pts}" for pid, pts in (analytics.get("fantasy_scores") or {}).items())
+    return (
+        f"Winner {outcome.get('winner_id')} won {outcome.get('sets_a')}-{outcome.get('sets_b')} "
+        f"(best of {outcome.get('best_of')}). Points played: {analytics.get('total_points_played', 'n/a')}. "
+        f"Fantasy scores: {scores or 'n/a'}."
+    )
+
 
 def _format_context(bundle: ContextBundle) -> str:
-    """Format the context bundle as a single string for the prompt."""
+    """
+    Format the context bundle as a single string for the prompt.
+    If the blocks exceed _MAX_CONTEXT_TOKENS, match_analytics is replaced by a short digest.
+    """
     parts: list[str] = []
+    analytics_at = -1
 
     if bundle.match_summary:
-        parts.append("## Match summary (metadata)\n" + json.dumps(bundle.match_summary, indent=2))
+        parts.append("## Match summary (metadata)\n" + _compact_json(bundle.match_summary))
 
     if bundle.match_analytics:
-        parts.append("## Match analytics (deterministic stats)\n" + json.dumps(bundle.match_analytics, indent=2))
+        analytics_at = len(parts)
+        parts.append(_ANALYTICS_HEADER + _compact_json(bundle.match_analytics))
 
     if bundle.player_context:
-        parts.append("## Player context (rankings)\n" + json.dumps(bundle.player_context, indent=2))
+        parts.append("## Player context (rankings)\n" + _compact_json(bundle.player_context))
 
     if bundle.rules_context:
-        parts.append("## Domain rules (table tennis)\n" + bundle.rules_context)
+        if bundle.rules_context == _RULES_TEXT:
+            parts.append(_RULES_BLOCK)
+        else:
+            parts.append(_RULES_HEADER + bundle.rules_context)
 
     if not parts:
         return "(No context available for this match.)"
+    if analytics_at >= 0 and sum(_approx_tokens(p) for p in parts) > _MAX_CONTEXT_TOKENS:
+        parts[analytics_at] = _ANALYTICS_TRIMMED_HEADER + _analytics_digest(bundle.match_analytics)
     return "\n\n".join(parts)
 
 
@@ -63,6 +107,6 @@ User question: {query}
 
 Respond with a short, grounded explanation. At the end, list the specific facts or stats you cited (supporting_facts) as a bullet list."""
     return [
-        {"role": "system", "content": SYSTEM_INSTRUCTION},
+        _SYSTEM_MSG,
         {"role": "user", "content": user_content},
     ]
@@ -14,9 +14,17 @@ from __future__ import annotations
 import json
 from typing import Any
 
-from backend.analytics import compute_match_analytics
+from backend.analytics import compute_match_analytics, load_match_events
+from backend.models import Match
 from backend.persistence.repositories import MatchRepository
-from backend.rankings_db import get_player
+from backend.rankings_db import get_players_by_ids
+
+_MATCH_REPO = MatchRepository()
+
+
+def load_match(conn: Any, match_id: str) -> Match | None:
+    """Return the match, or None if not found."""
+    return _MATCH_REPO.get(conn, match_id)
 
 
 # ---------- Static domain knowledge (table tennis rules, scoring) ----------
@@ -32,33 +40,31 @@ Fantasy scoring (for context only; the simulation does not use this for match ou
 - Match win/loss, set wins/losses, and point differential contribute to fantasy points.
 - Comeback sets (winning a set after trailing by 4+ points), deciding set wins, and streak-related events can add or subtract points.
 - Shot-type bonuses (forehand/backhand/service winners, unforced errors) are factored in.
-"""
+""".strip()
 
 
-def get_match_analytics(conn: Any, match_id: str) -> dict[str, Any] | None:
-    """
-    Return deterministic analytics for the match (outcome, stats, fantasy scores).
-    Returns None if match not found or has no events.
-    """
-    match_repo = MatchRepository()
-    match = match_repo.get(conn, match_id)
-    if match is None:
-        return None
-    events = []
-    if match.events_json:
-        events = json.loads(match.events_json)
-    return compute_match_analytics(match, events)
+def build_match_analytics(match: Match) -> dict[str, Any]:
+    """Deterministic analytics (outcome, stats, fantasy scores) for an already-loaded match."""
+    return compute_match_analytics(match, load_match_events(match))
 
 
-def get_match_summary(conn: Any, match_id: str) -> dict[str, Any] | None:
+def load_match_analytics(conn: Any, match: Match) -> dict[str, Any]:
     """
-    Return match metadata only: id, teams, players, winner, set score, best_of, created_at.
-    No event data. Returns None if match not found.
+    Analytics for an already-loaded match: the copy stored at simulation time when there is one
+    (decoded fresh per call, without the display names the analysis endpoint adds), otherwise
+    computed from its events like build_match_analytics.
     """
-    match_repo = MatchRepository()
-    match = match_repo.get(conn, match_id)
-    if match is None:
-        return None
+    stored = _MATCH_REPO.get_analytics_json(conn, match.id)
+    if stored is None:
+        return build_match_analytics(match)
+    analytics = json.loads(stored)
+    analytics.pop("player_a_name", None)
+    analytics.pop("player_b_name", None)
+    return analytics
+
+
+def build_match_summary(match: Match) -> dict[str, Any]:
+    """Match metadata only (no event data) for an already-loaded match."""
     return {
         "id": match.id,
         "team_a_id": match.team_a_id,
@@ -73,25 +79,46 @@ def get_match_summary(conn: Any, match_id: str) -> dict[str, Any] | None:
     }
 
 
+def get_match_analytics(conn: Any, match_id: str) -> dict[str, Any] | None:
+    """
+    Return deterministic analytics for the match (outcome, stats, fantasy scores).
+    Returns None if match not found or has no events.
+    """
+    match = load_match(conn, match_id)
+    if match is None:
+        return None
+    return load_match_analytics(conn, match)
+
+
+def get_match_summary(conn: Any, match_id: str) -> dict[str, Any] | None:
+    """
+    Return match metadata only: id, teams, players, winner, set score, best_of, created_at.
+    No event data. Returns None if match not found.
+    """
+    match = load_match(conn, match_id)
+    if match is None:
+        return None
+    return build_match_summary(match)
+
+
 def get_player_context(conn: Any, player_ids: list[str]) -> list[dict[str, Any]]:
     """
     Return structured player info (id, name, country, gender, rank, points) for each id.
     Missing players are omitted; order follows input order where present.
     """
-    out: list[dict[str, Any]] = []
-    for pid in player_ids:
-        row = get_player(conn, pid)
-        if row is None:
-            continue
-        out.append({
+    rows = get_players_by_ids(conn, player_ids)
+    return [
+        {
             "id": row.id,
             "name": row.name,
             "country": row.country,
             "gender": row.gender,
             "rank": row.rank,
             "points": row.points,
-        })
-    return out
+        }
+        for row in (rows.get(pid) for pid in player_ids)
+        if row is not None
+    ]
 
 
 def get_rules_context() -> str:
@@ -99,4 +126,4 @@ def get_rules_context() -> str:
     Return static domain knowledge: table tennis rules and scoring explanation.
     No I/O; same content every call.
     """
-    return RULES_CONTENT.strip()
+    return RULES_CONTENT
@@ -3,21 +3,24 @@ Schemas for the explanation feature.
 """
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from typing import Any
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ContextBundle:
-    """Assembled context for the LLM. Sources used are explicit and traceable."""
+    """
+    Assembled context for the LLM. Sources used are explicit and traceable.
+    Built once by gather_context and only read afterwards, so sequences are tuples.
+    """
     match_summary: dict[str, Any] | None = None
     match_analytics: dict[str, Any] | None = None
-    player_context: list[dict[str, Any]] = field(default_factory=list)
+    player_context: tuple[dict[str, Any], ...] = ()
     rules_context: str | None = None
-    sources_used: list[str] = field(default_factory=list)
+    sources_used: tuple[str, ...] = ()
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ExplainResponse:
     """Response from the explanation endpoint."""
     explanation_text: str
@@ -7,8 +7,11 @@ final scoring; runs in background task to avoid blocking.
 from __future__ import annotations
 
 import asyncio
+import os
 import random
 import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 from typing import Any, Callable
 
 from backend.persistence.repositories import LeagueMatchRepository
@@ -21,6 +24,14 @@ LIVE_DURATION_SECONDS = NUM_SLOTS * SECONDS_PER_GAME  # ~245s total
 LIVE_STEP_SECONDS = 2.5
 LIVE_STEP_JITTER = 0.3
 
+# Repositories are stateless (conn is passed per call); share one instance.
+_LM_REPO = LeagueMatchRepository()
+
+_HIGHLIGHT_POINTS = itemgetter("points_home", "points_away")
+
+# Shared pool for running team-match simulations off the event loop (threads are reused across live matches).
+_SIM_EXECUTOR = ThreadPoolExecutor(max_workers=os.cpu_count() or 4, thread_name_prefix="live-sim")
+
 
 def run_live_league_match(
     conn: sqlite3.Connection,
@@ -33,8 +44,7 @@ def run_live_league_match(
     Does not persist; caller must persist and set status=completed.
     Returns final result dict (home_score, away_score, highlights, ...).
     """
-    league_match_repo = LeagueMatchRepository()
-    m = league_match_repo.get(conn, league_match_id)
+    m = _LM_REPO.get(conn, league_match_id)
     if m is None:
         raise ValueError(f"League match not found: {league_match_id}")
     if m.away_team_id is None:
@@ -61,12 +71,16 @@ def _cumulative_scores_from_highlights(highlights: list[dict]) -> tuple[list[flo
     """Build cumulative home/away scores after each slot. Append-only; no interpolation."""
     cumul_home: list[float] = []
     cumul_away: list[float] = []
-    h_tot, a_tot = 0.0, 0.0
+    total_home = total_away = 0.0
     for hl in highlights:
-        h_tot += float(hl.get("points_home", 0))
-        a_tot += float(hl.get("points_away", 0))
-        cumul_home.append(round(h_tot, 1))
-        cumul_away.append(round(a_tot, 1))
+        try:
+            points_home, points_away = _HIGHLIGHT_POINTS(hl)
+        except KeyError:
+            points_home, points_away = hl.get("points_home", 0), hl.get("points_away", 0)
+        total_home += points_home
+        total_away += points_away
+        cumul_home.append(round(total_home, 1))
+        cumul_away.append(round(total_away, 1))
     return cumul_home, cumul_away
 
 
@@ -81,15 +95,12 @@ async def run_live_league_match_with_delays(
     updates. Scores are append-only: each tick sends cumulative score after that slot
     completes. No interpolation; no retroactive changes.
     """
-    import concurrent.futures
-
     def get_conn_sync():
         return get_conn()
 
     def run_sim():
         conn = get_conn_sync()
-        league_match_repo = LeagueMatchRepository()
-        m = league_match_repo.get(conn, league_match_id)
+        m = _LM_REPO.get(conn, league_match_id)
         if m is None:
             raise ValueError(f"League match not found: {league_match_id}")
         if m.away_team_id is None:
@@ -98,9 +109,7 @@ async def run_live_league_match_with_delays(
             conn, m.home_team_id, m.away_team_id, seed=seed, best_of=5
         )
 
-    loop = asyncio.get_event_loop()
-    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as ex:
-        result = await loop.run_in_executor(ex, run_sim)
+    result = await asyncio.get_running_loop().run_in_executor(_SIM_EXECUTOR, run_sim)
 
     if result.get("away_score") == 0.0 and result.get("explanation") == "Bye":
         return result
@@ -110,18 +119,50 @@ async def run_live_league_match_with_delays(
 
     # Initial tick is sent by API _run_live_task before calling this, so late join gets state immediately.
 
-    # Discrete slot-by-slot: wait SECONDS_PER_GAME, then emit cumulative score for that slot.
-    for k in range(len(highlights)):
-        await asyncio.sleep(SECONDS_PER_GAME)
+    # Discrete slot-by-slot: every tick is scheduled up front on the loop's timer heap
+    # (one call_later per slot) instead of a coroutine sleeping SECONDS_PER_GAME between slots.
+    loop = asyncio.get_running_loop()
+    all_ticked = asyncio.Event()
+    tick_tasks: list[asyncio.Task] = []
+    tick_errors: list[Exception] = []
+    tick_is_coro = on_tick_async is not None and asyncio.iscoroutinefunction(on_tick_async)
+
+    async def chained_tick(previous: asyncio.Task | None, args: tuple) -> None:
+        # A slow send must not let a later tick (e.g. the final done=True one) overtake it
+        if previous is not None:
+            await previous
+        await on_tick_async(*args)
+
+    def fire_tick(k: int) -> None:
         elapsed = (k + 1) * SECONDS_PER_GAME
-        home_score = cumul_home[k]
-        away_score = cumul_away[k]
-        highlights_so_far = highlights[: k + 1]
         done = k == len(highlights) - 1
         if on_tick_async:
-            if asyncio.iscoroutinefunction(on_tick_async):
-                await on_tick_async(elapsed, home_score, away_score, highlights_so_far, done)
-            else:
-                on_tick_async(elapsed, home_score, away_score, highlights_so_far, done)
+            args = (elapsed, cumul_home[k], cumul_away[k], highlights[: k + 1], done)
+            try:
+                if tick_is_coro:
+                    previous = tick_tasks[-1] if tick_tasks else None
+                    tick_tasks.append(loop.create_task(chained_tick(previous, args)))
+                else:
+                    on_tick_async(*args)
+            except Exception as e:
+                # Timer callbacks can't raise into this coroutine; hand the error back to it.
+                tick_errors.append(e)
+                done = True
+        if done:
+            all_ticked.set()
+
+    handles = [
+        loop.call_later((k + 1) * SECONDS_PER_GAME, fire_tick, k)
+        for k in range(len(highlights))
+    ]
+    try:
+        if handles:
+            await all_ticked.wait()
+        if tick_errors:
+            raise tick_errors[0]
+        await asyncio.gather(*tick_tasks)
+    finally:
+        for h in handles:
+            h.cancel()
 
     return result
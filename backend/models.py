@@ -4,6 +4,9 @@ Domain objects only — no persistence or API logic.
 
 League-centric architecture: users participate in leagues; leagues have seasons;
 seasons have weeks; matches happen as time advances (not on-demand).
+
+to_dict methods build dict literals on purpose: in CPython a literal is faster than
+walking a key tuple (attrgetter + zip) or dataclasses.asdict, so keep that form.
 """
 from __future__ import annotations
 
@@ -36,7 +39,7 @@ class LeagueMatchStatus(str, Enum):
 
 
 # ---------- User ----------
-@dataclass
+@dataclass(slots=True)
 class User:
     """
     A fantasy app user.
@@ -66,7 +69,7 @@ class User:
 
 
 # ---------- LeagueMember (join: league_id, user_id, team_id) ----------
-@dataclass
+@dataclass(slots=True)
 class LeagueMember:
     """
     One user's membership in a league with one team. One team per user per league.
@@ -86,7 +89,7 @@ class LeagueMember:
 
 
 # ---------- League ----------
-@dataclass
+@dataclass(slots=True)
 class League:
     """
     Multiplayer competition container. Owns seasons and state.
@@ -116,7 +119,7 @@ class League:
 
 
 # ---------- Season ----------
-@dataclass
+@dataclass(slots=True)
 class Season:
     """
     One season within a league. Owns weeks and current_week.
@@ -141,7 +144,7 @@ class Season:
 
 
 # ---------- Week ----------
-@dataclass
+@dataclass(slots=True)
 class Week:
     """
     Time progression unit. Only one week may be active per season at a time.
@@ -168,7 +171,7 @@ class Week:
 
 
 # ---------- LeagueMatch (fixture) ----------
-@dataclass
+@dataclass(slots=True)
 class LeagueMatch:
     """
     A scheduled or completed team-vs-team match within a week.
@@ -202,7 +205,7 @@ class LeagueMatch:
 
 
 # ---------- Team ----------
-@dataclass
+@dataclass(slots=True)
 class Team:
     """
     A user's fantasy team, registered to a league. Phase 2: budget.
@@ -232,7 +235,7 @@ class Team:
 
 
 # ---------- TeamPlayer (many-to-many) ----------
-@dataclass
+@dataclass(slots=True)
 class TeamPlayer:
     """
     Links a team to a player. Phase 2: slot 1-7 = active, 8-10 = bench; is_captain (one of 1-7).
@@ -256,7 +259,7 @@ class TeamPlayer:
 
 
 # ---------- TeamMatch (Phase 2) ----------
-@dataclass
+@dataclass(slots=True)
 class TeamMatch:
     """Phase 2: aggregate team-vs-team match (7 active players, captain bonus)."""
     id: str
@@ -270,7 +273,7 @@ class TeamMatch:
 
 
 # ---------- Match ----------
-@dataclass
+@dataclass(slots=True)
 class Match:
     """
     A match between two teams. Stores basic metadata.
@@ -290,6 +293,7 @@ class Match:
     seed: int
     created_at: datetime
     events_json: str | None = None  # optional: serialized point events for replay
+    events_blob: bytes | None = None  # optional: packed analytics columns (simulation.persistence.events_to_blob)
 
     def to_dict(self) -> dict[str, Any]:
         d: dict[str, Any] = {
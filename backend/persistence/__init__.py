@@ -2,7 +2,7 @@
 Persistence layer for fantasy data.
 No business logic, no simulation — only read/write interfaces.
 """
-from .db import get_connection, init_db
+from .db import close_shared, configure_connection, get_connection, get_ro_connection, get_shared_connection, init_db, write_transaction
 from .repositories import (
     UserRepository,
     TeamRepository,
@@ -16,8 +16,13 @@ from .repositories import (
 )
 
 __all__ = [
+    "close_shared",
+    "configure_connection",
     "get_connection",
+    "get_ro_connection",
+    "get_shared_connection",
     "init_db",
+    "write_transaction",
     "UserRepository",
     "TeamRepository",
     "MatchRepository",
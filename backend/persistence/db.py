@@ -4,10 +4,19 @@ Database connection and initialization.
 from __future__ import annotations
 
 import sqlite3
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Callable
+from typing import Callable, Iterator
 
-from .schema import all_schema_sql
+from .schema import all_schema_sql, latest_schema_sql
+
+# Bump both whenever a _run_phase_* step is added or the schema DDL gains a table or index.
+# SCHEMA_VERSION is stored in PRAGMA user_version (read from the DB header, no table lookup): a DB
+# at this version has every table, column and index, so init_db skips migration probing.
+# MIGRATION_REV names the last schema change in meta for humans.
+SCHEMA_VERSION = 2
+MIGRATION_REV = "matches_player_created_indexes"
 
 
 def _run_phase2_migrations(conn: sqlite3.Connection) -> None:
@@ -18,7 +27,7 @@ def _run_phase2_migrations(conn: sqlite3.Connection) -> None:
         conn.execute("ALTER TABLE users ADD COLUMN username TEXT")
         conn.execute("ALTER TABLE users ADD COLUMN password_hash TEXT")
         conn.execute("UPDATE users SET username = id, password_hash = '' WHERE username IS NULL")
-        conn.execute("CREATE UNIQUE INDEX IF NOT EXISTS ix_users_username ON users(username)")
+    conn.execute("CREATE UNIQUE INDEX IF NOT EXISTS ix_users_username ON users(username)")
     cur = conn.execute("PRAGMA table_info(teams)")
     tcols = [row[1] for row in cur.fetchall()]
     if "budget" not in tcols:
@@ -80,6 +89,22 @@ def _run_phase_league_matches_slot_data(conn: sqlite3.Connection) -> None:
         conn.execute("ALTER TABLE league_matches ADD COLUMN slot_data TEXT")
 
 
+def _run_phase_matches_analytics_json(conn: sqlite3.Connection) -> None:
+    """Add analytics_json to matches. Analytics computed once when a match is simulated (matches are immutable)."""
+    cur = conn.execute("PRAGMA table_info(matches)")
+    cols = [row[1] for row in cur.fetchall()]
+    if "analytics_json" not in cols:
+        conn.execute("ALTER TABLE matches ADD COLUMN analytics_json TEXT")
+
+
+def _run_phase_matches_events_blob(conn: sqlite3.Connection) -> None:
+    """Add events_blob to matches. Packed per-point columns for analytics; events_json stays the full replay log."""
+    cur = conn.execute("PRAGMA table_info(matches)")
+    cols = [row[1] for row in cur.fetchall()]
+    if "events_blob" not in cols:
+        conn.execute("ALTER TABLE matches ADD COLUMN events_blob BLOB")
+
+
 # Default DB path (project root / data / app.db)
 def _default_db_path() -> Path:
     return Path(__file__).resolve().parent.parent.parent / "data" / "app.db"
@@ -101,18 +126,223 @@ def get_db_path() -> Path:
     return _default_db_path()
 
 
-def get_connection(db_path: str | Path | None = None) -> sqlite3.Connection:
+# Parent directories already created this process; skips the mkdir/stat syscalls on later connects.
+# If a directory is removed externally, connect() fails and a restart re-creates it.
+_ensured_dirs: set[Path] = set()
+
+
+def _ensure_parent_dir(path: Path) -> None:
+    parent = path.parent
+    if parent not in _ensured_dirs:
+        parent.mkdir(parents=True, exist_ok=True)
+        _ensured_dirs.add(parent)
+
+
+def configure_connection(conn: sqlite3.Connection) -> None:
+    """
+    Apply the read/write PRAGMAs every repository assumes, once per connection.
+    WAL lets readers run alongside the writer and makes a commit an append; synchronous=NORMAL
+    is durable across app crashes in WAL mode and skips the fsync on each commit.
+    (An in-memory DB ignores journal_mode = WAL and stays in "memory" mode.)
+    """
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("PRAGMA synchronous = NORMAL")
+    conn.execute("PRAGMA busy_timeout = 5000")
+    conn.execute("PRAGMA cache_size = -64000")
+    conn.execute("PRAGMA temp_store = MEMORY")
+    conn.execute("PRAGMA mmap_size = 268435456")
+
+
+def get_connection(db_path: str | Path | None = None, check_same_thread: bool = True) -> sqlite3.Connection:
     """
     Return a new SQLite connection.
     Use as context manager or ensure close() is called.
     """
     path = Path(db_path) if db_path else get_db_path()
-    path.parent.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(str(path))
+    _ensure_parent_dir(path)
+    # Larger statement cache: repositories issue a fixed set of SQL strings, so they stay prepared.
+    conn = sqlite3.connect(
+        str(path),
+        cached_statements=256,
+        check_same_thread=check_same_thread,
+    )
     conn.row_factory = sqlite3.Row
+    configure_connection(conn)
     return conn
 
 
+@contextmanager
+def write_transaction(conn: sqlite3.Connection) -> Iterator[sqlite3.Connection]:
+    """
+    Run the block as one BEGIN IMMEDIATE ... COMMIT (ROLLBACK if it raises). IMMEDIATE takes the
+    write lock up front, so a burst of INSERTs never hits a read-to-write lock upgrade mid-way.
+    If the connection already has a transaction open, the block joins it and the owner commits.
+    """
+    if conn.in_transaction:
+        yield conn
+        return
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        yield conn
+    except BaseException:
+        conn.rollback()
+        raise
+    conn.commit()
+
+
+# One long-lived connection per worker thread: keeps the page cache and prepared statements
+# warm across requests instead of connect/PRAGMA/close per request. Per-thread rather than one
+# global connection, so concurrent requests never share a transaction.
+_thread_local = threading.local()
+_shared_lock = threading.Lock()
+_shared_conns: list[sqlite3.Connection] = []
+# Bumped by close_shared. Other threads' _thread_local slots survive that call, so a slot from an
+# older generation holds a closed connection and must be reopened, not reused.
+_shared_generation = 0
+
+
+def get_shared_connection() -> sqlite3.Connection:
+    """
+    Return this thread's connection to get_db_path(), opening it on first use (or after
+    set_db_path changed the path). Do not close it; callers must commit or roll back
+    their own writes. close_shared() closes all of them.
+    """
+    path = get_db_path()
+    conn = getattr(_thread_local, "conn", None)
+    if conn is not None and _thread_local.generation == _shared_generation:
+        if _thread_local.path == path:
+            return conn
+        _discard_shared(conn)
+    conn = get_connection(path, check_same_thread=False)
+    _thread_local.conn = conn
+    _thread_local.path = path
+    with _shared_lock:
+        _shared_conns.append(conn)
+        _thread_local.generation = _shared_generation
+    return conn
+
+
+def _discard_shared(conn: sqlite3.Connection) -> None:
+    with _shared_lock:
+        if conn in _shared_conns:
+            _shared_conns.remove(conn)
+    _optimize_on_close(conn)
+    conn.close()
+
+
+def _optimize_on_close(conn: sqlite3.Connection) -> None:
+    """Refresh planner stats for tables this long-lived connection changed a lot (best effort)."""
+    try:
+        conn.execute("PRAGMA optimize = 0x10002")
+    except sqlite3.Error:
+        pass
+
+
+def close_shared() -> None:
+    """Close every per-thread shared connection (app shutdown, tests)."""
+    global _shared_generation
+    with _shared_lock:
+        conns = _shared_conns[:]
+        _shared_conns.clear()
+        _shared_generation += 1
+    for conn in conns:
+        _optimize_on_close(conn)
+        conn.close()
+    _thread_local.__dict__.clear()
+
+
+def get_ro_connection(db_path: str | Path | None = None) -> sqlite3.Connection:
+    """
+    Return a new read-only SQLite connection for read-only request paths (explain, advisor).
+    Opened with mode=ro and query_only, so it never takes the write lock.
+    Use as context manager or ensure close() is called.
+    """
+    path = Path(db_path) if db_path else get_db_path()
+    conn = sqlite3.connect(
+        path.resolve().as_uri() + "?mode=ro",
+        uri=True,
+        cached_statements=256,
+        check_same_thread=False,
+    )
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA query_only = 1")
+    conn.execute("PRAGMA temp_store = MEMORY")
+    conn.execute("PRAGMA mmap_size = 268435456")
+    return conn
+
+
+_SALARY_BACKFILL_BATCH = 5000
+# meta key present while players.salary has been added but not yet backfilled. It is written in
+# the migration transaction and cleared only after the last batch, so an interrupted backfill
+# is resumed by the next init_db even though user_version is already current.
+_SALARY_BACKFILL_PENDING = "salary_backfill_pending"
+
+
+def _backfill_player_salaries(conn: sqlite3.Connection) -> None:
+    """
+    Set rank-based salaries on players that still have the column default (100), in rowid
+    ranges of _SALARY_BACKFILL_BATCH with a commit per batch, so readers are not blocked
+    for a full-table rewrite. Re-running is harmless.
+    """
+    lo, hi = conn.execute("SELECT MIN(rowid), MAX(rowid) FROM players").fetchone()
+    if lo is not None:
+        for start in range(lo, hi + 1, _SALARY_BACKFILL_BATCH):
+            conn.execute(
+                "UPDATE players SET salary = 70 + CASE WHEN 51 - rank > 80 THEN 80 WHEN 51 - rank < 0 THEN 0 ELSE 51 - rank END "
+                "WHERE rowid BETWEEN ? AND ? AND salary = 100",
+                (start, start + _SALARY_BACKFILL_BATCH - 1),
+            )
+            conn.commit()
+    conn.execute("DELETE FROM meta WHERE key = ?", (_SALARY_BACKFILL_PENDING,))
+    conn.commit()
+
+
+def _create_and_migrate(conn: sqlite3.Connection) -> None:
+    """
+    Create all tables and run every migration phase in one IMMEDIATE transaction, then record
+    SCHEMA_VERSION / MIGRATION_REV. Expects an autocommit connection (isolation_level=None);
+    the caller commits. Phases keep their column probes: pre-versioned DBs can be partially migrated.
+    An empty DB gets the final schema in one script and skips every probe and ALTER.
+    Adding players.salary marks it for _backfill_player_salaries (run by init_db after the commit).
+    """
+    # Players table first (team_players references it). executescript commits any open
+    # transaction before running, so BEGIN is part of the script.
+    from backend.rankings_db import _players_schema
+    if conn.execute("SELECT count(*) FROM sqlite_master").fetchone()[0] == 0:
+        # IF NOT EXISTS keeps this safe if another process creates the schema first
+        conn.executescript("BEGIN IMMEDIATE;\n" + _players_schema() + latest_schema_sql())
+        _record_schema_version(conn)
+        return
+    conn.executescript("BEGIN IMMEDIATE;\n" + _players_schema() + all_schema_sql())
+    # Migration: add gender to teams if missing (existing DBs)
+    cur = conn.execute("PRAGMA table_info(teams)")
+    cols = [row[1] for row in cur.fetchall()]
+    if "gender" not in cols:
+        conn.execute("ALTER TABLE teams ADD COLUMN gender TEXT NOT NULL DEFAULT 'men'")
+    # Migration: add salary to players if missing (Phase 2)
+    cur = conn.execute("PRAGMA table_info(players)")
+    pcols = [row[1] for row in cur.fetchall()]
+    if "salary" not in pcols:
+        conn.execute("ALTER TABLE players ADD COLUMN salary INTEGER NOT NULL DEFAULT 100")
+        conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, '1')", (_SALARY_BACKFILL_PENDING,))
+    _run_phase2_migrations(conn)
+    _run_phase3_league_members(conn)
+    _run_phase_leagues_started_at(conn)
+    _run_phase_league_matches_started_at(conn)
+    _run_phase_league_matches_slot_data(conn)
+    _run_phase_matches_analytics_json(conn)
+    _run_phase_matches_events_blob(conn)
+    # Role system: team_players.role added in _run_phase2_migrations
+    _record_schema_version(conn)
+
+
+def _record_schema_version(conn: sqlite3.Connection) -> None:
+    conn.execute(
+        "INSERT OR REPLACE INTO meta (key, value) VALUES ('migration_rev', ?)", (MIGRATION_REV,)
+    )
+    conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+
 def init_db(
     db_path: str | Path | None = None,
     rankings_path: str | Path | None = None,
@@ -123,34 +353,30 @@ def init_db(
     (uses backend.rankings_db).
     """
     path = Path(db_path) if db_path else get_db_path()
-    path.parent.mkdir(parents=True, exist_ok=True)
+    _ensure_parent_dir(path)
     conn = sqlite3.connect(str(path))
     try:
-        # Players table first (team_players references it)
-        from backend.rankings_db import _players_schema, load_rankings_into_db
-        conn.executescript(_players_schema())
-        # Fantasy tables (users, teams, team_players, matches)
-        conn.executescript(all_schema_sql())
-        # Migration: add gender to teams if missing (existing DBs)
-        cur = conn.execute("PRAGMA table_info(teams)")
-        cols = [row[1] for row in cur.fetchall()]
-        if "gender" not in cols:
-            conn.execute("ALTER TABLE teams ADD COLUMN gender TEXT NOT NULL DEFAULT 'men'")
-        # Migration: add salary to players if missing (Phase 2)
-        cur = conn.execute("PRAGMA table_info(players)")
-        pcols = [row[1] for row in cur.fetchall()]
-        if "salary" not in pcols:
-            conn.execute("ALTER TABLE players ADD COLUMN salary INTEGER NOT NULL DEFAULT 100")
-            conn.execute("UPDATE players SET salary = 70 + CASE WHEN 51 - rank > 80 THEN 80 WHEN 51 - rank < 0 THEN 0 ELSE 51 - rank END")
-        _run_phase2_migrations(conn)
-        _run_phase3_league_members(conn)
-        _run_phase_leagues_started_at(conn)
-        _run_phase_league_matches_started_at(conn)
-        _run_phase_league_matches_slot_data(conn)
-        # Role system: team_players.role added in _run_phase2_migrations
-        conn.commit()
+        # journal_mode is persistent per DB file; set before any read-only connection opens it
+        configure_connection(conn)
+        if conn.execute("PRAGMA user_version").fetchone()[0] < SCHEMA_VERSION:
+            conn.isolation_level = None
+            try:
+                _create_and_migrate(conn)
+                conn.execute("COMMIT")
+            except BaseException:
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK")
+                raise
+            finally:
+                conn.isolation_level = ""
+        # Checked on every start, not only while migrating: resumes a backfill cut off part-way
+        if conn.execute("SELECT 1 FROM meta WHERE key = ?", (_SALARY_BACKFILL_PENDING,)).fetchone():
+            _backfill_player_salaries(conn)
         if rankings_path:
+            from backend.rankings_db import load_rankings_into_db
             load_rankings_into_db(conn, Path(rankings_path))
             conn.commit()
+        # Give the planner sqlite_stat1 data for the indexes created above
+        conn.execute("PRAGMA optimize")
     finally:
         conn.close()
@@ -1,21 +1,45 @@
 """
 Repository interfaces for fantasy data.
 No business logic — only read/write operations.
+
+Write methods never commit: the caller owns the transaction and commits once per unit of
+work (`with write_transaction(conn):`; API handlers get this from db_conn, services wrap their own operations).
 """
 from __future__ import annotations
 
+import functools
 import sqlite3
+import sys
 import uuid
 from datetime import datetime
-from typing import Any
+from typing import Any, Iterable, Iterator
 
 from backend.models import User, Team, TeamPlayer, Match, TeamMatch, League, LeagueMember, Season, Week, LeagueMatch
 
 
-def _parse_datetime(s: str | None) -> datetime:
-    if s is None:
-        raise ValueError("expected datetime string")
-    return datetime.fromisoformat(s.replace("Z", "+00:00"))
+# Every repository turns stored timestamps into datetimes here, so rows parse the same way on any
+# connection (no sqlite3 converters or detect_types needed).
+# Bounded cache: polled endpoints re-read the same rows and thus the same timestamp strings on
+# every request. datetimes are immutable, so sharing them is safe. A cache hit never enters the
+# function body (lru_cache is C).
+@functools.lru_cache(maxsize=1024)
+def _parse_datetime(value: str) -> datetime:
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        # Legacy rows written with a trailing "Z"
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+# Low-cardinality text columns (status, gender) read by list methods: sqlite3 builds a new str per
+# cell, so a listing would otherwise hold one copy of "scheduled" per row.
+_intern = sys.intern
+
+
+def _now_iso_and_dt() -> tuple[str, datetime]:
+    """Current UTC time as (isoformat string to store, datetime to return): one clock read, no re-parse."""
+    now = datetime.utcnow()
+    return now.isoformat(), now
 
 
 # ---------- UserRepository ----------
@@ -24,83 +48,49 @@ def _parse_datetime(s: str | None) -> datetime:
 class UserRepository:
     """CRUD for users. Phase 2: username, password_hash for auth."""
 
+    # Fixed SQL texts, so each maps to one entry in the connection's statement cache. They name
+    # the post-migration columns: init_db brings every DB to SCHEMA_VERSION before repositories run.
+    _INSERT_WITH_PASSWORD_SQL = (
+        "INSERT INTO users (id, username, password_hash, name, created_at) VALUES (?, ?, ?, ?, ?)"
+    )
+    _GET_SQL = "SELECT id, name, created_at, username, password_hash FROM users WHERE id = ?"
+    _GET_BY_USERNAME_SQL = "SELECT id, name, created_at, username, password_hash FROM users WHERE username = ?"
+    _LIST_ALL_SQL = "SELECT id, name, created_at FROM users ORDER BY created_at"
+
     def create(self, conn: sqlite3.Connection, name: str, id: str | None = None) -> User:
-        uid = id or str(uuid.uuid4())
-        now = datetime.utcnow().isoformat()
-        cols = "id, name, created_at"
-        vals = "?, ?, ?"
-        args: tuple = (uid, name, now)
-        if _has_col(conn, "users", "username"):
-            cols += ", username, password_hash"
-            vals += ", ?, ?"
-            args = args + (uid, "")
-        conn.execute(f"INSERT INTO users ({cols}) VALUES ({vals})", args)
-        conn.commit()
-        return self.get(conn, uid) or User(id=uid, name=name, created_at=datetime.fromisoformat(now))
+        uid = id or uuid.uuid4().hex
+        now, created = _now_iso_and_dt()
+        conn.execute(self._INSERT_WITH_PASSWORD_SQL, (uid, uid, "", name, now))
+        return User(id=uid, name=name, created_at=created, username=uid, password_hash="")
 
     def create_with_password(
         self, conn: sqlite3.Connection, username: str, password_hash: str, name: str | None = None
     ) -> User:
-        if not _has_col(conn, "users", "username"):
-            raise RuntimeError("Phase 2 migration missing: users table has no username column")
-        uid = str(uuid.uuid4())
-        now = datetime.utcnow().isoformat()
+        uid = uuid.uuid4().hex
+        now, created = _now_iso_and_dt()
         display_name = name or username
-        conn.execute(
-            "INSERT INTO users (id, username, password_hash, name, created_at) VALUES (?, ?, ?, ?, ?)",
-            (uid, username, password_hash, display_name, now),
-        )
-        conn.commit()
-        return self.get(conn, uid) or User(
-            id=uid, name=display_name, created_at=datetime.fromisoformat(now),
+        conn.execute(self._INSERT_WITH_PASSWORD_SQL, (uid, username, password_hash, display_name, now))
+        return User(
+            id=uid, name=display_name, created_at=created,
             username=username, password_hash=password_hash,
         )
 
     def get(self, conn: sqlite3.Connection, user_id: str) -> User | None:
-        cols = "id, name, created_at"
-        if _has_col(conn, "users", "username"):
-            cols += ", username, password_hash"
-        row = conn.execute(f"SELECT {cols} FROM users WHERE id = ?", (user_id,)).fetchone()
-        if row is None:
-            return None
-        r = dict(row)
-        username = r.get("username")
-        phash = r.get("password_hash")
-        return User(
-            id=r["id"],
-            name=r["name"],
-            created_at=_parse_datetime(r["created_at"]),
-            username=username,
-            password_hash=phash,
-        )
+        cur = conn.cursor()
+        cur.row_factory = None
+        r = cur.execute(self._GET_SQL, (user_id,)).fetchone()
+        return User(r[0], r[1], _parse_datetime(r[2]), r[3], r[4]) if r is not None else None
 
     def get_by_username(self, conn: sqlite3.Connection, username: str) -> User | None:
-        cur = conn.execute(
-            "SELECT id, name, created_at, username, password_hash FROM users WHERE username = ?",
-            (username,),
-        )
-        row = cur.fetchone()
-        if row is None:
-            return None
-        return User(
-            id=row[0],
-            name=row[1],
-            created_at=_parse_datetime(row[2]),
-            username=row[3],
-            password_hash=row[4],
-        )
+        cur = conn.cursor()
+        cur.row_factory = None
+        r = cur.execute(self._GET_BY_USERNAME_SQL, (username,)).fetchone()
+        return User(r[0], r[1], _parse_datetime(r[2]), r[3], r[4]) if r is not None else None
 
     def list_all(self, conn: sqlite3.Connection) -> list[User]:
-        rows = conn.execute("SELECT id, name, created_at FROM users ORDER BY created_at").fetchall()
-        return [
-            User(id=r["id"], name=r["name"], created_at=_parse_datetime(r["created_at"]))
-            for r in rows
-        ]
-
-
-def _has_col(conn: sqlite3.Connection, table: str, col: str) -> bool:
-    cur = conn.execute(f"PRAGMA table_info({table})")
-    return col in [row[1] for row in cur.fetchall()]
+        cur = conn.cursor()
+        cur.row_factory = None
+        return [User(r[0], r[1], _parse_datetime(r[2])) for r in cur.execute(self._LIST_ALL_SQL).fetchall()]
 
 
 # ---------- LeagueRepository ----------
@@ -109,6 +99,15 @@ def _has_col(conn: sqlite3.Connection, table: str, col: str) -> bool:
 class LeagueRepository:
     """CRUD for leagues. No business logic."""
 
+    _SELECT_COLUMNS = "id, name, owner_id, status, max_teams, created_at, started_at"
+    _GET_SQL = f"SELECT {_SELECT_COLUMNS} FROM leagues WHERE id = ?"
+    _LIST_ALL_SQL = f"SELECT {_SELECT_COLUMNS} FROM leagues ORDER BY created_at DESC"
+    _INSERT_SQL = (
+        "INSERT INTO leagues (id, name, owner_id, status, max_teams, created_at) VALUES (?, ?, ?, ?, ?, ?)"
+    )
+    _UPDATE_STATUS_SQL = "UPDATE leagues SET status = ? WHERE id = ?"
+    _UPDATE_STARTED_AT_SQL = "UPDATE leagues SET started_at = ? WHERE id = ?"
+
     def create(
         self,
         conn: sqlite3.Connection,
@@ -117,72 +116,45 @@ class LeagueRepository:
         max_teams: int,
         id: str | None = None,
     ) -> League:
-        lid = id or str(uuid.uuid4())
-        now = datetime.utcnow().isoformat()
-        conn.execute(
-            "INSERT INTO leagues (id, name, owner_id, status, max_teams, created_at) VALUES (?, ?, ?, ?, ?, ?)",
-            (lid, name, owner_id, "open", max_teams, now),
-        )
-        conn.commit()
+        lid = id or uuid.uuid4().hex
+        now, created = _now_iso_and_dt()
+        conn.execute(self._INSERT_SQL, (lid, name, owner_id, "open", max_teams, now))
         return League(
             id=lid, name=name, owner_id=owner_id, status="open", max_teams=max_teams,
-            created_at=datetime.fromisoformat(now),
+            created_at=created,
         )
 
     def get(self, conn: sqlite3.Connection, league_id: str) -> League | None:
-        cols = "id, name, owner_id, status, max_teams, created_at"
-        if _has_col(conn, "leagues", "started_at"):
-            cols += ", started_at"
-        row = conn.execute(
-            f"SELECT {cols} FROM leagues WHERE id = ?",
-            (league_id,),
-        ).fetchone()
+        cur = conn.cursor()
+        cur.row_factory = None
+        row = cur.execute(self._GET_SQL, (league_id,)).fetchone()
         if row is None:
             return None
-        r = dict(row)
-        started_at = _parse_datetime(r["started_at"]) if r.get("started_at") else None
+        id_, name, owner_id, status, max_teams, created_at, started_at = row
         return League(
-            id=r["id"],
-            name=r["name"],
-            owner_id=r["owner_id"],
-            status=r["status"],
-            max_teams=r["max_teams"],
-            created_at=_parse_datetime(r["created_at"]),
-            started_at=started_at,
+            id_, name, owner_id, status, max_teams, _parse_datetime(created_at),
+            _parse_datetime(started_at) if started_at else None,
         )
 
     def update_status(self, conn: sqlite3.Connection, league_id: str, status: str) -> None:
-        conn.execute("UPDATE leagues SET status = ? WHERE id = ?", (status, league_id))
-        conn.commit()
+        conn.execute(self._UPDATE_STATUS_SQL, (status, league_id))
 
     def update_started_at(self, conn: sqlite3.Connection, league_id: str, started_at_iso: str) -> None:
         """Set league.started_at when league is frozen (start)."""
-        if not _has_col(conn, "leagues", "started_at"):
-            return
-        conn.execute("UPDATE leagues SET started_at = ? WHERE id = ?", (started_at_iso, league_id))
-        conn.commit()
+        conn.execute(self._UPDATE_STARTED_AT_SQL, (started_at_iso, league_id))
 
     def list_all(self, conn: sqlite3.Connection) -> list[League]:
-        cols = "id, name, owner_id, status, max_teams, created_at"
-        if _has_col(conn, "leagues", "started_at"):
-            cols += ", started_at"
-        rows = conn.execute(
-            f"SELECT {cols} FROM leagues ORDER BY created_at DESC"
-        ).fetchall()
-        result: list[League] = []
-        for r in rows:
-            rd = dict(r)
-            started_at = _parse_datetime(rd["started_at"]) if rd.get("started_at") else None
-            result.append(League(
-                id=rd["id"],
-                name=rd["name"],
-                owner_id=rd["owner_id"],
-                status=rd["status"],
-                max_teams=rd["max_teams"],
-                created_at=_parse_datetime(rd["created_at"]),
-                started_at=started_at,
-            ))
-        return result
+        # Columns are in League field order, so rows unpack positionally
+        cur = conn.cursor()
+        cur.row_factory = None
+        rows = cur.execute(self._LIST_ALL_SQL).fetchall()
+        return [
+            League(
+                id_, name, owner_id, status, max_teams, _parse_datetime(created_at),
+                _parse_datetime(started_at) if started_at else None,
+            )
+            for id_, name, owner_id, status, max_teams, created_at, started_at in rows
+        ]
 
 
 # ---------- LeagueMemberRepository ----------
@@ -191,6 +163,13 @@ class LeagueRepository:
 class LeagueMemberRepository:
     """CRUD for league_members. One team per user per league."""
 
+    _SELECT_COLUMNS = "league_id, user_id, team_id, joined_at"
+    _INSERT_SQL = "INSERT INTO league_members (league_id, user_id, team_id, joined_at) VALUES (?, ?, ?, ?)"
+    _GET_SQL = f"SELECT {_SELECT_COLUMNS} FROM league_members WHERE league_id = ? AND user_id = ?"
+    _LIST_BY_LEAGUE_SQL = f"SELECT {_SELECT_COLUMNS} FROM league_members WHERE league_id = ? ORDER BY joined_at"
+    _LIST_LEAGUE_IDS_BY_USER_SQL = "SELECT league_id FROM league_members WHERE user_id = ?"
+    _DELETE_SQL = "DELETE FROM league_members WHERE league_id = ? AND user_id = ?"
+
     def create(
         self,
         conn: sqlite3.Connection,
@@ -198,54 +177,39 @@ class LeagueMemberRepository:
         user_id: str,
         team_id: str,
     ) -> LeagueMember:
-        now = datetime.utcnow().isoformat()
-        conn.execute(
-            "INSERT INTO league_members (league_id, user_id, team_id, joined_at) VALUES (?, ?, ?, ?)",
-            (league_id, user_id, team_id, now),
-        )
-        conn.commit()
+        now, created = _now_iso_and_dt()
+        conn.execute(self._INSERT_SQL, (league_id, user_id, team_id, now))
         return LeagueMember(
             league_id=league_id, user_id=user_id, team_id=team_id,
-            joined_at=datetime.fromisoformat(now),
+            joined_at=created,
         )
 
     def get(self, conn: sqlite3.Connection, league_id: str, user_id: str) -> LeagueMember | None:
-        row = conn.execute(
-            "SELECT league_id, user_id, team_id, joined_at FROM league_members WHERE league_id = ? AND user_id = ?",
-            (league_id, user_id),
-        ).fetchone()
+        cur = conn.cursor()
+        cur.row_factory = None
+        row = cur.execute(self._GET_SQL, (league_id, user_id)).fetchone()
         if row is None:
             return None
-        r = dict(row)
-        return LeagueMember(
-            league_id=r["league_id"], user_id=r["user_id"], team_id=r["team_id"],
-            joined_at=_parse_datetime(r["joined_at"]),
-        )
+        return LeagueMember(row[0], row[1], row[2], _parse_datetime(row[3]))
 
     def list_by_league(self, conn: sqlite3.Connection, league_id: str) -> list[LeagueMember]:
-        rows = conn.execute(
-            "SELECT league_id, user_id, team_id, joined_at FROM league_members WHERE league_id = ? ORDER BY joined_at",
-            (league_id,),
-        ).fetchall()
+        cur = conn.cursor()
+        cur.row_factory = None
+        rows = cur.execute(self._LIST_BY_LEAGUE_SQL, (league_id,)).fetchall()
         return [
-            LeagueMember(
-                league_id=r["league_id"], user_id=r["user_id"], team_id=r["team_id"],
-                joined_at=_parse_datetime(r["joined_at"]),
-            )
-            for r in rows
+            LeagueMember(lid, user_id, team_id, _parse_datetime(joined_at))
+            for lid, user_id, team_id, joined_at in rows
         ]
 
     def list_league_ids_by_user(self, conn: sqlite3.Connection, user_id: str) -> list[str]:
         """League IDs where the user is a member (joined)."""
-        rows = conn.execute(
-            "SELECT league_id FROM league_members WHERE user_id = ?",
-            (user_id,),
-        ).fetchall()
-        return [r["league_id"] for r in rows]
+        cur = conn.cursor()
+        cur.row_factory = None
+        rows = cur.execute(self._LIST_LEAGUE_IDS_BY_USER_SQL, (user_id,)).fetchall()
+        return [r[0] for r in rows]
 
     def delete(self, conn: sqlite3.Connection, league_id: str, user_id: str) -> None:
-        conn.execute("DELETE FROM league_members WHERE league_id = ? AND user_id = ?", (league_id, user_id))
-        conn.commit()
+        conn.execute(self._DELETE_SQL, (league_id, user_id))
 
 
 # ---------- SeasonRepository ----------
@@ -254,6 +218,17 @@ class LeagueMemberRepository:
 class SeasonRepository:
     """CRUD for seasons. No business logic."""
 
+    _SELECT_COLUMNS = "id, league_id, season_number, current_week, total_weeks, created_at"
+    _INSERT_SQL = (
+        "INSERT INTO seasons (id, league_id, season_number, current_week, total_weeks, created_at) "
+        "VALUES (?, ?, ?, ?, ?, ?)"
+    )
+    _GET_SQL = f"SELECT {_SELECT_COLUMNS} FROM seasons WHERE id = ?"
+    _GET_CURRENT_FOR_LEAGUE_SQL = (
+        f"SELECT {_SELECT_COLUMNS} FROM seasons WHERE league_id = ? ORDER BY season_number DESC LIMIT 1"
+    )
+    _UPDATE_CURRENT_WEEK_SQL = "UPDATE seasons SET current_week = ? WHERE id = ?"
+
     def create(
         self,
         conn: sqlite3.Connection,
@@ -262,53 +237,32 @@ class SeasonRepository:
         total_weeks: int,
         id: str | None = None,
     ) -> Season:
-        sid = id or str(uuid.uuid4())
-        now = datetime.utcnow().isoformat()
-        conn.execute(
-            "INSERT INTO seasons (id, league_id, season_number, current_week, total_weeks, created_at) VALUES (?, ?, ?, ?, ?, ?)",
-            (sid, league_id, season_number, 1, total_weeks, now),
-        )
-        conn.commit()
+        sid = id or uuid.uuid4().hex
+        now, created = _now_iso_and_dt()
+        conn.execute(self._INSERT_SQL, (sid, league_id, season_number, 1, total_weeks, now))
         return Season(
             id=sid, league_id=league_id, season_number=season_number,
-            current_week=1, total_weeks=total_weeks, created_at=datetime.fromisoformat(now),
+            current_week=1, total_weeks=total_weeks, created_at=created,
         )
 
     def get(self, conn: sqlite3.Connection, season_id: str) -> Season | None:
-        row = conn.execute(
-            "SELECT id, league_id, season_number, current_week, total_weeks, created_at FROM seasons WHERE id = ?",
-            (season_id,),
-        ).fetchone()
+        cur = conn.cursor()
+        cur.row_factory = None
+        row = cur.execute(self._GET_SQL, (season_id,)).fetchone()
         if row is None:
             return None
-        return Season(
-            id=row["id"],
-            league_id=row["league_id"],
-            season_number=row["season_number"],
-            current_week=row["current_week"],
-            total_weeks=row["total_weeks"],
-            created_at=_parse_datetime(row["created_at"]),
-        )
+        return Season(*row[:5], _parse_datetime(row[5]))
 
     def get_current_for_league(self, conn: sqlite3.Connection, league_id: str) -> Season | None:
-        row = conn.execute(
-            "SELECT id, league_id, season_number, current_week, total_weeks, created_at FROM seasons WHERE league_id = ? ORDER BY season_number DESC LIMIT 1",
-            (league_id,),
-        ).fetchone()
+        cur = conn.cursor()
+        cur.row_factory = None
+        row = cur.execute(self._GET_CURRENT_FOR_LEAGUE_SQL, (league_id,)).fetchone()
         if row is None:
             return None
-        return Season(
-            id=row["id"],
-            league_id=row["league_id"],
-            season_number=row["season_number"],
-            current_week=row["current_week"],
-            total_weeks=row["total_weeks"],
-            created_at=_parse_datetime(row["created_at"]),
-        )
+        return Season(*row[:5], _parse_datetime(row[5]))
 
     def update_current_week(self, conn: sqlite3.Connection, season_id: str, current_week: int) -> None:
-        conn.execute("UPDATE seasons SET current_week = ? WHERE id = ?", (current_week, season_id))
-        conn.commit()
+        conn.execute(self._UPDATE_CURRENT_WEEK_SQL, (current_week, season_id))
 
 
 # ---------- WeekRepository ----------
@@ -317,6 +271,19 @@ class SeasonRepository:
 class WeekRepository:
     """CRUD for weeks. No business logic."""
 
+    _SELECT_COLUMNS = "id, season_id, week_number, status, started_at, completed_at, created_at"
+    _INSERT_SQL = f"INSERT INTO weeks ({_SELECT_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?)"
+    _GET_SQL = f"SELECT {_SELECT_COLUMNS} FROM weeks WHERE id = ?"
+    _GET_BY_SEASON_AND_NUMBER_SQL = f"SELECT {_SELECT_COLUMNS} FROM weeks WHERE season_id = ? AND week_number = ?"
+    _LIST_BY_SEASON_SQL = f"SELECT {_SELECT_COLUMNS} FROM weeks WHERE season_id = ? ORDER BY week_number"
+    # One statement per combination of timestamps being set
+    _UPDATE_STATUS_SQL = "UPDATE weeks SET status = ? WHERE id = ?"
+    _UPDATE_STATUS_STARTED_SQL = "UPDATE weeks SET status = ?, started_at = ? WHERE id = ?"
+    _UPDATE_STATUS_COMPLETED_SQL = "UPDATE weeks SET status = ?, completed_at = ? WHERE id = ?"
+    _UPDATE_STATUS_STARTED_COMPLETED_SQL = (
+        "UPDATE weeks SET status = ?, started_at = ?, completed_at = ? WHERE id = ?"
+    )
+
     def create(
         self,
         conn: sqlite3.Connection,
@@ -324,80 +291,57 @@ class WeekRepository:
         week_number: int,
         id: str | None = None,
     ) -> Week:
-        wid = id or str(uuid.uuid4())
-        now = datetime.utcnow().isoformat()
-        conn.execute(
-            "INSERT INTO weeks (id, season_id, week_number, status, started_at, completed_at, created_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
-            (wid, season_id, week_number, "pending", None, None, now),
-        )
-        conn.commit()
+        wid = id or uuid.uuid4().hex
+        now, created = _now_iso_and_dt()
+        conn.execute(self._INSERT_SQL, (wid, season_id, week_number, "pending", None, None, now))
         return Week(
             id=wid, season_id=season_id, week_number=week_number, status="pending",
-            started_at=None, completed_at=None, created_at=datetime.fromisoformat(now),
+            started_at=None, completed_at=None, created_at=created,
+        )
+
+    def bulk_create(self, conn: sqlite3.Connection, season_id: str, week_numbers: Iterable[int]) -> list[Week]:
+        """Insert pending weeks for a season with one executemany. Same rows as create() per week."""
+        now, created = _now_iso_and_dt()
+        weeks = [
+            Week(uuid.uuid4().hex, season_id, n, "pending", None, None, created) for n in week_numbers
+        ]
+        conn.executemany(
+            self._INSERT_SQL,
+            [(w.id, season_id, w.week_number, "pending", None, None, now) for w in weeks],
         )
+        return weeks
 
     def get(self, conn: sqlite3.Connection, week_id: str) -> Week | None:
-        row = conn.execute(
-            "SELECT id, season_id, week_number, status, started_at, completed_at, created_at FROM weeks WHERE id = ?",
-            (week_id,),
-        ).fetchone()
+        cur = conn.cursor()
+        cur.row_factory = None
+        row = cur.execute(self._GET_SQL, (week_id,)).fetchone()
         if row is None:
             return None
-        return Week(
-            id=row["id"],
-            season_id=row["season_id"],
-            week_number=row["week_number"],
-            status=row["status"],
-            started_at=row["started_at"],
-            completed_at=row["completed_at"],
-            created_at=_parse_datetime(row["created_at"]),
-        )
+        return Week(*row[:6], _parse_datetime(row[6]))
 
     def get_by_season_and_number(self, conn: sqlite3.Connection, season_id: str, week_number: int) -> Week | None:
-        row = conn.execute(
-            "SELECT id, season_id, week_number, status, started_at, completed_at, created_at FROM weeks WHERE season_id = ? AND week_number = ?",
-            (season_id, week_number),
-        ).fetchone()
+        cur = conn.cursor()
+        cur.row_factory = None
+        row = cur.execute(self._GET_BY_SEASON_AND_NUMBER_SQL, (season_id, week_number)).fetchone()
         if row is None:
             return None
-        return Week(
-            id=row["id"],
-            season_id=row["season_id"],
-            week_number=row["week_number"],
-            status=row["status"],
-            started_at=row["started_at"],
-            completed_at=row["completed_at"],
-            created_at=_parse_datetime(row["created_at"]),
-        )
+        return Week(*row[:6], _parse_datetime(row[6]))
 
     def list_by_season(self, conn: sqlite3.Connection, season_id: str) -> list[Week]:
-        rows = conn.execute(
-            "SELECT id, season_id, week_number, status, started_at, completed_at, created_at FROM weeks WHERE season_id = ? ORDER BY week_number",
-            (season_id,),
-        ).fetchall()
-        return [
-            Week(
-                id=r["id"],
-                season_id=r["season_id"],
-                week_number=r["week_number"],
-                status=r["status"],
-                started_at=r["started_at"],
-                completed_at=r["completed_at"],
-                created_at=_parse_datetime(r["created_at"]),
-            )
-            for r in rows
-        ]
+        cur = conn.cursor()
+        cur.row_factory = None
+        rows = cur.execute(self._LIST_BY_SEASON_SQL, (season_id,)).fetchall()
+        return [Week(r[0], r[1], r[2], _intern(r[3]), r[4], r[5], _parse_datetime(r[6])) for r in rows]
 
     def update_status(self, conn: sqlite3.Connection, week_id: str, status: str, started_at: str | None = None, completed_at: str | None = None) -> None:
         if started_at is not None and completed_at is not None:
-            conn.execute("UPDATE weeks SET status = ?, started_at = ?, completed_at = ? WHERE id = ?", (status, started_at, completed_at, week_id))
+            conn.execute(self._UPDATE_STATUS_STARTED_COMPLETED_SQL, (status, started_at, completed_at, week_id))
         elif started_at is not None:
-            conn.execute("UPDATE weeks SET status = ?, started_at = ? WHERE id = ?", (status, started_at, week_id))
+            conn.execute(self._UPDATE_STATUS_STARTED_SQL, (status, started_at, week_id))
         elif completed_at is not None:
-            conn.execute("UPDATE weeks SET status = ?, completed_at = ? WHERE id = ?", (status, completed_at, week_id))
+            conn.execute(self._UPDATE_STATUS_COMPLETED_SQL, (status, completed_at, week_id))
         else:
-            conn.execute("UPDATE weeks SET status = ? WHERE id = ?", (status, week_id))
-        conn.commit()
+            conn.execute(self._UPDATE_STATUS_SQL, (status, week_id))
 
 
 # ---------- LeagueMatchRepository ----------
@@ -406,6 +350,38 @@ class WeekRepository:
 class LeagueMatchRepository:
     """CRUD for league_matches (fixtures). No business logic."""
 
+    # Columns are in LeagueMatch field order, so rows unpack positionally
+    _SELECT_COLUMNS = (
+        "id, week_id, home_team_id, away_team_id, home_score, away_score, status, simulation_log, created_at"
+    )
+    _INSERT_SQL = (
+        "INSERT INTO league_matches (id, week_id, home_team_id, away_team_id, home_score, away_score, status, "
+        "simulation_log, created_at) VALUES (?, ?, ?, ?, 0, 0, 'scheduled', NULL, ?)"
+    )
+    _GET_SQL = f"SELECT {_SELECT_COLUMNS} FROM league_matches WHERE id = ?"
+    _LIST_BY_WEEK_SQL = f"SELECT {_SELECT_COLUMNS} FROM league_matches WHERE week_id = ? ORDER BY id"
+    _ITER_BY_SEASON_SQL = (
+        "SELECT m.id, m.week_id, m.home_team_id, m.away_team_id, m.home_score, m.away_score, m.status, "
+        "m.simulation_log, m.created_at FROM weeks w JOIN league_matches m ON m.week_id = w.id "
+        "WHERE w.season_id = ? ORDER BY w.week_number, m.id"
+    )
+    _DISPATCH_SQL = "SELECT id, home_team_id, away_team_id, status FROM league_matches WHERE week_id = ? ORDER BY id"
+    _UPDATE_RESULT_SQL = (
+        "UPDATE league_matches SET home_score = ?, away_score = ?, status = 'completed', simulation_log = ? WHERE id = ?"
+    )
+    _UPDATE_RESULT_WITH_SLOTS_SQL = (
+        "UPDATE league_matches SET home_score = ?, away_score = ?, status = 'completed', simulation_log = ?, "
+        "slot_data = ? WHERE id = ?"
+    )
+    _GET_SLOT_DATA_SQL = "SELECT slot_data FROM league_matches WHERE id = ?"
+    _SET_STATUS_SQL = "UPDATE league_matches SET status = ? WHERE id = ?"
+    _SET_LIVE_SQL = "UPDATE league_matches SET status = ?, started_at = ? WHERE id = ?"
+    _RESET_SQL = (
+        "UPDATE league_matches SET status = 'scheduled', home_score = 0, away_score = 0, simulation_log = NULL, "
+        "slot_data = NULL WHERE id = ?"
+    )
+    _ITER_BATCH = 256
+
     def create(
         self,
         conn: sqlite3.Connection,
@@ -414,58 +390,103 @@ class LeagueMatchRepository:
         away_team_id: str | None,
         id: str | None = None,
     ) -> LeagueMatch:
-        mid = id or str(uuid.uuid4())
-        now = datetime.utcnow().isoformat()
-        conn.execute(
-            "INSERT INTO league_matches (id, week_id, home_team_id, away_team_id, home_score, away_score, status, simulation_log, created_at) VALUES (?, ?, ?, ?, 0, 0, 'scheduled', NULL, ?)",
-            (mid, week_id, home_team_id, away_team_id, now),
-        )
-        conn.commit()
+        mid = id or uuid.uuid4().hex
+        now, created = _now_iso_and_dt()
+        conn.execute(self._INSERT_SQL, (mid, week_id, home_team_id, away_team_id, now))
         return LeagueMatch(
             id=mid, week_id=week_id, home_team_id=home_team_id, away_team_id=away_team_id,
             home_score=0.0, away_score=0.0, status="scheduled", simulation_log=None,
-            created_at=datetime.fromisoformat(now),
+            created_at=created,
+        )
+
+    def bulk_create(
+        self, conn: sqlite3.Connection, fixtures: Iterable[tuple[str, str, str | None]]
+    ) -> list[LeagueMatch]:
+        """
+        Insert scheduled fixtures, given as (week_id, home_team_id, away_team_id), with one
+        executemany. Same rows as create() per fixture; ids and created_at are generated here.
+        """
+        now, created = _now_iso_and_dt()
+        matches = [
+            LeagueMatch(uuid.uuid4().hex, week_id, home, away, 0.0, 0.0, "scheduled", None, created)
+            for week_id, home, away in fixtures
+        ]
+        conn.executemany(
+            self._INSERT_SQL,
+            [(m.id, m.week_id, m.home_team_id, m.away_team_id, now) for m in matches],
         )
+        return matches
 
     def get(self, conn: sqlite3.Connection, league_match_id: str) -> LeagueMatch | None:
-        row = conn.execute(
-            "SELECT id, week_id, home_team_id, away_team_id, home_score, away_score, status, simulation_log, created_at FROM league_matches WHERE id = ?",
-            (league_match_id,),
-        ).fetchone()
+        cur = conn.cursor()
+        cur.row_factory = None
+        row = cur.execute(self._GET_SQL, (league_match_id,)).fetchone()
         if row is None:
             return None
-        return LeagueMatch(
-            id=row["id"],
-            week_id=row["week_id"],
-            home_team_id=row["home_team_id"],
-            away_team_id=row["away_team_id"],
-            home_score=row["home_score"],
-            away_score=row["away_score"],
-            status=row["status"],
-            simulation_log=row["simulation_log"],
-            created_at=_parse_datetime(row["created_at"]),
-        )
+        return LeagueMatch(*row[:8], _parse_datetime(row[8]))
 
     def list_by_week(self, conn: sqlite3.Connection, week_id: str) -> list[LeagueMatch]:
-        rows = conn.execute(
-            "SELECT id, week_id, home_team_id, away_team_id, home_score, away_score, status, simulation_log, created_at FROM league_matches WHERE week_id = ? ORDER BY id",
-            (week_id,),
-        ).fetchall()
+        cur = conn.cursor()
+        cur.row_factory = None
+        rows = cur.execute(self._LIST_BY_WEEK_SQL, (week_id,)).fetchall()
         return [
-            LeagueMatch(
-                id=r["id"],
-                week_id=r["week_id"],
-                home_team_id=r["home_team_id"],
-                away_team_id=r["away_team_id"],
-                home_score=r["home_score"],
-                away_score=r["away_score"],
-                status=r["status"],
-                simulation_log=r["simulation_log"],
-                created_at=_parse_datetime(r["created_at"]),
-            )
+            LeagueMatch(r[0], r[1], r[2], r[3], r[4], r[5], _intern(r[6]), r[7], _parse_datetime(r[8]))
             for r in rows
         ]
 
+    def list_by_week_ids(
+        self, conn: sqlite3.Connection, week_ids: list[str]
+    ) -> dict[str, list[LeagueMatch]]:
+        """
+        Fixtures for several weeks in one query, keyed by week_id (every requested week is a key,
+        possibly with an empty list). Each list is ordered like list_by_week.
+        """
+        by_week: dict[str, list[LeagueMatch]] = {wid: [] for wid in week_ids}
+        if not week_ids:
+            return by_week
+        cur = conn.cursor()
+        cur.row_factory = None
+        rows = cur.execute(
+            f"SELECT {self._SELECT_COLUMNS} FROM league_matches "
+            f"WHERE week_id IN ({', '.join('?' * len(week_ids))}) ORDER BY id",
+            week_ids,
+        ).fetchall()
+        for r in rows:
+            by_week[r[1]].append(
+                LeagueMatch(r[0], r[1], r[2], r[3], r[4], r[5], _intern(r[6]), r[7], _parse_datetime(r[8]))
+            )
+        return by_week
+
+    def iter_by_season(self, conn: sqlite3.Connection, season_id: str) -> Iterator[LeagueMatch]:
+        """
+        Yield every fixture of a season in schedule order (week_number, then as list_by_week),
+        from one query, fetching _ITER_BATCH rows at a time. For callers that fold over a whole
+        season (standings) without keeping it.
+        """
+        cur = conn.cursor()
+        cur.row_factory = None
+        cur.arraysize = self._ITER_BATCH
+        cur.execute(self._ITER_BY_SEASON_SQL, (season_id,))
+        while batch := cur.fetchmany():
+            for r in batch:
+                yield LeagueMatch(r[0], r[1], r[2], r[3], r[4], r[5], _intern(r[6]), r[7], _parse_datetime(r[8]))
+
+    def list_by_week_for_dispatch(
+        self, conn: sqlite3.Connection, week_id: str
+    ) -> list[tuple[str, str, str | None, str]]:
+        """
+        (id, home_team_id, away_team_id, status) per fixture, ordered like list_by_week. For
+        week simulation, which never reads simulation_log; that text is not fetched.
+        """
+        cur = conn.cursor()
+        cur.row_factory = None
+        return cur.execute(self._DISPATCH_SQL, (week_id,)).fetchall()
+
+    def get_slot_data_json(self, conn: sqlite3.Connection, league_match_id: str) -> str | None:
+        """Stored per-slot JSON for a completed match, or None (not found, or no slot data recorded)."""
+        row = conn.execute(self._GET_SLOT_DATA_SQL, (league_match_id,)).fetchone()
+        return row[0] if row is not None else None
+
     def update_result(
         self,
         conn: sqlite3.Connection,
@@ -475,41 +496,27 @@ class LeagueMatchRepository:
         simulation_log: str | None = None,
         slot_data_json: str | None = None,
     ) -> None:
-        if _has_col(conn, "league_matches", "slot_data") and slot_data_json is not None:
+        if slot_data_json is not None:
             conn.execute(
-                "UPDATE league_matches SET home_score = ?, away_score = ?, status = 'completed', simulation_log = ?, slot_data = ? WHERE id = ?",
+                self._UPDATE_RESULT_WITH_SLOTS_SQL,
                 (home_score, away_score, simulation_log, slot_data_json, league_match_id),
             )
         else:
-            conn.execute(
-                "UPDATE league_matches SET home_score = ?, away_score = ?, status = 'completed', simulation_log = ? WHERE id = ?",
-                (home_score, away_score, simulation_log, league_match_id),
-            )
-        conn.commit()
+            conn.execute(self._UPDATE_RESULT_SQL, (home_score, away_score, simulation_log, league_match_id))
 
     def update_status(self, conn: sqlite3.Connection, league_match_id: str, status: str) -> None:
         """Update match status (scheduled | live | completed). For live simulation lifecycle."""
-        conn.execute("UPDATE league_matches SET status = ? WHERE id = ?", (status, league_match_id))
-        if status == "live" and _has_col(conn, "league_matches", "started_at"):
-            now = datetime.utcnow().isoformat()
-            conn.execute("UPDATE league_matches SET started_at = ? WHERE id = ?", (now, league_match_id))
-        conn.commit()
+        if status == "live":
+            # Going live also stamps started_at, in the same statement
+            conn.execute(self._SET_LIVE_SQL, (status, datetime.utcnow().isoformat(), league_match_id))
+        else:
+            conn.execute(self._SET_STATUS_SQL, (status, league_match_id))
 
     def reset_to_scheduled(
         self, conn: sqlite3.Connection, league_match_id: str
     ) -> None:
         """Reset match to scheduled (for testing: rerun live simulation). Clears scores, log, and slot_data."""
-        if _has_col(conn, "league_matches", "slot_data"):
-            conn.execute(
-                "UPDATE league_matches SET status = 'scheduled', home_score = 0, away_score = 0, simulation_log = NULL, slot_data = NULL WHERE id = ?",
-                (league_match_id,),
-            )
-        else:
-            conn.execute(
-                "UPDATE league_matches SET status = 'scheduled', home_score = 0, away_score = 0, simulation_log = NULL WHERE id = ?",
-                (league_match_id,),
-            )
-        conn.commit()
+        conn.execute(self._RESET_SQL, (league_match_id,))
 
 
 # ---------- TeamRepository ----------
@@ -518,6 +525,28 @@ class LeagueMatchRepository:
 class TeamRepository:
     """CRUD for teams and team_players. Phase 2: budget, slot, is_captain."""
 
+    # init_db migrates every table to its latest shape, so each statement has one fixed column list.
+    # Columns are in Team field order, so rows unpack positionally.
+    _SELECT_COLUMNS = "id, user_id, name, gender, created_at, budget, league_id"
+    _GET_SQL = f"SELECT {_SELECT_COLUMNS} FROM teams WHERE id = ?"
+    _GET_WITH_PLAYERS_SQL = (
+        "SELECT t.id, t.user_id, t.name, t.gender, t.created_at, t.budget, t.league_id, tp.player_id "
+        "FROM teams t LEFT JOIN team_players tp ON tp.team_id = t.id WHERE t.id = ? ORDER BY tp.position"
+    )
+    _LIST_BY_USER_SQL = f"SELECT {_SELECT_COLUMNS} FROM teams WHERE user_id = ? ORDER BY created_at"
+    _GET_BY_LEAGUE_AND_USER_SQL = f"SELECT {_SELECT_COLUMNS} FROM teams WHERE league_id = ? AND user_id = ?"
+    _LIST_BY_LEAGUE_SQL = f"SELECT {_SELECT_COLUMNS} FROM teams WHERE league_id = ? ORDER BY created_at"
+    _GET_PLAYERS_SQL = "SELECT player_id FROM team_players WHERE team_id = ? ORDER BY position"
+    _GET_SLOTS_SQL = (
+        "SELECT player_id, slot, is_captain, role FROM team_players WHERE team_id = ? ORDER BY position"
+    )
+    _INSERT_TEAM_SQL = (
+        "INSERT INTO teams (id, user_id, name, gender, budget, league_id, created_at) VALUES (?, ?, ?, ?, ?, ?, ?)"
+    )
+    _INSERT_SLOT_WITH_ROLE_SQL = (
+        "INSERT INTO team_players (team_id, player_id, position, slot, is_captain, role) VALUES (?, ?, ?, ?, ?, ?)"
+    )
+
     def create(
         self,
         conn: sqlite3.Connection,
@@ -529,29 +558,16 @@ class TeamRepository:
         budget: int | None = None,
         league_id: str | None = None,
     ) -> Team:
-        tid = id or str(uuid.uuid4())
-        now = datetime.utcnow().isoformat()
-        cols, vals, args = ["id", "user_id", "name", "gender", "created_at"], ["?", "?", "?", "?", "?"], [tid, user_id, name, gender, now]
-        if _has_col(conn, "teams", "budget") and budget is not None:
-            cols.append("budget"); vals.append("?"); args.append(budget)
-        if _has_col(conn, "teams", "league_id"):
-            cols.append("league_id"); vals.append("?"); args.append(league_id)
-        conn.execute(f"INSERT INTO teams ({', '.join(cols)}) VALUES ({', '.join(vals)})", args)
-        for pos, pid in enumerate(player_ids, start=1):
-            if _has_col(conn, "team_players", "slot"):
-                conn.execute(
-                    "INSERT INTO team_players (team_id, player_id, position, slot, is_captain) VALUES (?, ?, ?, ?, ?)",
-                    (tid, pid, pos, pos, 0),
-                )
-            else:
-                conn.execute(
-                    "INSERT INTO team_players (team_id, player_id, position) VALUES (?, ?, ?)",
-                    (tid, pid, pos),
-                )
-        conn.commit()
+        tid = id or uuid.uuid4().hex
+        now, created = _now_iso_and_dt()
+        conn.execute(self._INSERT_TEAM_SQL, (tid, user_id, name, gender, budget, league_id, now))
+        conn.executemany(
+            self._INSERT_SLOT_WITH_ROLE_SQL,
+            [(tid, pid, pos, pos, 0, None) for pos, pid in enumerate(player_ids, start=1)],
+        )
         return Team(
             id=tid, user_id=user_id, name=name, gender=gender,
-            created_at=datetime.fromisoformat(now), budget=budget, league_id=league_id,
+            created_at=created, budget=budget, league_id=league_id,
         )
 
     def create_phase2(
@@ -566,73 +582,58 @@ class TeamRepository:
         league_id: str | None = None,
     ) -> Team:
         """Phase 2: 10 players, slots 1-7 active 8-10 bench, one captain in 1-7. Optional league_id. Optional role per slot."""
-        tid = id or str(uuid.uuid4())
-        now = datetime.utcnow().isoformat()
-        cols, vals, args = ["id", "user_id", "name", "gender", "budget", "created_at"], ["?", "?", "?", "?", "?", "?"], [tid, user_id, name, gender, budget, now]
-        if _has_col(conn, "teams", "league_id"):
-            cols.append("league_id"); vals.append("?"); args.append(league_id)
-        conn.execute(f"INSERT INTO teams ({', '.join(cols)}) VALUES ({', '.join(vals)})", args)
-        has_role = _has_col(conn, "team_players", "role")
-        for pos, item in enumerate(roster, start=1):
-            pid, slot, is_captain = item[0], item[1], item[2]
-            role = item[3] if len(item) > 3 else None
-            if has_role:
-                conn.execute(
-                    "INSERT INTO team_players (team_id, player_id, position, slot, is_captain, role) VALUES (?, ?, ?, ?, ?, ?)",
-                    (tid, pid, pos, slot, 1 if is_captain else 0, role),
-                )
-            else:
-                conn.execute(
-                    "INSERT INTO team_players (team_id, player_id, position, slot, is_captain) VALUES (?, ?, ?, ?, ?)",
-                    (tid, pid, pos, slot, 1 if is_captain else 0),
-                )
-        conn.commit()
+        tid = id or uuid.uuid4().hex
+        now, created = _now_iso_and_dt()
+        conn.execute(self._INSERT_TEAM_SQL, (tid, user_id, name, gender, budget, league_id, now))
+        conn.executemany(
+            self._INSERT_SLOT_WITH_ROLE_SQL,
+            [
+                # role is optional: 3-tuples (player_id, slot, is_captain) get NULL
+                (tid, pid, pos, slot, 1 if is_captain else 0, role[0] if role else None)
+                for pos, (pid, slot, is_captain, *role) in enumerate(roster, start=1)
+            ],
+        )
         return Team(
             id=tid, user_id=user_id, name=name, gender=gender,
-            created_at=datetime.fromisoformat(now), budget=budget, league_id=league_id,
+            created_at=created, budget=budget, league_id=league_id,
         )
 
     def get(self, conn: sqlite3.Connection, team_id: str) -> Team | None:
-        cols = "id, user_id, name, gender, created_at"
-        if _has_col(conn, "teams", "budget"):
-            cols += ", budget"
-        if _has_col(conn, "teams", "league_id"):
-            cols += ", league_id"
-        row = conn.execute(f"SELECT {cols} FROM teams WHERE id = ?", (team_id,)).fetchone()
-        if row is None:
+        cur = conn.cursor()
+        cur.row_factory = None
+        r = cur.execute(self._GET_SQL, (team_id,)).fetchone()
+        if r is None:
             return None
-        r = dict(row)
-        return Team(
-            id=r["id"],
-            user_id=r["user_id"],
-            name=r["name"],
-            gender=r["gender"] if "gender" in r.keys() else "men",
-            created_at=_parse_datetime(r["created_at"]),
-            budget=r.get("budget"),
-            league_id=r.get("league_id"),
-        )
+        return Team(r[0], r[1], r[2], r[3] or "men", _parse_datetime(r[4]), r[5], r[6])
+
+    def get_with_players(self, conn: sqlite3.Connection, team_id: str) -> tuple[Team, list[str]] | None:
+        """
+        Team plus its player_ids (ordered by position) in one query: teams LEFT JOIN team_players,
+        one row per player. Same result as get() followed by get_players().
+        """
+        cur = conn.cursor()
+        cur.row_factory = None
+        rows = cur.execute(self._GET_WITH_PLAYERS_SQL, (team_id,)).fetchall()
+        if not rows:
+            return None
+        r = rows[0]
+        team = Team(r[0], r[1], r[2], r[3] or "men", _parse_datetime(r[4]), r[5], r[6])
+        return team, [row[7] for row in rows if row[7] is not None]
 
     def get_players(self, conn: sqlite3.Connection, team_id: str) -> list[str]:
         """Return player_ids for team, ordered by position."""
-        rows = conn.execute(
-            "SELECT player_id FROM team_players WHERE team_id = ? ORDER BY position",
-            (team_id,),
-        ).fetchall()
-        return [r["player_id"] for r in rows]
+        cur = conn.cursor()
+        cur.row_factory = None
+        return [r[0] for r in cur.execute(self._GET_PLAYERS_SQL, (team_id,)).fetchall()]
 
     def get_players_with_slots(
         self, conn: sqlite3.Connection, team_id: str
     ) -> list[tuple[str, int, bool, str | None]]:
-        """Phase 2: (player_id, slot, is_captain, role) ordered by position. role is None when column absent or unset."""
-        if not _has_col(conn, "team_players", "slot"):
-            ids = self.get_players(conn, team_id)
-            return [(pid, i, False, None) for i, pid in enumerate(ids, start=1)]
-        has_role = _has_col(conn, "team_players", "role")
-        sel = "SELECT player_id, slot, is_captain" + (", role" if has_role else "") + " FROM team_players WHERE team_id = ? ORDER BY position"
-        rows = conn.execute(sel, (team_id,)).fetchall()
-        if has_role:
-            return [(r["player_id"], r["slot"], bool(r["is_captain"]), r["role"]) for r in rows]
-        return [(r["player_id"], r["slot"], bool(r["is_captain"]), None) for r in rows]
+        """Phase 2: (player_id, slot, is_captain, role) ordered by position. role is None when unset."""
+        cur = conn.cursor()
+        cur.row_factory = None
+        rows = cur.execute(self._GET_SLOTS_SQL, (team_id,)).fetchall()
+        return [(pid, slot, bool(cap), role) for pid, slot, cap, role in rows]
 
     def get_active_player_ids(self, conn: sqlite3.Connection, team_id: str) -> list[str]:
         """Phase 2: player_ids for slots 1-7 only."""
@@ -646,6 +647,22 @@ class TeamRepository:
         with_slots = self.get_players_with_slots(conn, team_id)
         return [(r[0], r[3] if len(r) > 3 else None) for r in with_slots if 1 <= r[1] <= 7]
 
+    def get_active_roster_and_captain(
+        self, conn: sqlite3.Connection, team_id: str
+    ) -> tuple[list[tuple[str, str | None]], str | None]:
+        """
+        (player_id, role) for slots 1-7 in order, plus the captain's player_id (or None), from
+        one roster read. For callers that need both; same results as the separate helpers.
+        """
+        roster: list[tuple[str, str | None]] = []
+        captain: str | None = None
+        for pid, slot, is_captain, role in self.get_players_with_slots(conn, team_id):
+            if 1 <= slot <= 7:
+                roster.append((pid, role))
+            if is_captain and captain is None:
+                captain = pid
+        return roster, captain
+
     def get_captain_id(self, conn: sqlite3.Connection, team_id: str) -> str | None:
         """Phase 2: player_id who is captain."""
         with_slots = self.get_players_with_slots(conn, team_id)
@@ -655,80 +672,43 @@ class TeamRepository:
         return None
 
     def list_by_user(self, conn: sqlite3.Connection, user_id: str) -> list[Team]:
-        cols = "id, user_id, name, gender, created_at"
-        if _has_col(conn, "teams", "budget"):
-            cols += ", budget"
-        if _has_col(conn, "teams", "league_id"):
-            cols += ", league_id"
-        rows = conn.execute(
-            f"SELECT {cols} FROM teams WHERE user_id = ? ORDER BY created_at",
-            (user_id,),
-        ).fetchall()
-        has_league = _has_col(conn, "teams", "league_id")
-        result = []
-        for r in rows:
-            d = dict(r)
-            result.append(
-                Team(
-                    id=d["id"],
-                    user_id=d["user_id"],
-                    name=d["name"],
-                    gender=d.get("gender") or "men",
-                    created_at=_parse_datetime(d["created_at"]),
-                    budget=d.get("budget"),
-                    league_id=d.get("league_id") if has_league else None,
-                )
-            )
-        return result
+        cur = conn.cursor()
+        cur.row_factory = None
+        rows = cur.execute(self._LIST_BY_USER_SQL, (user_id,)).fetchall()
+        return [Team(r[0], r[1], r[2], _intern(r[3] or "men"), _parse_datetime(r[4]), r[5], r[6]) for r in rows]
 
     def get_by_league_and_user(self, conn: sqlite3.Connection, league_id: str, user_id: str) -> Team | None:
         """One team per user per league. Returns None if no team in that league."""
-        if not _has_col(conn, "teams", "league_id"):
-            return None
-        cols = "id, user_id, name, gender, created_at, budget, league_id"
-        row = conn.execute(
-            f"SELECT {cols} FROM teams WHERE league_id = ? AND user_id = ?",
-            (league_id, user_id),
-        ).fetchone()
-        if row is None:
+        cur = conn.cursor()
+        cur.row_factory = None
+        r = cur.execute(self._GET_BY_LEAGUE_AND_USER_SQL, (league_id, user_id)).fetchone()
+        if r is None:
             return None
-        r = dict(row)
-        return Team(
-            id=r["id"], user_id=r["user_id"], name=r["name"],
-            gender=r["gender"] if r.get("gender") else "men",
-            created_at=_parse_datetime(r["created_at"]),
-            budget=r.get("budget"), league_id=r.get("league_id"),
-        )
+        return Team(r[0], r[1], r[2], r[3] or "men", _parse_datetime(r[4]), r[5], r[6])
 
     def list_by_league(self, conn: sqlite3.Connection, league_id: str) -> list[Team]:
         """All teams registered to a league."""
-        if not _has_col(conn, "teams", "league_id"):
-            return []
-        cols = "id, user_id, name, gender, created_at, budget, league_id"
-        rows = conn.execute(
-            f"SELECT {cols} FROM teams WHERE league_id = ? ORDER BY created_at",
-            (league_id,),
-        ).fetchall()
-        result = []
-        for r in rows:
-            d = dict(r)
-            result.append(
-                Team(
-                    id=d["id"], user_id=d["user_id"], name=d["name"],
-                    gender=d.get("gender") or "men",
-                    created_at=_parse_datetime(d["created_at"]),
-                    budget=d.get("budget"), league_id=d.get("league_id"),
-                )
-            )
-        return result
+        cur = conn.cursor()
+        cur.row_factory = None
+        rows = cur.execute(self._LIST_BY_LEAGUE_SQL, (league_id,)).fetchall()
+        return [Team(r[0], r[1], r[2], _intern(r[3] or "men"), _parse_datetime(r[4]), r[5], r[6]) for r in rows]
 
 
 # ---------- TeamMatchRepository (Phase 2) ----------
 
 
+def _team_match_row_factory(cursor: sqlite3.Cursor, row: tuple[Any, ...]) -> TeamMatch:
+    """Cursor row_factory for TeamMatchRepository selects: columns are in TeamMatch field order."""
+    return TeamMatch(*row[:7], _parse_datetime(row[7]))
+
+
 class TeamMatchRepository:
     """CRUD for team_matches (aggregate 7v7 with captain bonus)."""
 
+    _COLUMNS = "id, team_a_id, team_b_id, score_a, score_b, captain_a_id, captain_b_id"
+    _INSERT_SQL = f"INSERT INTO team_matches ({_COLUMNS}, created_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+    _GET_SQL = f"SELECT {_COLUMNS}, created_at FROM team_matches WHERE id = ?"
+
     def create(
         self,
         conn: sqlite3.Connection,
@@ -740,16 +720,12 @@ class TeamMatchRepository:
         captain_b_id: str | None,
         id: str | None = None,
     ) -> TeamMatch:
-        tid = id or str(uuid.uuid4())
-        now = datetime.utcnow().isoformat()
+        tid = id or uuid.uuid4().hex
+        now, created = _now_iso_and_dt()
         conn.execute(
-            """INSERT INTO team_matches (
-                id, team_a_id, team_b_id, score_a, score_b,
-                captain_a_id, captain_b_id, created_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+            self._INSERT_SQL,
             (tid, team_a_id, team_b_id, score_a, score_b, captain_a_id, captain_b_id, now),
         )
-        conn.commit()
         return TeamMatch(
             id=tid,
             team_a_id=team_a_id,
@@ -758,36 +734,57 @@ class TeamMatchRepository:
             score_b=score_b,
             captain_a_id=captain_a_id,
             captain_b_id=captain_b_id,
-            created_at=datetime.fromisoformat(now),
+            created_at=created,
         )
 
     def get(self, conn: sqlite3.Connection, team_match_id: str) -> TeamMatch | None:
-        row = conn.execute(
-            """SELECT id, team_a_id, team_b_id, score_a, score_b,
-                      captain_a_id, captain_b_id, created_at
-               FROM team_matches WHERE id = ?""",
-            (team_match_id,),
-        ).fetchone()
-        if row is None:
-            return None
-        return TeamMatch(
-            id=row["id"],
-            team_a_id=row["team_a_id"],
-            team_b_id=row["team_b_id"],
-            score_a=row["score_a"],
-            score_b=row["score_b"],
-            captain_a_id=row["captain_a_id"],
-            captain_b_id=row["captain_b_id"],
-            created_at=_parse_datetime(row["created_at"]),
-        )
+        cur = conn.cursor()
+        cur.row_factory = _team_match_row_factory
+        return cur.execute(self._GET_SQL, (team_match_id,)).fetchone()
 
 
 # ---------- MatchRepository ----------
 
 
+def _match_row_factory(cursor: sqlite3.Cursor, row: tuple[Any, ...]) -> Match:
+    """Cursor row_factory for MatchRepository selects: columns are in Match field order."""
+    return Match(*row[:10], _parse_datetime(row[10]), row[11], row[12])
+
+
 class MatchRepository:
     """CRUD for matches."""
 
+    _COLUMNS = (
+        "id, team_a_id, team_b_id, player_a_id, player_b_id, "
+        "winner_id, sets_a, sets_b, best_of, seed, created_at, events_json, events_blob"
+    )
+    _INSERT_SQL = f"INSERT INTO matches ({_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+    _GET_SQL = f"SELECT {_COLUMNS} FROM matches WHERE id = ?"
+    _LIST_RECENT_SQL = f"SELECT {_COLUMNS} FROM matches ORDER BY created_at DESC LIMIT ?"
+    # One bounded seek per side (ix_matches_player_a_created / _b_created) instead of an OR,
+    # which cannot use either index for the ORDER BY; the outer query keeps the newer of the two.
+    _MOST_RECENT_FOR_PLAYER_SQL = (
+        "SELECT * FROM ("
+        f"SELECT * FROM (SELECT {_COLUMNS} FROM matches WHERE player_a_id = ? ORDER BY created_at DESC LIMIT 1) "
+        "UNION ALL "
+        f"SELECT * FROM (SELECT {_COLUMNS} FROM matches WHERE player_b_id = ? ORDER BY created_at DESC LIMIT 1)"
+        ") ORDER BY created_at DESC LIMIT 1"
+    )
+    # Metadata only (no event payloads) for column-oriented bulk reads
+    _SUMMARY_FIELDS = (
+        "id", "team_a_id", "team_b_id", "player_a_id", "player_b_id",
+        "winner_id", "sets_a", "sets_b", "best_of", "seed", "created_at",
+    )
+    _LIST_RECENT_COLUMNS_SQL = (
+        "SELECT id, team_a_id, team_b_id, player_a_id, player_b_id, "
+        "winner_id, sets_a, sets_b, best_of, seed, created_at "
+        "FROM matches ORDER BY created_at DESC LIMIT ?"
+    )
+    _ITER_BATCH = 256
+    # analytics_json is guaranteed by init_db (SCHEMA_VERSION), so these run without a column probe
+    _UPDATE_ANALYTICS_SQL = "UPDATE matches SET analytics_json = ? WHERE id = ?"
+    _GET_ANALYTICS_SQL = "SELECT analytics_json FROM matches WHERE id = ?"
+
     def create(
         self,
         conn: sqlite3.Connection,
@@ -802,14 +799,12 @@ class MatchRepository:
         seed: int,
         events_json: str | None = None,
         id: str | None = None,
+        events_blob: bytes | None = None,
     ) -> Match:
-        mid = id or str(uuid.uuid4())
-        now = datetime.utcnow().isoformat()
+        mid = id or uuid.uuid4().hex
+        now, created = _now_iso_and_dt()
         conn.execute(
-            """INSERT INTO matches (
-                id, team_a_id, team_b_id, player_a_id, player_b_id,
-                winner_id, sets_a, sets_b, best_of, seed, created_at, events_json
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+            self._INSERT_SQL,
             (
                 mid,
                 team_a_id,
@@ -823,9 +818,9 @@ class MatchRepository:
                 seed,
                 now,
                 events_json,
+                events_blob,
             ),
         )
-        conn.commit()
         return Match(
             id=mid,
             team_a_id=team_a_id,
@@ -837,84 +832,99 @@ class MatchRepository:
             sets_b=sets_b,
             best_of=best_of,
             seed=seed,
-            created_at=datetime.fromisoformat(now),
+            created_at=created,
             events_json=events_json,
+            events_blob=events_blob,
         )
 
-    def get(self, conn: sqlite3.Connection, match_id: str) -> Match | None:
-        row = conn.execute(
-            """SELECT id, team_a_id, team_b_id, player_a_id, player_b_id,
-                      winner_id, sets_a, sets_b, best_of, seed, created_at, events_json
-               FROM matches WHERE id = ?""",
-            (match_id,),
-        ).fetchone()
-        if row is None:
-            return None
-        return Match(
-            id=row["id"],
-            team_a_id=row["team_a_id"],
-            team_b_id=row["team_b_id"],
-            player_a_id=row["player_a_id"],
-            player_b_id=row["player_b_id"],
-            winner_id=row["winner_id"],
-            sets_a=row["sets_a"],
-            sets_b=row["sets_b"],
-            best_of=row["best_of"],
-            seed=row["seed"],
-            created_at=_parse_datetime(row["created_at"]),
-            events_json=row["events_json"],
-        )
-
-    def list_recent(self, conn: sqlite3.Connection, limit: int = 50) -> list[Match]:
-        rows = conn.execute(
-            """SELECT id, team_a_id, team_b_id, player_a_id, player_b_id,
-                      winner_id, sets_a, sets_b, best_of, seed, created_at, events_json
-               FROM matches ORDER BY created_at DESC LIMIT ?""",
-            (limit,),
-        ).fetchall()
-        return [
+    def bulk_create(self, conn: sqlite3.Connection, items: Iterable[dict[str, Any]]) -> list[Match]:
+        """
+        Insert many matches with one executemany. Each item holds create()'s keyword arguments
+        (team_a_id ... seed required; events_json, id, events_blob optional). Ids and created_at
+        are generated here, so nothing is read back.
+        """
+        matches = [
             Match(
-                id=r["id"],
-                team_a_id=r["team_a_id"],
-                team_b_id=r["team_b_id"],
-                player_a_id=r["player_a_id"],
-                player_b_id=r["player_b_id"],
-                winner_id=r["winner_id"],
-                sets_a=r["sets_a"],
-                sets_b=r["sets_b"],
-                best_of=r["best_of"],
-                seed=r["seed"],
-                created_at=_parse_datetime(r["created_at"]),
-                events_json=r["events_json"],
+                id=item.get("id") or uuid.uuid4().hex,
+                team_a_id=item["team_a_id"],
+                team_b_id=item["team_b_id"],
+                player_a_id=item["player_a_id"],
+                player_b_id=item["player_b_id"],
+                winner_id=item["winner_id"],
+                sets_a=item["sets_a"],
+                sets_b=item["sets_b"],
+                best_of=item["best_of"],
+                seed=item["seed"],
+                created_at=datetime.utcnow(),
+                events_json=item.get("events_json"),
+                events_blob=item.get("events_blob"),
             )
-            for r in rows
+            for item in items
         ]
+        conn.executemany(
+            self._INSERT_SQL,
+            [
+                (
+                    m.id, m.team_a_id, m.team_b_id, m.player_a_id, m.player_b_id, m.winner_id,
+                    m.sets_a, m.sets_b, m.best_of, m.seed, m.created_at.isoformat(),
+                    m.events_json, m.events_blob,
+                )
+                for m in matches
+            ],
+        )
+        return matches
+
+    def get(self, conn: sqlite3.Connection, match_id: str) -> Match | None:
+        cur = conn.cursor()
+        cur.row_factory = _match_row_factory
+        return cur.execute(self._GET_SQL, (match_id,)).fetchone()
+
+    def update_analytics(self, conn: sqlite3.Connection, match_id: str, analytics_json: str) -> None:
+        """Store precomputed analytics (JSON) for a match."""
+        conn.execute(self._UPDATE_ANALYTICS_SQL, (analytics_json, match_id))
+
+    def get_analytics_json(self, conn: sqlite3.Connection, match_id: str) -> str | None:
+        """Return stored analytics JSON, or None if the match has none (not found or simulated before analytics were stored)."""
+        row = conn.execute(self._GET_ANALYTICS_SQL, (match_id,)).fetchone()
+        return row[0] if row is not None else None
+
+    def list_recent(self, conn: sqlite3.Connection, limit: int = 50) -> list[Match]:
+        # Rows come back as Match objects: positional construction, no per-column name lookups
+        cur = conn.cursor()
+        cur.row_factory = _match_row_factory
+        return cur.execute(self._LIST_RECENT_SQL, (limit,)).fetchall()
+
+    def iter_recent(self, conn: sqlite3.Connection, limit: int = 50) -> Iterator[Match]:
+        """
+        Yield recent matches newest first, fetching _ITER_BATCH rows at a time. Only one batch of
+        raw rows is alive at once, so large limits don't hold every row and every Match together.
+        """
+        cur = conn.cursor()
+        cur.row_factory = _match_row_factory
+        cur.arraysize = self._ITER_BATCH
+        cur.execute(self._LIST_RECENT_SQL, (limit,))
+        while batch := cur.fetchmany():
+            yield from batch
+
+    def list_recent_columns(self, conn: sqlite3.Connection, limit: int = 50) -> dict[str, tuple[Any, ...]]:
+        """
+        Recent match metadata as parallel columns ({"id": (...), "winner_id": (...), ...}),
+        newest first. For aggregating callers that read a few fields across many matches;
+        no Match objects or event payloads are built.
+        """
+        cur = conn.cursor()
+        cur.row_factory = None
+        rows = cur.execute(self._LIST_RECENT_COLUMNS_SQL, (limit,)).fetchall()
+        if not rows:
+            return {name: () for name in self._SUMMARY_FIELDS}
+        columns = dict(zip(self._SUMMARY_FIELDS, zip(*rows)))
+        columns["created_at"] = tuple(map(_parse_datetime, columns["created_at"]))
+        return columns
 
     def get_most_recent_for_player(
         self, conn: sqlite3.Connection, player_id: str
     ) -> Match | None:
         """Return the most recent match where this player participated (as player_a or player_b)."""
-        row = conn.execute(
-            """SELECT id, team_a_id, team_b_id, player_a_id, player_b_id,
-                      winner_id, sets_a, sets_b, best_of, seed, created_at, events_json
-               FROM matches
-               WHERE player_a_id = ? OR player_b_id = ?
-               ORDER BY created_at DESC LIMIT 1""",
-            (player_id, player_id),
-        ).fetchone()
-        if row is None:
-            return None
-        return Match(
-            id=row["id"],
-            team_a_id=row["team_a_id"],
-            team_b_id=row["team_b_id"],
-            player_a_id=row["player_a_id"],
-            player_b_id=row["player_b_id"],
-            winner_id=row["winner_id"],
-            sets_a=row["sets_a"],
-            sets_b=row["sets_b"],
-            best_of=row["best_of"],
-            seed=row["seed"],
-            created_at=_parse_datetime(row["created_at"]),
-            events_json=row["events_json"],
-        )
+        cur = conn.cursor()
+        cur.row_factory = _match_row_factory
+        return cur.execute(self._MOST_RECENT_FOR_PLAYER_SQL, (player_id, player_id)).fetchone()
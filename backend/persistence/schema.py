@@ -1,6 +1,7 @@
 """
 SQLite schema for fantasy entities.
-Migration-friendly: each table created with IF NOT EXISTS.
+Migration-friendly: each table created with IF NOT EXISTS, already carrying its final columns
+(existing DBs gain them through the ALTER phases in db.py).
 """
 from __future__ import annotations
 
@@ -10,10 +11,12 @@ def users_schema() -> str:
     CREATE TABLE IF NOT EXISTS users (
         id TEXT PRIMARY KEY,
         name TEXT NOT NULL,
-        created_at TEXT NOT NULL
+        created_at TEXT NOT NULL,
+        username TEXT,
+        password_hash TEXT
     );
     """
-    # Phase 2 columns username, password_hash added via migration
+    # ix_users_username is created by migration (existing DBs) or latest_schema_sql (fresh DBs)
 
 
 def leagues_schema() -> str:
@@ -26,6 +29,7 @@ def leagues_schema() -> str:
         status TEXT NOT NULL DEFAULT 'open',
         max_teams INTEGER NOT NULL,
         created_at TEXT NOT NULL,
+        started_at TEXT,
         FOREIGN KEY (owner_id) REFERENCES users(id)
     );
     CREATE INDEX IF NOT EXISTS ix_leagues_owner ON leagues(owner_id);
@@ -98,6 +102,8 @@ def league_matches_schema() -> str:
         status TEXT NOT NULL DEFAULT 'scheduled',
         simulation_log TEXT,
         created_at TEXT NOT NULL,
+        started_at TEXT,
+        slot_data TEXT,
         FOREIGN KEY (week_id) REFERENCES weeks(id),
         FOREIGN KEY (home_team_id) REFERENCES teams(id),
         FOREIGN KEY (away_team_id) REFERENCES teams(id)
@@ -181,6 +187,8 @@ def matches_schema() -> str:
         seed INTEGER NOT NULL,
         created_at TEXT NOT NULL,
         events_json TEXT,
+        analytics_json TEXT,
+        events_blob BLOB,
         FOREIGN KEY (team_a_id) REFERENCES teams(id),
         FOREIGN KEY (team_b_id) REFERENCES teams(id),
         FOREIGN KEY (player_a_id) REFERENCES players(id),
@@ -189,6 +197,18 @@ def matches_schema() -> str:
     CREATE INDEX IF NOT EXISTS ix_matches_team_a ON matches(team_a_id);
     CREATE INDEX IF NOT EXISTS ix_matches_team_b ON matches(team_b_id);
     CREATE INDEX IF NOT EXISTS ix_matches_created_at ON matches(created_at);
+    CREATE INDEX IF NOT EXISTS ix_matches_player_a_created ON matches(player_a_id, created_at);
+    CREATE INDEX IF NOT EXISTS ix_matches_player_b_created ON matches(player_b_id, created_at);
+    """
+
+
+def meta_schema() -> str:
+    """Key/value bookkeeping (e.g. migration_rev, so init_db can skip migration probing)."""
+    return """
+    CREATE TABLE IF NOT EXISTS meta (
+        key TEXT PRIMARY KEY,
+        value TEXT NOT NULL
+    );
     """
 
 
@@ -205,4 +225,19 @@ def all_schema_sql() -> str:
         team_players_schema(),
         matches_schema(),
         team_matches_schema(),
+        meta_schema(),
     ])
+
+
+def migrated_column_indexes_schema() -> str:
+    """Indexes on columns older DBs only gain via migration (the migration phases create them there)."""
+    return """
+    CREATE UNIQUE INDEX IF NOT EXISTS ix_users_username ON users(username);
+    CREATE UNIQUE INDEX IF NOT EXISTS ix_teams_league_user ON teams(league_id, user_id) WHERE league_id IS NOT NULL;
+    CREATE INDEX IF NOT EXISTS ix_teams_league ON teams(league_id);
+    """
+
+
+def latest_schema_sql() -> str:
+    """Full current schema for an empty DB: every table with its final columns, plus all indexes."""
+    return all_schema_sql() + migrated_column_indexes_schema()
@@ -42,7 +42,7 @@ def _salary_from_rank_and_points(rank: int, points: int) -> int:
     return max(50, min(180, round(raw)))
 
 
-@dataclass
+@dataclass(slots=True)
 class PlayerRow:
     """One row from the players table (rankings + simulation stats)."""
     id: str
@@ -183,53 +183,55 @@ def load_rankings_into_db(conn: sqlite3.Connection, rankings_path: Path) -> None
         ))
     cur = conn.cursor()
     cur.execute("DELETE FROM players")
-    for row in rows:
-        cur.execute(
-            """INSERT OR REPLACE INTO players (
-                id, name, country, gender, rank, points, salary,
-                serve_multiplier, rally_short_pct, rally_medium_pct, rally_long_pct,
-                style_forehand, style_backhand, style_service,
-                clutch_modifier, streak_bias, fatigue_sensitivity
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-            row.to_tuple(),
-        )
+    cur.executemany(
+        """INSERT OR REPLACE INTO players (
+            id, name, country, gender, rank, points, salary,
+            serve_multiplier, rally_short_pct, rally_medium_pct, rally_long_pct,
+            style_forehand, style_backhand, style_service,
+            clutch_modifier, streak_bias, fatigue_sensitivity
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+        [row.to_tuple() for row in rows],
+    )
     conn.commit()
 
 
+_PLAYER_COLUMNS = (
+    "id, name, country, gender, rank, points, salary, "
+    "serve_multiplier, rally_short_pct, rally_medium_pct, rally_long_pct, "
+    "style_forehand, style_backhand, style_service, "
+    "clutch_modifier, streak_bias, fatigue_sensitivity"
+)
+
+
+def _tuple_cursor(conn: sqlite3.Connection) -> sqlite3.Cursor:
+    """Cursor returning plain tuples: _PLAYER_COLUMNS is in PlayerRow field order, so PlayerRow(*row)."""
+    cur = conn.cursor()
+    cur.row_factory = None
+    return cur
+
+
 def get_player(conn: sqlite3.Connection, player_id: str) -> PlayerRow | None:
     """Fetch one player by id."""
-    cur = conn.execute(
-        "SELECT id, name, country, gender, rank, points, salary, "
-        "serve_multiplier, rally_short_pct, rally_medium_pct, rally_long_pct, "
-        "style_forehand, style_backhand, style_service, "
-        "clutch_modifier, streak_bias, fatigue_sensitivity FROM players WHERE id = ?",
+    row = _tuple_cursor(conn).execute(
+        f"SELECT {_PLAYER_COLUMNS} FROM players WHERE id = ?",
         (player_id,),
-    )
-    row = cur.fetchone()
+    ).fetchone()
     if row is None:
         return None
-    n = len(row)
-    salary = row[6] if n > 6 else _salary_from_rank_and_points(row[4], row[5])
-    off = 1 if n > 6 else 0  # offset when salary column present
-    return PlayerRow(
-        id=row[0],
-        name=row[1],
-        country=row[2],
-        gender=row[3],
-        rank=row[4],
-        points=row[5],
-        salary=salary,
-        serve_multiplier=row[6 + off],
-        rally_short_pct=row[7 + off],
-        rally_medium_pct=row[8 + off],
-        rally_long_pct=row[9 + off],
-        style_forehand=row[10 + off],
-        style_backhand=row[11 + off],
-        style_service=row[12 + off],
-        clutch_modifier=row[13 + off],
-        streak_bias=row[14 + off],
-        fatigue_sensitivity=row[15 + off],
-    )
+    return PlayerRow(*row)
+
+
+def get_players_by_ids(conn: sqlite3.Connection, player_ids: list[str]) -> dict[str, PlayerRow]:
+    """Fetch many players in one IN query. Returns id -> row; missing ids are omitted."""
+    ids = list(dict.fromkeys(player_ids))
+    if not ids:
+        return {}
+    placeholders = ", ".join("?" * len(ids))
+    rows = _tuple_cursor(conn).execute(
+        f"SELECT {_PLAYER_COLUMNS} FROM players WHERE id IN ({placeholders})",
+        ids,
+    ).fetchall()
+    return {row[0]: PlayerRow(*row) for row in rows}
 
 
 def list_players_by_gender(
@@ -238,39 +240,10 @@ def list_players_by_gender(
     limit: int | None = None,
 ) -> list[PlayerRow]:
     """List players of one gender, ordered by rank."""
-    sql = "SELECT id, name, country, gender, rank, points, salary, " \
-          "serve_multiplier, rally_short_pct, rally_medium_pct, rally_long_pct, " \
-          "style_forehand, style_backhand, style_service, " \
-          "clutch_modifier, streak_bias, fatigue_sensitivity " \
-          "FROM players WHERE gender = ? ORDER BY rank"
+    sql = f"SELECT {_PLAYER_COLUMNS} FROM players WHERE gender = ? ORDER BY rank"
     if limit is not None:
         sql += f" LIMIT {int(limit)}"
-    cur = conn.execute(sql, (gender,))
-    out = []
-    for row in cur.fetchall():
-        n = len(row)
-        salary = row[6] if n > 6 else _salary_from_rank_and_points(row[4], row[5])
-        off = 1 if n > 6 else 0
-        out.append(PlayerRow(
-            id=row[0],
-            name=row[1],
-            country=row[2],
-            gender=row[3],
-            rank=row[4],
-            points=row[5],
-            salary=salary,
-            serve_multiplier=row[6 + off],
-            rally_short_pct=row[7 + off],
-            rally_medium_pct=row[8 + off],
-            rally_long_pct=row[9 + off],
-            style_forehand=row[10 + off],
-            style_backhand=row[11 + off],
-            style_service=row[12 + off],
-            clutch_modifier=row[13 + off],
-            streak_bias=row[14 + off],
-            fatigue_sensitivity=row[15 + off],
-        ))
-    return out
+    return [PlayerRow(*row) for row in _tuple_cursor(conn).execute(sql, (gender,)).fetchall()]
 
 
 def build_profile_from_row(
@@ -330,9 +303,20 @@ def build_profile_store_for_match(
     Build a ProfileStore with profiles for both players, with baseline_point_win
     aligned to their relative points (for simulation engine).
     """
+    rows = get_players_by_ids(conn, [player_a_id, player_b_id])
+    return build_profile_store_from_rows(rows.get(player_a_id), rows.get(player_b_id), version)
+
+
+def build_profile_store_from_rows(
+    row_a: PlayerRow | None,
+    row_b: PlayerRow | None,
+    version: str = "v1",
+) -> ProfileStore:
+    """
+    The profile alignment behind build_profile_store_for_match, for rows already fetched
+    (e.g. via get_players_by_ids). Raises ValueError if either row is missing.
+    """
     from .simulation.profiles import ProfileStore
-    row_a = get_player(conn, player_a_id)
-    row_b = get_player(conn, player_b_id)
     if not row_a or not row_b:
         raise ValueError("Both players must exist in DB")
     store = ProfileStore()
@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import json
 import os
+from functools import lru_cache
 from typing import Any
 
 try:
@@ -23,12 +24,52 @@ STUB_EXPLANATION = (
 )
 
 
+# JSON schema for advisor output (module constant, not rebuilt per request).
+_RESPONSE_FORMAT: dict[str, Any] = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "role_advisor_response",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "recommendations": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "player_id": {"type": "string"},
+                            "player_name": {"type": "string"},
+                            "suggested_role": {"type": "string"},
+                            "why_fit": {"type": "string"},
+                            "risk": {"type": "string"},
+                        },
+                        "required": ["player_id", "player_name", "suggested_role", "why_fit", "risk"],
+                        "additionalProperties": False,
+                    },
+                },
+                "explanation": {"type": "string"},
+                "tradeoffs": {"type": "string"},
+            },
+            "required": ["recommendations", "explanation", "tradeoffs"],
+            "additionalProperties": False,
+        },
+    },
+}
+
+
 def _get_client() -> Any | None:
     if not HAS_OPENAI:
         return None
     api_key = os.environ.get("OPENAI_API_KEY", "").strip()
     if not api_key:
         return None
+    return _client_for_key(api_key)
+
+
+@lru_cache(maxsize=4)
+def _client_for_key(api_key: str) -> Any:
+    """One OpenAI client (and its HTTP connection pool) per API key, reused across calls."""
     return OpenAI(api_key=api_key)
 
 
@@ -46,37 +87,7 @@ def call_llm_advisor(messages: list[dict[str, str]]) -> tuple[list[dict[str, Any
             model="gpt-4o-mini",
             messages=messages,
             temperature=0,
-            response_format={
-                "type": "json_schema",
-                "json_schema": {
-                    "name": "role_advisor_response",
-                    "strict": True,
-                    "schema": {
-                        "type": "object",
-                        "properties": {
-                            "recommendations": {
-                                "type": "array",
-                                "items": {
-                                    "type": "object",
-                                    "properties": {
-                                        "player_id": {"type": "string"},
-                                        "player_name": {"type": "string"},
-                                        "suggested_role": {"type": "string"},
-                                        "why_fit": {"type": "string"},
-                                        "risk": {"type": "string"},
-                                    },
-                                    "required": ["player_id", "player_name", "suggested_role", "why_fit", "risk"],
-                                    "additionalProperties": False,
-                                },
-                            },
-                            "explanation": {"type": "string"},
-                            "tradeoffs": {"type": "string"},
-                        },
-                        "required": ["recommendations", "explanation", "tradeoffs"],
-                        "additionalProperties": False,
-                    },
-                },
-            },
+            response_format=_RESPONSE_FORMAT,
             max_tokens=1024,
         )
     except Exception as e:
@@ -7,7 +7,7 @@ from dataclasses import dataclass, field
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class RoleRecommendation:
     """One recommendation: player + suggested role + why + risk."""
     player_id: str
@@ -17,7 +17,7 @@ class RoleRecommendation:
     risk: str
 
 
-@dataclass
+@dataclass(slots=True)
 class RoleAdvisorResponse:
     """Response from the role advisor endpoint. Advisory only; no state change."""
     recommendations: list[RoleRecommendation]
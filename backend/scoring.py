@@ -258,32 +258,19 @@ def aggregate_stats_from_events(
     won_deciding_b = False
 
     for ev in events:
-        if hasattr(ev, "outcome"):
-            winner = ev.outcome.winner_id
-            shot = _shot_type_key(getattr(ev.outcome, "shot_type", "") or "")
-        else:
+        # One type check per event; score_before/score_after are not needed here.
+        if isinstance(ev, dict):
             o = ev.get("outcome", {})
             winner = o.get("winner_id", "")
             shot = _shot_type_key(o.get("shot_type", "") or "")
-
-        if hasattr(ev, "set_index"):
-            si = ev.set_index
-        else:
             si = ev.get("set_index", 0)
-        if hasattr(ev, "score_before"):
-            sb = ev.score_before
-        else:
-            sb = tuple(ev.get("score_before", (0, 0)))
-        if hasattr(ev, "score_after"):
-            sa_after = ev.score_after
-        else:
-            sa_after = tuple(ev.get("score_after", (0, 0)))
-        if hasattr(ev, "get") and callable(getattr(ev, "get", None)):
             streak_broken = ev.get("streak_broken", False)
-            streak_continuing = ev.get("streak_continuing")
         else:
+            o = ev.outcome
+            winner = o.winner_id
+            shot = _shot_type_key(getattr(o, "shot_type", "") or "")
+            si = ev.set_index
             streak_broken = getattr(ev, "streak_broken", False)
-            streak_continuing = getattr(ev, "streak_continuing", None)
 
         # New set: flush previous set and check comeback
         if si != current_set:
@@ -8,6 +8,7 @@ import sqlite3
 from datetime import datetime, timezone
 
 from backend.models import LeagueStatus
+from backend.persistence.db import write_transaction
 from backend.persistence.repositories import (
     LeagueRepository,
     LeagueMemberRepository,
@@ -50,7 +51,8 @@ _VALID_TRANSITIONS: dict[str, set[str]] = {
 class LeagueService:
     """
     Domain logic for leagues: status transitions, week sequencing, guards.
-    Persistence is delegated to repositories.
+    Persistence is delegated to repositories. Each mutating operation is one transaction:
+    it commits on success and rolls back entirely if it raises.
     """
 
     def __init__(self) -> None:
@@ -75,7 +77,8 @@ class LeagueService:
             raise LeagueTransitionError(
                 f"Invalid transition: {current} -> {new_status}. Allowed from {current}: {allowed}"
             )
-        self._league_repo.update_status(conn, league_id, new_status)
+        with write_transaction(conn):
+            self._league_repo.update_status(conn, league_id, new_status)
 
     def can_simulate_week(self, conn: sqlite3.Connection, league_id: str) -> bool:
         """Simulation is only allowed when league is active."""
@@ -148,26 +151,23 @@ class LeagueService:
             raise ValueError("Schedule generation produced no fixtures")
         weeks_set = {f["week_number"] for f in fixtures}
         total_weeks = max(weeks_set)
-        # Create season and weeks
-        season = self._season_repo.create(
-            conn, league_id, season_number=1, total_weeks=total_weeks
-        )
-        week_ids_by_number: dict[int, str] = {}
-        for w in range(1, total_weeks + 1):
-            week = self._week_repo.create(conn, season.id, w)
-            week_ids_by_number[w] = week.id
-        for f in fixtures:
-            wnum = f["week_number"]
-            week_id = week_ids_by_number[wnum]
-            self._league_match_repo.create(
-                conn, week_id,
-                home_team_id=f["home_team_id"],
-                away_team_id=f["away_team_id"],
+        # Season, weeks, fixtures and the freeze commit together
+        with write_transaction(conn):
+            season = self._season_repo.create(
+                conn, league_id, season_number=1, total_weeks=total_weeks
             )
-        # Freeze league: status = active, started_at = now. No more teams or roster changes.
-        now_iso = datetime.now(timezone.utc).isoformat()
-        self._league_repo.update_status(conn, league_id, LeagueStatus.ACTIVE)
-        self._league_repo.update_started_at(conn, league_id, now_iso)
+            week_ids_by_number = {
+                week.week_number: week.id
+                for week in self._week_repo.bulk_create(conn, season.id, range(1, total_weeks + 1))
+            }
+            self._league_match_repo.bulk_create(conn, (
+                (week_ids_by_number[f["week_number"]], f["home_team_id"], f["away_team_id"])
+                for f in fixtures
+            ))
+            # Freeze league: status = active, started_at = now. No more teams or roster changes.
+            now_iso = datetime.now(timezone.utc).isoformat()
+            self._league_repo.update_status(conn, league_id, LeagueStatus.ACTIVE)
+            self._league_repo.update_started_at(conn, league_id, now_iso)
 
     def fast_forward_week(
         self, conn: sqlite3.Connection, league_id: str, seed: int | None = None
@@ -188,28 +188,30 @@ class LeagueService:
         week = self._week_repo.get_by_season_and_number(conn, season.id, season.current_week)
         if week is None:
             raise ValueError(f"Week {season.current_week} not found")
-        matches = self._league_match_repo.list_by_week(conn, week.id)
-        for m in matches:
-            if m.status == "completed":
+        fixtures = self._league_match_repo.list_by_week_for_dispatch(conn, week.id)
+        # Simulate first (read-only, CPU-bound) so the write lock is held only for the UPDATEs;
+        # all results for the week and the week advance still commit once.
+        results: list[tuple[str, float, float, str | None]] = []
+        for match_id, home_team_id, away_team_id, status in fixtures:
+            if status == "completed":
                 continue
-            if m.away_team_id is None:
+            if away_team_id is None:
                 # Bye: home wins by default (0-0 or no points)
-                self._league_match_repo.update_result(
-                    conn, m.id, 0.0, 0.0, simulation_log="Bye"
-                )
+                results.append((match_id, 0.0, 0.0, "Bye"))
                 continue
             result = run_team_match_simulation(
-                conn, m.home_team_id, m.away_team_id, seed=seed, best_of=5
-            )
-            self._league_match_repo.update_result(
-                conn, m.id,
-                result["home_score"], result["away_score"],
-                simulation_log=result.get("explanation"),
+                conn, home_team_id, away_team_id, seed=seed, best_of=5
             )
-        now = datetime.now(timezone.utc).isoformat()
-        self._week_repo.update_status(conn, week.id, "completed", completed_at=now)
-        next_week = season.current_week + 1
-        if next_week > season.total_weeks:
-            self._league_repo.update_status(conn, league_id, LeagueStatus.COMPLETED)
-        else:
-            self._season_repo.update_current_week(conn, season.id, next_week)
+            results.append((match_id, result["home_score"], result["away_score"], result.get("explanation")))
+        with write_transaction(conn):
+            for match_id, home_score, away_score, simulation_log in results:
+                self._league_match_repo.update_result(
+                    conn, match_id, home_score, away_score, simulation_log=simulation_log
+                )
+            now = datetime.now(timezone.utc).isoformat()
+            self._week_repo.update_status(conn, week.id, "completed", completed_at=now)
+            next_week = season.current_week + 1
+            if next_week > season.total_weeks:
+                self._league_repo.update_status(conn, league_id, LeagueStatus.COMPLETED)
+            else:
+                self._season_repo.update_current_week(conn, season.id, next_week)
@@ -14,7 +14,7 @@ from backend.rankings_db import build_profile_store_for_match, get_player
 from backend.persistence.repositories import TeamRepository
 from backend.roles import parse_role, apply_role_to_fantasy_score, RoleContext
 from backend.scoring import aggregate_stats_from_events, compute_fantasy_score
-from backend.simulation.persistence import event_to_dict
+from backend.simulation.persistence import event_to_dict, events_to_blob
 from backend.simulation.schemas import MatchConfig
 from backend.simulation.orchestrator import MatchOrchestrator, sets_to_win_match
 
@@ -46,18 +46,16 @@ def run_team_match_simulation(
     if home_team.gender != away_team.gender:
         raise ValueError("Teams must be the same gender (men vs men or women vs women)")
 
-    active_home = team_repo.get_active_player_ids(conn, home_team_id)
-    active_away = team_repo.get_active_player_ids(conn, away_team_id)
+    # One roster read per team for active players, roles and captain
+    roster_home, captain_home = team_repo.get_active_roster_and_captain(conn, home_team_id)
+    roster_away, captain_away = team_repo.get_active_roster_and_captain(conn, away_team_id)
+    active_home = [pid for pid, _ in roster_home]
+    active_away = [pid for pid, _ in roster_away]
     if len(active_home) != TEAM_ACTIVE:
         raise ValueError(f"Home team must have exactly {TEAM_ACTIVE} active players (slots 1-7)")
     if len(active_away) != TEAM_ACTIVE:
         raise ValueError(f"Away team must have exactly {TEAM_ACTIVE} active players (slots 1-7)")
 
-    captain_home = team_repo.get_captain_id(conn, home_team_id)
-    captain_away = team_repo.get_captain_id(conn, away_team_id)
-    roster_home = team_repo.get_active_roster_with_roles(conn, home_team_id)
-    roster_away = team_repo.get_active_roster_with_roles(conn, away_team_id)
-
     score_home = 0.0
     score_away = 0.0
     highlights: list[dict[str, Any]] = []
@@ -132,6 +130,7 @@ def run_team_match_simulation(
             "sets_a": sets_h,
             "sets_b": sets_a,
             "events_json": events_json,
+            "events_blob": events_to_blob(events, player_h_id),
             "points_a": round(fantasy_h, 1),
             "points_b": round(fantasy_a, 1),
             "seed": slot_seed,
@@ -5,7 +5,7 @@ Applies adjustments between sets (momentum carryover, fatigue recovery).
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Callable, Iterator
+from typing import Callable, Iterable, Iterator
 
 from .schemas import (
     PointEvent,
@@ -81,6 +81,17 @@ class MatchOrchestrator:
             return self.config.player_a_id
         return self.config.player_b_id
 
+    @classmethod
+    def run_batch(
+        cls,
+        jobs: Iterable[tuple[MatchConfig, ProfileStore]],
+    ) -> list[list[PointEvent]]:
+        """
+        Run several independent matches to completion; returns one event list per job, in order.
+        Each match keeps its own seeded RNG, so results equal running them one at a time.
+        """
+        return [list(cls(config, store).run()) for config, store in jobs]
+
     def run(
         self,
         on_point: Callable[[PointEvent], None] | None = None,
@@ -104,78 +115,85 @@ class MatchOrchestrator:
             completed=False,
             winner_id=None,
         )
-        best_of = self.config.best_of
-        to_win_set = self.config.games_to_win_set
-        win_by = self.config.win_by
+        config = self.config
+        best_of = config.best_of
+        to_win_set = config.games_to_win_set
+        win_by = config.win_by
         sets_needed = sets_to_win_match(best_of)
         events_list: list[PointEvent] = []
+        # Hot loop: bind per-match constants and bound methods once instead of
+        # re-resolving attributes on every point. RNG call order is unchanged,
+        # so a given seed still replays the same match.
+        match_id = config.match_id
+        a_id = config.player_a_id
+        b_id = config.player_b_id
+        pa = self._pa
+        pb = self._pb
+        sens_a = pa.fatigue_sensitivity
+        sens_b = pb.fatigue_sensitivity
+        sample_point = self.point_sim.sample_point
+        update_fatigue = self.fatigue_model.update_after_point
+        momentum = state.momentum
+        fatigue_a = state.fatigue_a
+        fatigue_b = state.fatigue_b
 
         while not state.completed:
             if max_points is not None and state.point_index >= max_points:
                 break
 
+            set_state = state.set_state
             ctx = MatchContext(
                 server_id=state.server_id,
-                games_a=state.set_state.games_a,
-                games_b=state.set_state.games_b,
+                games_a=set_state.games_a,
+                games_b=set_state.games_b,
                 set_index=state.set_index,
                 best_of=best_of,
-                momentum=state.momentum,
-                fatigue_a=state.fatigue_a.level,
-                fatigue_b=state.fatigue_b.level,
+                momentum=momentum,
+                fatigue_a=fatigue_a.level,
+                fatigue_b=fatigue_b.level,
                 points_in_set=state.points_in_current_set,
                 to_win=to_win_set,
                 win_by=win_by,
             )
-            outcome, rally_length, probs = self.point_sim.sample_point(
-                self._pa,
-                self._pb,
-                ctx,
-                self.config.player_a_id,
-                self.config.player_b_id,
-            )
+            outcome, rally_length, probs = sample_point(pa, pb, ctx, a_id, b_id)
             # Capture streak state before updating (for streak_broken tag)
-            was_b_on_streak_3_plus = state.momentum.streak_b >= 3
-            was_a_on_streak_3_plus = state.momentum.streak_a >= 3
+            was_b_on_streak_3_plus = momentum.streak_b >= 3
+            was_a_on_streak_3_plus = momentum.streak_a >= 3
 
-            score_before = (state.set_state.games_a, state.set_state.games_b)
-            if outcome.winner_id == self.config.player_a_id:
-                state.set_state.games_a += 1
-                state.momentum.record_point(True)
+            score_before = (set_state.games_a, set_state.games_b)
+            a_won = outcome.winner_id == a_id
+            if a_won:
+                set_state.games_a += 1
             else:
-                state.set_state.games_b += 1
-                state.momentum.record_point(False)
-            state.set_state.points_played += 1
+                set_state.games_b += 1
+            momentum.record_point(a_won)
+            set_state.points_played += 1
             state.points_in_current_set += 1
             state.point_index += 1
+            games_a = set_state.games_a
+            games_b = set_state.games_b
 
             # Fatigue update
-            self.fatigue_model.update_after_point(
-                state.fatigue_a,
-                state.fatigue_b,
-                rally_length,
-                state.set_state.games_a,
-                state.set_state.games_b,
-                self._pa.fatigue_sensitivity,
-                self._pb.fatigue_sensitivity,
-            )
+            update_fatigue(fatigue_a, fatigue_b, rally_length, games_a, games_b, sens_a, sens_b)
 
-            score_after = (state.set_state.games_a, state.set_state.games_b)
-            set_scores_before = tuple(state.set_scores)
+            score_after = (games_a, games_b)
+            set_scores = state.set_scores
+            set_scores_before = tuple(set_scores)
             streak_continuing = None
-            if state.momentum.streak_a >= 2 and outcome.winner_id == self.config.player_a_id:
-                streak_continuing = self.config.player_a_id
-            elif state.momentum.streak_b >= 2 and outcome.winner_id == self.config.player_b_id:
-                streak_continuing = self.config.player_b_id
-            streak_broken = (outcome.winner_id == self.config.player_a_id and was_b_on_streak_3_plus) or (
-                outcome.winner_id == self.config.player_b_id and was_a_on_streak_3_plus
-            )
-            deciding = state.set_index == best_of - 1 and max(state.set_scores) == sets_needed - 1
+            if a_won:
+                if momentum.streak_a >= 2:
+                    streak_continuing = a_id
+                streak_broken = was_b_on_streak_3_plus
+            else:
+                if momentum.streak_b >= 2:
+                    streak_continuing = b_id
+                streak_broken = was_a_on_streak_3_plus
+            deciding = state.set_index == best_of - 1 and max(set_scores) == sets_needed - 1
             comeback = False  # optional: detect comeback threshold
 
             # Check set winner and update set scores for event
-            winner = set_won(state.set_state.games_a, state.set_state.games_b, to_win_set, win_by)
-            set_scores_after_list = list(state.set_scores)
+            winner = set_won(games_a, games_b, to_win_set, win_by)
+            set_scores_after_list = list(set_scores)
             if winner == "a":
                 set_scores_after_list[0] += 1
             elif winner == "b":
@@ -183,10 +201,10 @@ class MatchOrchestrator:
             set_scores_after = tuple(set_scores_after_list)
 
             event = PointEvent(
-                match_id=self.config.match_id,
+                match_id=match_id,
                 point_index=state.point_index,
                 set_index=state.set_index,
-                game_index=state.set_state.games_a + state.set_state.games_b - 1,
+                game_index=games_a + games_b - 1,
                 score_before=score_before,
                 score_after=score_after,
                 set_scores_before=set_scores_before,
@@ -206,29 +224,25 @@ class MatchOrchestrator:
                 probabilities_snapshot={"p_a_wins": probs.p_a_wins, "p_b_wins": probs.p_b_wins} if probs else None,
             )
             events_list.append(event)
-            state.set_scores = list(set_scores_after_list)
+            state.set_scores = set_scores_after_list
 
             # Alternate server every 2 points within set
-            points_in_set = state.set_state.games_a + state.set_state.games_b
+            points_in_set = games_a + games_b
             if points_in_set >= 2 and points_in_set % 2 == 0:
-                state.server_id = (
-                    self.config.player_b_id
-                    if state.server_id == self.config.player_a_id
-                    else self.config.player_a_id
-                )
+                state.server_id = b_id if state.server_id == a_id else a_id
 
             if on_point:
                 on_point(event)
             yield event
 
             if winner is not None:
-                self.fatigue_model.recover_between_sets(state.fatigue_a, state.fatigue_b)
-                if state.set_scores[0] >= sets_needed or state.set_scores[1] >= sets_needed:
+                self.fatigue_model.recover_between_sets(fatigue_a, fatigue_b)
+                if set_scores_after_list[0] >= sets_needed or set_scores_after_list[1] >= sets_needed:
                     state.completed = True
-                    state.winner_id = self.config.player_a_id if state.set_scores[0] >= sets_needed else self.config.player_b_id
+                    state.winner_id = a_id if set_scores_after_list[0] >= sets_needed else b_id
                     break
                 # Next set
                 state.set_index += 1
                 state.set_state = SetState(0, 0, 0)
                 state.points_in_current_set = 0
-                state.server_id = self.config.player_b_id if state.server_id == self.config.player_a_id else self.config.player_a_id
+                state.server_id = b_id if state.server_id == a_id else a_id
@@ -5,6 +5,8 @@ for exact replay; store per-match and per-player summaries for backtesting.
 from __future__ import annotations
 
 import json
+import sys
+from array import array
 from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import Any
@@ -48,6 +50,80 @@ def event_to_dict(e: PointEvent) -> dict[str, Any]:
     }
 
 
+# ---------- Packed event columns (events_blob) ----------
+# Analytics and scoring only need winner, server, shot type, set, rally length and
+# streak_broken. Those are stored column-wise (SoA): n flag bytes, n shot-code bytes,
+# n set-index bytes, then n little-endian uint16 rally lengths — 5 bytes per point
+# instead of a full JSON object. events_json stays the full record for replay.
+_SHOT_CODES = ("forehand", "backhand", "service", "unforced_error")
+_SHOT_INDEX = {s: i for i, s in enumerate(_SHOT_CODES)}
+_NO_SHOT = 255
+_FLAG_WINNER_B = 1
+_FLAG_SERVER_B = 2
+_FLAG_STREAK_BROKEN = 4
+
+
+def events_to_blob(events: list[PointEvent], player_a_id: str) -> bytes:
+    """Pack the analytics columns of a match's events into a compact binary blob."""
+    flags = bytearray()
+    shots = bytearray()
+    sets = bytearray()
+    rallies = array("H")
+    for e in events:
+        o = e.outcome
+        f = 0
+        if o.winner_id != player_a_id:
+            f |= _FLAG_WINNER_B
+        if e.server_id != player_a_id:
+            f |= _FLAG_SERVER_B
+        if e.streak_broken:
+            f |= _FLAG_STREAK_BROKEN
+        flags.append(f)
+        shots.append(_SHOT_INDEX.get(o.shot_type, _NO_SHOT))
+        sets.append(e.set_index)
+        rallies.append(min(e.rally_length, 0xFFFF))
+    if sys.byteorder == "big":
+        rallies.byteswap()
+    return bytes(flags + shots + sets) + rallies.tobytes()
+
+
+def events_from_blob(
+    blob: bytes,
+    player_a_id: str,
+    player_b_id: str,
+    set_scores_after: tuple[int, int],
+) -> list[dict[str, Any]]:
+    """
+    Unpack events_to_blob output into compact event dicts (the fields analytics and
+    scoring read). set_scores_after is the final set score, attached to the last event.
+    """
+    n = len(blob) // 5
+    flags = blob[:n]
+    shots = blob[n:2 * n]
+    sets = blob[2 * n:3 * n]
+    rallies = array("H", blob[3 * n:5 * n])
+    if sys.byteorder == "big":
+        rallies.byteswap()
+    ids = (player_a_id, player_b_id)
+    events: list[dict[str, Any]] = []
+    for f, shot, si, rally in zip(flags, shots, sets, rallies):
+        winner_b = f & _FLAG_WINNER_B
+        events.append({
+            "set_index": si,
+            "server_id": ids[1 if f & _FLAG_SERVER_B else 0],
+            "outcome": {
+                "winner_id": ids[1 if winner_b else 0],
+                "loser_id": ids[0 if winner_b else 1],
+                "shot_type": _SHOT_CODES[shot] if shot < len(_SHOT_CODES) else "",
+            },
+            "rally_length": rally,
+            "streak_broken": bool(f & _FLAG_STREAK_BROKEN),
+        })
+    if events:
+        events[-1]["set_scores_after"] = list(set_scores_after)
+    return events
+
+
 def save_replay(
     events: list[PointEvent],
     config: MatchConfig,
@@ -23,16 +23,15 @@ RALLY_LENGTH_BY_CATEGORY = {
     RallyLengthCategory.MEDIUM: (4, 7),
     RallyLengthCategory.LONG: (8, 15),
 }
+_SHOT_TYPES = (ShotType.FOREHAND, ShotType.BACKHAND, ShotType.SERVICE)
+_RALLY_CATEGORIES = (RallyLengthCategory.SHORT, RallyLengthCategory.MEDIUM, RallyLengthCategory.LONG)
 
 
 def sample_shot_type(rng: SeededRNG, weights: tuple[float, float, float]) -> ShotType:
     """Sample forehand / backhand / service from weights."""
-    choices = [ShotType.FOREHAND, ShotType.BACKHAND, ShotType.SERVICE]
-    w = list(weights)
-    total = sum(w)
-    if total <= 0:
-        return rng.choice(choices)
-    return rng.choices(choices, weights=w, k=1)[0]
+    if sum(weights) <= 0:
+        return rng.choice(_SHOT_TYPES)
+    return rng.choices(_SHOT_TYPES, weights=weights, k=1)[0]
 
 
 def sample_rally_length(rng: SeededRNG, category: RallyLengthCategory) -> int:
@@ -41,11 +40,9 @@ def sample_rally_length(rng: SeededRNG, category: RallyLengthCategory) -> int:
 
 
 def sample_rally_category(rng: SeededRNG, weights: tuple[float, float, float]) -> RallyLengthCategory:
-    cats = [RallyLengthCategory.SHORT, RallyLengthCategory.MEDIUM, RallyLengthCategory.LONG]
-    total = sum(weights)
-    if total <= 0:
-        return rng.choice(cats)
-    return rng.choices(cats, weights=weights, k=1)[0]
+    if sum(weights) <= 0:
+        return rng.choice(_RALLY_CATEGORIES)
+    return rng.choices(_RALLY_CATEGORIES, weights=weights, k=1)[0]
 
 
 class PointSimulator:
@@ -24,7 +24,7 @@ class RallyLengthCategory(str, Enum):
     LONG = "long"        # 8+
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PointOutcome:
     """Who won and how (shot type)."""
     winner_id: str
@@ -42,7 +42,7 @@ def rally_category_from_length(length: int) -> RallyLengthCategory:
     return RallyLengthCategory.LONG
 
 
-@dataclass
+@dataclass(slots=True)
 class PointEvent:
     """
     Rich point event emitted after each simulated point.
@@ -69,7 +69,7 @@ class PointEvent:
     probabilities_snapshot: dict[str, Any] | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PointEventOutcome:
     """Who won and how, for PointEvent."""
     winner_id: str
@@ -77,7 +77,7 @@ class PointEventOutcome:
     shot_type: str
 
 
-@dataclass
+@dataclass(slots=True)
 class MatchSnapshot:
     """
     Partial-match snapshot at a point in time.
@@ -95,7 +95,7 @@ class MatchSnapshot:
     events_count: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class MatchConfig:
     """Configuration for a single match simulation."""
     match_id: str
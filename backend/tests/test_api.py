@@ -5,6 +5,7 @@ Requires: pip install httpx (for TestClient)
 """
 from __future__ import annotations
 
+import json
 from pathlib import Path
 from unittest.mock import patch
 
@@ -23,7 +24,7 @@ sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
 pytestmark = pytest.mark.skipif(not HAS_HTTPX, reason="httpx required for TestClient")
 
 from backend.api import app
-from backend.persistence.db import set_db_path, init_db
+from backend.persistence.db import close_shared, set_db_path, init_db
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
 
@@ -35,6 +36,7 @@ def isolated_db(tmp_path):
     set_db_path(db_path)
     init_db(db_path=db_path, rankings_path=PROJECT_ROOT / "data" / "rankings.json")
     yield db_path
+    close_shared()
 
 
 @pytest.fixture
@@ -42,6 +44,23 @@ def client():
     return TestClient(app)
 
 
+def test_lifespan_restores_backend_logging():
+    """The queued log handler is attached only while the app runs; propagate is restored on shutdown."""
+    import logging
+    import logging.handlers
+    backend_logger = logging.getLogger("backend")
+
+    def queue_handlers():
+        return [h for h in backend_logger.handlers if isinstance(h, logging.handlers.QueueHandler)]
+
+    propagate = backend_logger.propagate
+    with TestClient(app):
+        assert len(queue_handlers()) == 1
+        assert backend_logger.propagate is False
+    assert queue_handlers() == []
+    assert backend_logger.propagate is propagate
+
+
 def test_get_players(client):
     """GET /players returns list of players."""
     resp = client.get("/players")
@@ -128,6 +147,72 @@ def test_simulate_match(client):
     assert "fantasy_scores" in data
 
 
+def test_simulate_matches_bulk(client):
+    """POST /simulate/matches simulates and persists each pair in order."""
+    resp = client.get("/players?gender=men&limit=4")
+    ids = [p["id"] for p in resp.json()["players"][:4]]
+    t1 = client.post("/teams", json={"user_id": "u1", "name": "T1", "gender": "men", "player_ids": ids[:2]})
+    t2 = client.post("/teams", json={"user_id": "u2", "name": "T2", "gender": "men", "player_ids": ids[2:4]})
+    tid1, tid2 = t1.json()["id"], t2.json()["id"]
+    resp = client.post(
+        "/simulate/matches",
+        json={"pairs": [
+            {"team_a_id": tid1, "team_b_id": tid2, "seed": 7},
+            {"team_a_id": tid2, "team_b_id": tid1, "seed": 8, "best_of": 3},
+        ]},
+    )
+    assert resp.status_code == 200
+    matches = resp.json()["matches"]
+    assert [m["seed"] for m in matches] == [7, 8]
+    assert matches[0]["team_a_id"] == tid1
+    assert matches[1]["team_a_id"] == tid2
+    assert matches[1]["best_of"] == 3
+    for m in matches:
+        assert client.get(f"/matches/{m['id']}").status_code == 200
+
+
+def test_simulate_matches_commits_analytics_with_rows(client):
+    """Each match row is committed together with its analytics; player rows are read once per request."""
+    import backend.api as api_module
+
+    resp = client.get("/players?gender=men&limit=4")
+    ids = [p["id"] for p in resp.json()["players"][:4]]
+    t1 = client.post("/teams", json={"user_id": "u1", "name": "T1", "gender": "men", "player_ids": ids[:2]})
+    t2 = client.post("/teams", json={"user_id": "u2", "name": "T2", "gender": "men", "player_ids": ids[2:4]})
+    tid1, tid2 = t1.json()["id"], t2.json()["id"]
+    with patch.object(api_module, "get_players_by_ids", wraps=api_module.get_players_by_ids) as lookup:
+        resp = client.post(
+            "/simulate/matches",
+            json={"pairs": [
+                {"team_a_id": tid1, "team_b_id": tid2, "seed": 3},
+                {"team_a_id": tid2, "team_b_id": tid1, "seed": 4},
+            ]},
+        )
+    assert resp.status_code == 200
+    assert lookup.call_count == 1
+    for m in resp.json()["matches"]:
+        analysis = client.get(f"/analysis/match/{m['id']}").json()
+        assert analysis["fantasy_scores"] == m["fantasy_scores"]
+        assert analysis["player_a_name"] != m["player_a_id"]
+
+
+def test_simulate_matches_rejects_duplicates_and_reruns(client):
+    """A repeated (pair, seed) is a 400 before simulating; a seed already stored is a 409 that stores nothing."""
+    resp = client.get("/players?gender=men&limit=4")
+    ids = [p["id"] for p in resp.json()["players"][:4]]
+    t1 = client.post("/teams", json={"user_id": "u1", "name": "T1", "gender": "men", "player_ids": ids[:2]})
+    t2 = client.post("/teams", json={"user_id": "u2", "name": "T2", "gender": "men", "player_ids": ids[2:4]})
+    tid1, tid2 = t1.json()["id"], t2.json()["id"]
+    pair = {"team_a_id": tid1, "team_b_id": tid2, "seed": 5}
+    resp = client.post("/simulate/matches", json={"pairs": [pair, pair]})
+    assert resp.status_code == 400
+    assert client.post("/simulate/match", json=pair).status_code == 200
+    fresh = {"team_a_id": tid2, "team_b_id": tid1, "seed": 6}
+    resp = client.post("/simulate/matches", json={"pairs": [fresh, pair]})
+    assert resp.status_code == 409
+    assert client.post("/simulate/match", json=fresh).status_code == 200
+
+
 def test_get_match(client):
     """GET /matches/{id} returns persisted match (created via simulate)."""
     resp = client.get("/players?gender=women&limit=4")
@@ -143,6 +228,14 @@ def test_get_match(client):
     assert data["id"] == mid
     assert "events" in data
     assert len(data["events"]) > 0
+    from backend.persistence import MatchRepository, get_connection
+    conn = get_connection()
+    try:
+        stored = MatchRepository().get(conn, mid)
+    finally:
+        conn.close()
+    assert data["events"] == json.loads(stored.events_json)
+    assert data["created_at"] == stored.created_at.isoformat()
 
 
 def test_vertical_slice(client):
@@ -191,6 +284,262 @@ def test_get_analysis_match(client):
     assert "fantasy_scores" in data
 
 
+def test_list_recent_columns_matches_list_recent(client):
+    """MatchRepository.list_recent_columns / iter_recent return the same matches as list_recent."""
+    from backend.persistence import MatchRepository, get_connection
+    resp = client.get("/players?gender=men&limit=4")
+    ids = [p["id"] for p in resp.json()["players"][:4]]
+    t1 = client.post("/teams", json={"user_id": "u1", "name": "T1", "gender": "men", "player_ids": [ids[0], ids[1]]})
+    t2 = client.post("/teams", json={"user_id": "u2", "name": "T2", "gender": "men", "player_ids": [ids[2], ids[3]]})
+    for seed in (1, 2, 3):
+        r = client.post("/simulate/match", json={"team_a_id": t1.json()["id"], "team_b_id": t2.json()["id"], "seed": seed})
+        assert r.status_code == 200
+    repo = MatchRepository()
+    conn = get_connection()
+    try:
+        matches = repo.list_recent(conn, limit=2)
+        cols = repo.list_recent_columns(conn, limit=2)
+        assert list(repo.iter_recent(conn, limit=2)) == matches
+        conn.execute("DELETE FROM matches")
+        empty = repo.list_recent_columns(conn)
+    finally:
+        conn.close()
+    assert list(cols["id"]) == [m.id for m in matches]
+    assert list(cols["winner_id"]) == [m.winner_id for m in matches]
+    assert list(cols["created_at"]) == [m.created_at for m in matches]
+    assert empty["id"] == ()
+
+
+def test_list_recent_walks_created_at_index():
+    """Recent-match queries read ix_matches_created_at backwards instead of sorting the table."""
+    from backend.persistence import MatchRepository, get_connection
+    conn = get_connection()
+    try:
+        for sql in (MatchRepository._LIST_RECENT_SQL, MatchRepository._LIST_RECENT_COLUMNS_SQL):
+            plan = " ".join(r[3] for r in conn.execute("EXPLAIN QUERY PLAN " + sql, (10,)))
+            assert "USING INDEX ix_matches_created_at" in plan
+            assert "TEMP B-TREE" not in plan
+    finally:
+        conn.close()
+
+
+def test_most_recent_for_player_seeks_both_player_indexes():
+    """get_most_recent_for_player seeks each player index once and returns the newer match from either side."""
+    from backend.persistence import MatchRepository, get_connection
+    repo = MatchRepository()
+    conn = get_connection()
+    try:
+        plan = " ".join(
+            r[3] for r in conn.execute("EXPLAIN QUERY PLAN " + repo._MOST_RECENT_FOR_PLAYER_SQL, ("p", "p"))
+        )
+        assert "USING INDEX ix_matches_player_a_created" in plan
+        assert "USING INDEX ix_matches_player_b_created" in plan
+        base = {"team_a_id": "ta", "team_b_id": "tb", "winner_id": "w", "sets_a": 3, "sets_b": 0, "best_of": 5, "seed": 1}
+        older = repo.create(conn, player_a_id="recent-p", player_b_id="x", **base)
+        newer = repo.create(conn, player_a_id="y", player_b_id="recent-p", **base)
+        assert older.created_at < newer.created_at
+        assert repo.get_most_recent_for_player(conn, "recent-p") == newer
+        assert repo.get_most_recent_for_player(conn, "x") == older
+        assert repo.get_most_recent_for_player(conn, "nobody") is None
+        conn.rollback()
+    finally:
+        conn.close()
+
+
+def test_team_get_with_players_matches_separate_reads(client):
+    """TeamRepository.get_with_players returns the same team and ordered players as get + get_players."""
+    from backend.persistence import TeamRepository, get_connection
+    resp = client.get("/players?gender=men&limit=3")
+    ids = [p["id"] for p in resp.json()["players"][:3]]
+    tid = client.post("/teams", json={"user_id": "u1", "name": "T1", "gender": "men", "player_ids": ids}).json()["id"]
+    repo = TeamRepository()
+    conn = get_connection()
+    try:
+        team, players = repo.get_with_players(conn, tid)
+        assert team == repo.get(conn, tid)
+        assert players == repo.get_players(conn, tid) == ids
+        assert repo.get_with_players(conn, "missing") is None
+    finally:
+        conn.close()
+
+
+def test_team_create_leaves_commit_to_caller(client):
+    """TeamRepository.create does not commit: rolling back the caller's transaction drops team and roster."""
+    from backend.persistence import TeamRepository, get_connection
+    resp = client.get("/players?gender=men&limit=2")
+    ids = [p["id"] for p in resp.json()["players"][:2]]
+    repo = TeamRepository()
+    conn = get_connection()
+    try:
+        team = repo.create(conn, "u-tx", "Rolled back", "men", ids)
+        assert conn.in_transaction
+        conn.rollback()
+        assert repo.get(conn, team.id) is None
+        assert repo.get_players(conn, team.id) == []
+    finally:
+        conn.close()
+
+
+def test_write_transaction_begins_immediate_and_rolls_back(client):
+    """write_transaction opens BEGIN IMMEDIATE, commits once, rolls back on error, and joins an open transaction."""
+    from backend.persistence import TeamRepository, get_connection, write_transaction
+    resp = client.get("/players?gender=men&limit=2")
+    ids = [p["id"] for p in resp.json()["players"][:2]]
+    repo = TeamRepository()
+    conn = get_connection()
+    statements: list[str] = []
+    conn.set_trace_callback(statements.append)
+    try:
+        with write_transaction(conn):
+            kept = repo.create(conn, "u-wtx", "Kept", "men", ids)
+        assert statements[0] == "BEGIN IMMEDIATE"
+        assert not conn.in_transaction
+        try:
+            with write_transaction(conn):
+                dropped = repo.create(conn, "u-wtx", "Dropped", "men", ids)
+                raise RuntimeError("boom")
+        except RuntimeError:
+            pass
+        assert repo.get(conn, kept.id) is not None
+        assert repo.get(conn, dropped.id) is None
+        conn.execute("UPDATE teams SET name = 'Outer' WHERE id = ?", (kept.id,))
+        with write_transaction(conn):
+            repo.create(conn, "u-wtx", "Joined", "men", ids)
+        assert conn.in_transaction
+        conn.rollback()
+        assert repo.get(conn, kept.id).name == "Kept"
+    finally:
+        conn.set_trace_callback(None)
+        conn.close()
+
+
+def test_connections_use_wal_and_normal_sync(client):
+    """get_connection applies configure_connection: WAL journal, synchronous=NORMAL, in-memory temp store."""
+    from backend.persistence import get_connection
+    conn = get_connection()
+    try:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+        assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2  # MEMORY
+        assert conn.execute("PRAGMA cache_size").fetchone()[0] == -64000
+    finally:
+        conn.close()
+
+
+def test_team_match_create_get_round_trip():
+    """TeamMatchRepository.get (row factory) returns exactly what create returned."""
+    from backend.persistence import TeamMatchRepository, get_connection
+    repo = TeamMatchRepository()
+    conn = get_connection()
+    try:
+        created = repo.create(conn, "ta", "tb", 101.5, 99.0, "cap-a", None)
+        assert repo.get(conn, created.id) == created
+        assert repo.get(conn, "missing") is None
+        conn.rollback()
+    finally:
+        conn.close()
+
+
+def test_repositories_parse_created_at_on_plain_connection(isolated_db):
+    """created_at is a datetime on any connection, not only get_connection's; legacy "Z" rows parse too."""
+    import sqlite3
+    from datetime import datetime
+    from backend.persistence import MatchRepository, TeamMatchRepository, TeamRepository, UserRepository
+    conn = sqlite3.connect(str(isolated_db))
+    try:
+        user = UserRepository().create(conn, "Plain", id="u-plain")
+        team = TeamRepository().create(conn, user.id, "T", "men", [])
+        tm = TeamMatchRepository().create(conn, "ta", "tb", 1.0, 2.0, None, None)
+        match = MatchRepository().create(conn, "ta", "tb", "pa", "pb", "pa", 3, 1, 5, 1)
+        assert UserRepository().get(conn, user.id) == user
+        assert TeamRepository().get(conn, team.id) == team
+        assert TeamMatchRepository().get(conn, tm.id) == tm
+        assert MatchRepository().get(conn, match.id) == match
+        conn.execute("UPDATE users SET created_at = '2024-01-02T03:04:05Z' WHERE id = ?", (user.id,))
+        created = UserRepository().get(conn, user.id).created_at
+        assert isinstance(created, datetime) and created.year == 2024
+        conn.rollback()
+    finally:
+        conn.close()
+
+
+def test_user_create_returns_stored_row():
+    """UserRepository.create* build the returned User without re-reading it, and it matches the stored row."""
+    from backend.persistence import UserRepository, get_connection
+    repo = UserRepository()
+    conn = get_connection()
+    try:
+        with conn:
+            plain = repo.create(conn, "Plain", id="u-plain")
+            authed = repo.create_with_password(conn, "alice", "hash", name="Alice")
+        assert repo.get(conn, plain.id) == plain
+        assert repo.get(conn, authed.id) == authed
+    finally:
+        conn.close()
+
+
+def test_match_bulk_create_round_trip():
+    """MatchRepository.bulk_create stores every item and returns what get() reads back."""
+    from backend.persistence import MatchRepository, get_connection
+    repo = MatchRepository()
+    base = {"team_a_id": "ta", "team_b_id": "tb", "player_a_id": "pa", "player_b_id": "pb",
+            "winner_id": "pa", "sets_a": 3, "sets_b": 1, "best_of": 5}
+    conn = get_connection()
+    try:
+        with conn:
+            created = repo.bulk_create(conn, [
+                {**base, "seed": 1, "id": "bulk-1", "events_json": "[]"},
+                {**base, "seed": 2, "events_blob": b"\x01"},
+            ])
+        assert created[0].id == "bulk-1"
+        assert [repo.get(conn, m.id) for m in created] == created
+        assert repo.bulk_create(conn, []) == []
+    finally:
+        conn.close()
+
+
+def test_get_analysis_match_stored_equals_recomputed(client, isolated_db):
+    """Analytics stored at simulate time match the legacy recompute-from-events path."""
+    import sqlite3
+
+    resp = client.get("/players?gender=men&limit=4")
+    ids = [p["id"] for p in resp.json()["players"][:4]]
+    t1 = client.post("/teams", json={"user_id": "u1", "name": "T1", "gender": "men", "player_ids": [ids[0], ids[1]]})
+    t2 = client.post("/teams", json={"user_id": "u2", "name": "T2", "gender": "men", "player_ids": [ids[2], ids[3]]})
+    sim = client.post("/simulate/match", json={"team_a_id": t1.json()["id"], "team_b_id": t2.json()["id"], "seed": 78})
+    mid = sim.json()["id"]
+    stored = client.get(f"/analysis/match/{mid}").json()
+    assert stored["fantasy_scores"] == sim.json()["fantasy_scores"]
+    conn = sqlite3.connect(str(isolated_db))
+    conn.execute("UPDATE matches SET analytics_json = NULL WHERE id = ?", (mid,))
+    conn.commit()
+    conn.close()
+    recomputed = client.get(f"/analysis/match/{mid}").json()
+    assert stored == recomputed
+
+
+def test_explain_analytics_read_from_stored_row(client):
+    """Explanations use the stored analytics (minus display names), decoded fresh for every caller."""
+    from backend.explanation.retrieval import build_match_analytics, load_match, load_match_analytics
+    from backend.persistence import get_connection
+
+    resp = client.get("/players?gender=men&limit=4")
+    ids = [p["id"] for p in resp.json()["players"][:4]]
+    t1 = client.post("/teams", json={"user_id": "u1", "name": "T1", "gender": "men", "player_ids": [ids[0], ids[1]]})
+    t2 = client.post("/teams", json={"user_id": "u2", "name": "T2", "gender": "men", "player_ids": [ids[2], ids[3]]})
+    sim = client.post("/simulate/match", json={"team_a_id": t1.json()["id"], "team_b_id": t2.json()["id"], "seed": 79})
+    conn = get_connection()
+    try:
+        match = load_match(conn, sim.json()["id"])
+        first = load_match_analytics(conn, match)
+        second = load_match_analytics(conn, match)
+        assert first is not second
+        assert "player_a_name" not in first
+        assert first == json.loads(json.dumps(build_match_analytics(match)))
+    finally:
+        conn.close()
+
+
 def test_get_analysis_match_not_found(client):
     """GET /analysis/match/{id} returns 404 for unknown match."""
     resp = client.get("/analysis/match/nonexistent-match-id")
@@ -212,8 +561,11 @@ def test_explain_match_stub_when_no_api_key(client):
     sim = client.post("/simulate/match", json={"team_a_id": t1.json()["id"], "team_b_id": t2.json()["id"], "seed": 1})
     assert sim.status_code == 200
     mid = sim.json()["id"]
-    with patch.dict("os.environ", {}, clear=True):
+    with patch.dict("os.environ", {}, clear=True), patch(
+        "backend.explanation.orchestration.build_prompt"
+    ) as mock_build:
         resp = client.post("/explain/match", json={"match_id": mid})
+    mock_build.assert_not_called()
     assert resp.status_code == 200
     data = resp.json()
     assert "explanation_text" in data
@@ -221,6 +573,139 @@ def test_explain_match_stub_when_no_api_key(client):
     assert "OPENAI_API_KEY" in data["explanation_text"] or "Stub" in str(data.get("supporting_facts", []))
 
 
+def test_init_db_records_migration_rev(isolated_db):
+    """init_db stores SCHEMA_VERSION/MIGRATION_REV and a second run on the same DB is a no-op for the schema."""
+    import sqlite3
+    from backend.persistence.db import MIGRATION_REV, SCHEMA_VERSION
+    init_db(db_path=isolated_db)
+    conn = sqlite3.connect(isolated_db)
+    try:
+        assert conn.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
+        row = conn.execute("SELECT value FROM meta WHERE key = 'migration_rev'").fetchone()
+        assert row == (MIGRATION_REV,)
+        cols = [r[1] for r in conn.execute("PRAGMA table_info(matches)")]
+        assert "events_blob" in cols
+    finally:
+        conn.close()
+
+
+def test_interrupted_salary_backfill_resumes(tmp_path, monkeypatch):
+    """A salary backfill cut off after the migration commit is finished by the next init_db."""
+    import sqlite3
+    from backend.persistence import db as db_module
+    from backend.rankings_db import _players_schema
+
+    path = tmp_path / "legacy.db"
+    conn = sqlite3.connect(path)
+    conn.executescript(_players_schema().replace("salary INTEGER NOT NULL DEFAULT 100,", ""))
+    conn.executemany(
+        "INSERT INTO players VALUES (?, ?, 'X', 'men', ?, 1000, 1.0, 0.3, 0.4, 0.3, 0.4, 0.3, 0.3, 1.0, 0.0, 1.0)",
+        [("p1", "P1", 1), ("p2", "P2", 40)],
+    )
+    conn.commit()
+    conn.close()
+
+    def interrupted(conn):
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(db_module, "_backfill_player_salaries", interrupted)
+    with pytest.raises(KeyboardInterrupt):
+        init_db(db_path=path)
+    monkeypatch.undo()
+    init_db(db_path=path)
+    conn = sqlite3.connect(path)
+    try:
+        assert dict(conn.execute("SELECT id, salary FROM players")) == {"p1": 120, "p2": 81}
+        assert conn.execute("SELECT 1 FROM meta WHERE key = 'salary_backfill_pending'").fetchone() is None
+    finally:
+        conn.close()
+
+
+def test_fresh_db_schema_matches_migrated(tmp_path):
+    """An empty DB created in one pass ends with the same columns and indexes as one run through the ALTER chain."""
+    import sqlite3
+
+    def describe(path):
+        conn = sqlite3.connect(path)
+        try:
+            tables = [r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table' AND name != 'legacy'")]
+            cols = {t: sorted(tuple(r[1:]) for r in conn.execute(f"PRAGMA table_info({t})")) for t in tables}
+            indexes = {r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index' AND sql IS NOT NULL")}
+            return cols, indexes
+        finally:
+            conn.close()
+
+    fresh = tmp_path / "fresh.db"
+    init_db(db_path=fresh)
+    migrated = tmp_path / "migrated.db"
+    conn = sqlite3.connect(migrated)
+    conn.execute("CREATE TABLE legacy (x)")  # non-empty DB: takes the probe/ALTER path
+    conn.commit()
+    conn.close()
+    init_db(db_path=migrated)
+    assert describe(fresh) == describe(migrated)
+
+
+def test_shared_connection_reused_per_thread(isolated_db, tmp_path):
+    """get_shared_connection reuses one connection per thread and reopens when the DB path changes."""
+    from backend.persistence import get_shared_connection
+    conn = get_shared_connection()
+    assert get_shared_connection() is conn
+    other = tmp_path / "other.db"
+    init_db(db_path=other)
+    set_db_path(other)
+    try:
+        assert get_shared_connection() is not conn
+    finally:
+        set_db_path(isolated_db)
+
+
+def test_shared_connection_reopened_after_close_shared_on_reused_thread(isolated_db):
+    """A long-lived worker thread gets a fresh connection after close_shared(), not its closed one."""
+    from concurrent.futures import ThreadPoolExecutor
+    from backend.persistence import get_shared_connection
+
+    def count_players():
+        return get_shared_connection().execute("SELECT COUNT(*) FROM players").fetchone()[0]
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        before = pool.submit(count_players).result()
+        close_shared()
+        assert pool.submit(count_players).result() == before
+
+
+def test_ro_connection_rejects_writes(isolated_db):
+    """get_ro_connection reads the same DB but cannot write to it."""
+    import sqlite3
+    from backend.persistence import get_ro_connection
+    conn = get_ro_connection(isolated_db)
+    try:
+        assert conn.execute("SELECT COUNT(*) FROM players").fetchone()[0] > 0
+        with pytest.raises(sqlite3.OperationalError):
+            conn.execute("DELETE FROM players")
+    finally:
+        conn.close()
+
+
+def test_build_prompt_trims_oversized_analytics():
+    """build_prompt replaces match_analytics with a short digest when context exceeds the budget."""
+    from backend.explanation.prompt import build_prompt
+    from backend.explanation.schemas import ContextBundle
+    analytics = {
+        "outcome": {"winner_id": "p1", "sets_a": 3, "sets_b": 1, "best_of": 5},
+        "fantasy_scores": {"p1": 42.5, "p2": 10.0},
+        "total_points_played": 80,
+        "padding": ["x" * 100] * 400,
+    }
+    bundle = ContextBundle(match_summary={"id": "m1"}, match_analytics=analytics)
+    content = build_prompt(bundle, None)[1]["content"]
+    assert "trimmed to fit context budget" in content
+    assert "Winner p1 won 3-1" in content
+    assert "padding" not in content
+    small = ContextBundle(match_summary={"id": "m1"}, match_analytics={"outcome": {}})
+    assert "trimmed" not in build_prompt(small, None)[1]["content"]
+
+
 def test_explain_match_success(client):
     """POST /explain/match returns explanation_text and supporting_facts when LLM is mocked."""
     resp = client.get("/players?gender=men&limit=4")
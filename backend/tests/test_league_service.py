@@ -157,3 +157,103 @@ def test_assert_can_simulate_raises_when_not_active(db_conn, league_service, lea
     league_service.transition_league_status(db_conn, league.id, LeagueStatus.LOCKED)
     league_service.transition_league_status(db_conn, league.id, LeagueStatus.ACTIVE)
     league_service.assert_can_simulate(db_conn, league.id)
+
+
+def test_list_methods_match_single_gets(db_conn, league_and_season):
+    """Positional list_* construction yields the same objects as the keyed single-row getters."""
+    from backend.persistence.repositories import LeagueMatchRepository
+    league, season = league_and_season
+    league_repo, week_repo, lm_repo = LeagueRepository(), WeekRepository(), LeagueMatchRepository()
+    league_repo.update_started_at(db_conn, league.id, "2025-01-01T00:00:00")
+    week = week_repo.create(db_conn, season.id, 1)
+    week_repo.create(db_conn, season.id, 2)
+    lm_repo.create(db_conn, week.id, "team-h", "team-a")
+    lm_repo.create(db_conn, week.id, "team-b", None)
+    assert league_repo.list_all(db_conn) == [league_repo.get(db_conn, league.id)]
+    assert league_repo.list_all(db_conn)[0].started_at is not None
+    weeks = week_repo.list_by_season(db_conn, season.id)
+    assert [w.week_number for w in weeks] == [1, 2]
+    assert weeks == [week_repo.get(db_conn, w.id) for w in weeks]
+    fixtures = lm_repo.list_by_week(db_conn, week.id)
+    assert len(fixtures) == 2
+    assert fixtures == [lm_repo.get(db_conn, m.id) for m in fixtures]
+    assert fixtures[0].status is fixtures[1].status  # interned
+    assert lm_repo.list_by_week_ids(db_conn, [w.id for w in weeks]) == {
+        w.id: lm_repo.list_by_week(db_conn, w.id) for w in weeks
+    }
+    assert lm_repo.list_by_week_ids(db_conn, []) == {}
+    assert list(lm_repo.iter_by_season(db_conn, season.id)) == [
+        m for w in weeks for m in lm_repo.list_by_week(db_conn, w.id)
+    ]
+    assert lm_repo.list_by_week_for_dispatch(db_conn, week.id) == [
+        (m.id, m.home_team_id, m.away_team_id, m.status) for m in fixtures
+    ]
+
+
+def test_league_match_going_live_stamps_started_at(db_conn, league_and_season):
+    """update_status('live') sets started_at in the same write; other statuses leave it alone."""
+    from backend.persistence.repositories import LeagueMatchRepository
+    _, season = league_and_season
+    lm_repo = LeagueMatchRepository()
+    week = WeekRepository().create(db_conn, season.id, 1)
+    match = lm_repo.create(db_conn, week.id, "team-h", "team-a")
+
+    def started():
+        return db_conn.execute(
+            "SELECT status, started_at FROM league_matches WHERE id = ?", (match.id,)
+        ).fetchone()
+
+    assert tuple(started()) == ("scheduled", None)
+    lm_repo.update_status(db_conn, match.id, "live")
+    status, started_at = started()
+    assert status == "live" and started_at is not None
+    lm_repo.update_status(db_conn, match.id, "completed")
+    assert tuple(started()) == ("completed", started_at)
+
+
+def test_league_match_bulk_create_matches_stored_rows(db_conn, league_and_season):
+    """LeagueMatchRepository.bulk_create returns exactly the scheduled rows it stored."""
+    from backend.persistence.repositories import LeagueMatchRepository
+    _, season = league_and_season
+    lm_repo = LeagueMatchRepository()
+    week = WeekRepository().create(db_conn, season.id, 1)
+    created = lm_repo.bulk_create(db_conn, [(week.id, "team-h", "team-a"), (week.id, "team-b", None)])
+    assert [lm_repo.get(db_conn, m.id) for m in created] == created
+    assert sorted(created, key=lambda m: m.id) == lm_repo.list_by_week(db_conn, week.id)
+    assert created[1].away_team_id is None and created[1].status == "scheduled"
+
+
+def test_week_bulk_create_matches_stored_rows(db_conn, league_and_season):
+    """WeekRepository.bulk_create returns the pending weeks it stored, in week_number order."""
+    _, season = league_and_season
+    week_repo = WeekRepository()
+    created = week_repo.bulk_create(db_conn, season.id, range(1, 4))
+    assert [w.week_number for w in created] == [1, 2, 3]
+    assert week_repo.list_by_season(db_conn, season.id) == created
+
+
+def test_fast_forward_simulates_outside_write_transaction(db_conn, league_service, league_and_season, monkeypatch):
+    """Fixtures are simulated before the write lock is taken; results and the week advance commit together."""
+    import backend.services.league_service as league_service_module
+    from backend.persistence.repositories import LeagueMatchRepository
+    league, season = league_and_season
+    week = WeekRepository().create(db_conn, season.id, 1)
+    lm_repo = LeagueMatchRepository()
+    played, bye = lm_repo.bulk_create(db_conn, [(week.id, "team-h", "team-a"), (week.id, "team-x", None)])
+    LeagueRepository().update_status(db_conn, league.id, LeagueStatus.ACTIVE)
+    db_conn.commit()
+    in_transaction = []
+
+    def fake_simulation(conn, home, away, seed=None, best_of=5):
+        in_transaction.append(conn.in_transaction)
+        return {"home_score": 12.5, "away_score": 7.0, "explanation": "sim"}
+
+    monkeypatch.setattr(league_service_module, "run_team_match_simulation", fake_simulation)
+    league_service.fast_forward_week(db_conn, league.id, seed=1)
+    assert in_transaction == [False]
+    assert not db_conn.in_transaction
+    stored = lm_repo.get(db_conn, played.id)
+    assert (stored.home_score, stored.away_score, stored.status) == (12.5, 7.0, "completed")
+    assert lm_repo.get(db_conn, bye.id).status == "completed"
+    assert WeekRepository().get(db_conn, week.id).status == "completed"
+    assert SeasonRepository().get(db_conn, season.id).current_week == 2
@@ -240,3 +240,70 @@ class TestRunLiveMatch:
         conn = sqlite3.connect(str(db_path))
         assert len(list_players_by_gender(conn, "women")) == 2
         conn.close()
+
+    def test_cumulative_scores_from_highlights(self):
+        from backend.live_match_engine import _cumulative_scores_from_highlights
+        highlights = [
+            {"points_home": 10.25, "points_away": 3},
+            {"points_home": 0.1, "points_away": 4.44},
+            {"points_away": 1},
+        ]
+        home, away = _cumulative_scores_from_highlights(highlights)
+        assert home == [10.2, 10.3, 10.3]
+        assert away == [3.0, 7.4, 8.4]
+        assert _cumulative_scores_from_highlights([]) == ([], [])
+
+    @pytest.mark.parametrize("use_coroutine", [True, False])
+    def test_live_ticks_fire_in_order(self, monkeypatch, use_coroutine):
+        import asyncio
+        from types import SimpleNamespace
+        import backend.live_match_engine as engine
+
+        highlights = [{"points_home": 1.0, "points_away": 2.0} for _ in range(3)]
+        monkeypatch.setattr(engine, "SECONDS_PER_GAME", 0.01)
+        monkeypatch.setattr(
+            engine, "_LM_REPO",
+            SimpleNamespace(get=lambda conn, mid: SimpleNamespace(home_team_id="h", away_team_id="a")),
+        )
+        monkeypatch.setattr(
+            engine, "run_team_match_simulation",
+            lambda conn, h, a, seed=None, best_of=5: {"home_score": 3.0, "away_score": 6.0, "highlights": highlights},
+        )
+        ticks = []
+        if use_coroutine:
+            async def on_tick(elapsed, home, away, hl, done):
+                ticks.append((home, away, len(hl), done))
+        else:
+            def on_tick(elapsed, home, away, hl, done):
+                ticks.append((home, away, len(hl), done))
+
+        result = asyncio.run(engine.run_live_league_match_with_delays(lambda: None, "lm-1", on_tick_async=on_tick))
+        assert result["home_score"] == 3.0
+        assert ticks == [(1.0, 2.0, 1, False), (2.0, 4.0, 2, False), (3.0, 6.0, 3, True)]
+
+    def test_slow_coroutine_ticks_do_not_overlap(self, monkeypatch):
+        """A tick callback slower than SECONDS_PER_GAME still delivers ticks one at a time, in order."""
+        import asyncio
+        from types import SimpleNamespace
+        import backend.live_match_engine as engine
+
+        highlights = [{"points_home": 1.0, "points_away": 2.0} for _ in range(3)]
+        monkeypatch.setattr(engine, "SECONDS_PER_GAME", 0.01)
+        monkeypatch.setattr(
+            engine, "_LM_REPO",
+            SimpleNamespace(get=lambda conn, mid: SimpleNamespace(home_team_id="h", away_team_id="a")),
+        )
+        monkeypatch.setattr(
+            engine, "run_team_match_simulation",
+            lambda conn, h, a, seed=None, best_of=5: {"home_score": 3.0, "away_score": 6.0, "highlights": highlights},
+        )
+        events = []
+
+        async def on_tick(elapsed, home, away, hl, done):
+            events.append(("start", len(hl)))
+            # Early ticks are the slow ones, so without chaining the done tick would finish first
+            await asyncio.sleep(0.05 if not done else 0)
+            events.append(("end", len(hl)))
+
+        asyncio.run(engine.run_live_league_match_with_delays(lambda: None, "lm-1", on_tick_async=on_tick))
+        assert events == [("start", 1), ("end", 1), ("start", 2), ("end", 2), ("start", 3), ("end", 3)]
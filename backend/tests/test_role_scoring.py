@@ -361,3 +361,15 @@ def test_highlights_include_role_log_when_present(db_with_teams):
     for h in result["highlights"]:
         assert "role_log" in h
         assert isinstance(h["role_log"], list)
+
+
+def test_active_roster_and_captain_matches_separate_helpers(db_with_teams):
+    """get_active_roster_and_captain returns what the three single-purpose roster helpers return."""
+    conn, _, _, player_ids = db_with_teams
+    team_repo = TeamRepository()
+    roster = _make_roster(player_ids[:10], captain_index=2, role_per_slot={1: "anchor", 4: "closer"})
+    team = team_repo.create_phase2(conn, "user-1", "Combined", "men", budget=100, roster=roster)
+    active, captain = team_repo.get_active_roster_and_captain(conn, team.id)
+    assert active == team_repo.get_active_roster_with_roles(conn, team.id)
+    assert [pid for pid, _ in active] == team_repo.get_active_player_ids(conn, team.id)
+    assert captain == team_repo.get_captain_id(conn, team.id) == player_ids[2]
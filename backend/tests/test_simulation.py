@@ -32,7 +32,9 @@ from simulation.probability_engine import ProbabilityEngine, MatchContext, Outco
 from simulation.point_simulator import PointSimulator, sample_shot_type, sample_rally_category
 from simulation.orchestrator import MatchOrchestrator, set_won, sets_to_win_match
 from simulation.emitter import EmitterConfig, SyncEmitter, snapshot_from_events
-from simulation.persistence import save_replay, load_events, event_to_dict, summarize_match, ReplayMetadata
+from simulation.persistence import (
+    save_replay, load_events, event_to_dict, events_to_blob, events_from_blob, summarize_match, ReplayMetadata,
+)
 
 
 # ---- Schemas ----
@@ -345,6 +347,23 @@ class TestPersistence:
         assert d["match_id"] == "m"
         assert d["outcome"]["winner_id"] == "a"
 
+    def test_events_blob_round_trip(self):
+        store, config = _store_and_config()
+        events = list(MatchOrchestrator(config, store).run())
+        blob = events_to_blob(events, "alice")
+        assert len(blob) == 5 * len(events)
+        last = events[-1]
+        decoded = events_from_blob(blob, "alice", "bob", last.set_scores_after[:2])
+        assert len(decoded) == len(events)
+        for e, d in zip(events, decoded):
+            assert d["server_id"] == e.server_id
+            assert d["outcome"]["winner_id"] == e.outcome.winner_id
+            assert d["outcome"]["shot_type"] == e.outcome.shot_type
+            assert d["set_index"] == e.set_index
+            assert d["rally_length"] == e.rally_length
+            assert d["streak_broken"] == e.streak_broken
+        assert decoded[-1]["set_scores_after"] == list(last.set_scores_after[:2])
+
     def test_summarize_match(self):
         store, config = _store_and_config()
         orch = MatchOrchestrator(config, store)
@@ -14,7 +14,7 @@ from pathlib import Path
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
-from backend.persistence import init_db, get_connection, UserRepository, TeamRepository, MatchRepository
+from backend.persistence import init_db, get_connection, write_transaction, UserRepository, TeamRepository, MatchRepository
 from backend.persistence.db import get_db_path, set_db_path
 from backend.rankings_db import list_players_by_gender, build_profile_store_for_match
 from backend.scoring import aggregate_stats_from_events, compute_fantasy_score
@@ -39,14 +39,16 @@ def main() -> None:
         user_id = "vertical-slice-user"
         user = user_repo.get(conn, user_id)
         if user is None:
-            user = user_repo.create(conn, name="Slice Demo User", id=user_id)
+            with write_transaction(conn):
+                user = user_repo.create(conn, name="Slice Demo User", id=user_id)
             print(f"Created user: {user.id}")
 
         # 2. Create two teams
         players_men = list_players_by_gender(conn, "men", limit=10)
         player_ids = [p.id for p in players_men[:6]]
-        team_a = team_repo.create(conn, user_id, "Champions", "men", player_ids[:3])
-        team_b = team_repo.create(conn, user_id, "Underdogs", "men", player_ids[3:6])
+        with write_transaction(conn):
+            team_a = team_repo.create(conn, user_id, "Champions", "men", player_ids[:3])
+            team_b = team_repo.create(conn, user_id, "Underdogs", "men", player_ids[3:6])
         print(f"Created team A: {team_a.name} (id={team_a.id})")
         print(f"Created team B: {team_b.name} (id={team_b.id})")
 
@@ -76,20 +78,21 @@ def main() -> None:
         # Serialize events for storage (contract: simulation.persistence.event_to_dict)
         events_json = json.dumps([event_to_dict(e) for e in events])
 
-        match = match_repo.create(
-            conn,
-            team_a_id=team_a.id,
-            team_b_id=team_b.id,
-            player_a_id=player_a_id,
-            player_b_id=player_b_id,
-            winner_id=winner_id,
-            sets_a=sets_a,
-            sets_b=sets_b,
-            best_of=best_of,
-            seed=seed,
-            events_json=events_json,
-            id=match_id,
-        )
+        with write_transaction(conn):
+            match = match_repo.create(
+                conn,
+                team_a_id=team_a.id,
+                team_b_id=team_b.id,
+                player_a_id=player_a_id,
+                player_b_id=player_b_id,
+                winner_id=winner_id,
+                sets_a=sets_a,
+                sets_b=sets_b,
+                best_of=best_of,
+                seed=seed,
+                events_json=events_json,
+                id=match_id,
+            )
         print(f"Simulated and persisted match: {match.id}")
         print(f"  Result: {sets_a}-{sets_b} (winner: {winner_id})")
 